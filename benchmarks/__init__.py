@@ -0,0 +1,5 @@
+"""Performance benchmarks of the operations and models.
+
+Run them from the root of the repository, since the models are read from input_fms, e.g.:
+    python -m benchmarks.benchmark_pysat_backbone
+"""
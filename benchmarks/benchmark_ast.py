@@ -0,0 +1,60 @@
+import sys
+import time
+import tracemalloc
+
+from pysat.formula import IDPool
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+CNF_FMS = [INPUT_FMS + 'jHipster.xml', INPUT_FMS + 'WeaFQAs.xml']
+
+
+def nof_nodes(roots: list) -> tuple[int, int]:
+    """Number of nodes of the ASTs as trees, and number of distinct (shared) nodes."""
+    tree_nodes = 0
+    distinct = set()
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        tree_nodes += 1
+        distinct.add(id(node))
+        stack.extend(node.children)
+    return tree_nodes, len(distinct)
+
+
+def benchmark_constraints(path: str) -> None:
+    tracemalloc.start()
+    start_time = time.time()
+    fm = FeatureIDEParser(path).transform()
+    parse_time = time.time() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    tree_nodes, distinct = nof_nodes([ctc.ast.root for ctc in fm.ctcs])
+    print(f'{path}: #CTCs: {len(fm.ctcs)}, parse: {parse_time:.3f}s, peak memory: {peak / 2**20:.1f} MiB')
+    print(f'  #Nodes as trees: {tree_nodes}, #Distinct nodes: {distinct}')
+    variables = {feature.name: i for i, feature in enumerate(fm.get_features(), 1)}
+    vpool = IDPool(start_from=len(variables) + 1)
+    start_time = time.time()
+    nof_clauses = sum(len(ctc.ast.get_tseitin_clauses(variables, vpool.id)) for ctc in fm.ctcs)
+    print(f'  Tseitin: {time.time() - start_time:.3f}s, #Clauses: {nof_clauses}')
+
+
+def benchmark_cnf(path: str) -> None:
+    fm = FeatureIDEParser(path).transform()
+    for run in ('first', 'memoized'):
+        start_time = time.time()
+        nof_clauses = sum(len(ctc.ast.get_clauses()) for ctc in fm.ctcs)
+        print(f'{path}: CNF ({run}): {time.time() - start_time:.4f}s, #Clauses: {nof_clauses}')
+
+
+def main(path: str):
+    benchmark_constraints(path)
+    for cnf_path in CNF_FMS:
+        benchmark_cnf(cnf_path)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else LINUX_FM)
@@ -0,0 +1,61 @@
+import time
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations import (
+    BDDFeatureInclusionProbability,
+    BDDProductDistribution,
+    BDDProductsNumber,
+    BDDSampling
+)
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+SAMPLE_SIZE = 10000
+
+
+def timed(function) -> float:
+    start_time = time.time()
+    function()
+    return time.time() - start_time
+
+
+def benchmark(path: str) -> None:
+    fm = FeatureIDEParser(path).transform()
+    print(f'{path}: #Features: {len(fm.get_features())}')
+    times = {}
+    for backend in BDDModel.available_backends():
+        bdd_model = None
+
+        def compile_bdd():
+            nonlocal bdd_model
+            bdd_model = FmToBDD(fm, backend=backend).transform()
+
+        times[backend] = {
+            'compile': timed(compile_bdd),
+            'count': timed(lambda: BDDProductsNumber().execute(bdd_model)),
+            'FIP': timed(lambda: BDDFeatureInclusionProbability().execute(bdd_model)),
+            'PD': timed(lambda: BDDProductDistribution().execute(bdd_model)),
+            'sampling': timed(lambda: BDDSampling(SAMPLE_SIZE, with_replacement=True).execute(bdd_model)),
+        }
+        print(f'  {backend}: #Nodes: {len(bdd_model.root)}, '
+              + ', '.join(f'{name}: {t:.3f}s' for name, t in times[backend].items()))
+    if 'cudd' in times:
+        print('  speedup (autoref/cudd): '
+              + ', '.join(f'{name}: {times["autoref"][name] / max(t, 1e-6):.1f}x'
+                          for name, t in times['cudd'].items()))
+
+
+def main():
+    print(f'Available backends: {BDDModel.available_backends()}')
+    benchmark(JHIPSTER_FM)
+    benchmark(WEAFQAS_FM)
+
+
+if __name__ == "__main__":
+    main()
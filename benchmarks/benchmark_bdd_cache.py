@@ -0,0 +1,45 @@
+import tempfile
+import time
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.operations import BDDProductsNumber
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.bdd_metamodel.transformations.variable_ordering import VariableOrdering
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+
+def benchmark(path: str, ordering: VariableOrdering, reorder: bool) -> None:
+    fm = FeatureIDEParser(path).transform()
+    print(f'{path} ({ordering.value}{" + sifting" if reorder else ""}):')
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start_time = time.time()
+        transformation = FmToBDD(fm, ordering, reorder, cache_dir=cache_dir)
+        cold = transformation.transform()
+        cold_time = time.time() - start_time
+        print(f'  Cold start (compile and store): {cold_time:.3f}s, #Nodes: {transformation.stats["nodes"]}')
+
+        start_time = time.time()
+        transformation = FmToBDD(fm, ordering, reorder, cache_dir=cache_dir)
+        warm = transformation.transform()
+        warm_time = time.time() - start_time
+        print(f'  Warm start (load from cache): {warm_time:.3f}s, cached: {transformation.stats["cached"]}, '
+              f'speedup: {cold_time / warm_time:.1f}x')
+
+        same = (BDDProductsNumber().execute(cold).get_result()
+                == BDDProductsNumber().execute(warm).get_result())
+        print(f'  Same number of products: {same}')
+
+
+def main():
+    benchmark(JHIPSTER_FM, VariableOrdering.DECLARATION, False)
+    benchmark(WEAFQAS_FM, VariableOrdering.DECLARATION, False)
+    benchmark(WEAFQAS_FM, VariableOrdering.SPAN, True)
+
+
+if __name__ == "__main__":
+    main()
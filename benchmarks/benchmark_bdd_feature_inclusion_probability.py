@@ -0,0 +1,49 @@
+import time
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.operations import (
+    BDDFeatureInclusionProbability,
+    BDDFeatureInclusionProbabilityBF,
+    BDDProductsNumber
+)
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+# The brute-force version enumerates all the products
+MAX_PRODUCTS_BF = 10**6
+
+
+def benchmark(path: str) -> None:
+    fm = FeatureIDEParser(path).transform()
+    bdd_model = FmToBDD(fm).transform()
+    nof_products = BDDProductsNumber().execute(bdd_model).get_result()
+    print(f'{path}: #Features: {len(bdd_model.variables)}, #Products: {nof_products}, '
+          f'#Nodes: {len(bdd_model.root)}')
+
+    start_time = time.time()
+    fip = BDDFeatureInclusionProbability().execute(bdd_model).get_result()
+    end_time = time.time()
+    print(f'  BDDFeatureInclusionProbability: {end_time-start_time:.4f}s')
+
+    if nof_products > MAX_PRODUCTS_BF:
+        print(f'  BDDFeatureInclusionProbabilityBF: skipped (more than {MAX_PRODUCTS_BF} products)')
+        return
+    start_time = time.time()
+    fip_bf = BDDFeatureInclusionProbabilityBF().execute(bdd_model).get_result()
+    end_time = time.time()
+    print(f'  BDDFeatureInclusionProbabilityBF: {end_time-start_time:.4f}s')
+    assert all(abs(fip[f] - fip_bf[f]) < 1e-9 for f in fip)
+
+
+def main():
+    benchmark(JHIPSTER_FM)
+    benchmark(WEAFQAS_FM)
+
+
+if __name__ == "__main__":
+    main()
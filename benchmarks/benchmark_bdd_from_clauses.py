@@ -0,0 +1,62 @@
+import time
+
+from famapy.metamodels.fm_metamodel.models import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.bdd_metamodel.transformations.pysat_to_bdd import PySATToBDD
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+
+def textual_bdd(clauses: list[list[int]], features: dict[int, str]) -> BDDModel:
+    """Previous construction: a textual CNF formula parsed by the BDD manager."""
+    or_connective = ' ' + BDDModel.OR + ' '
+    and_connective = ' ' + BDDModel.AND + ' '
+    cnf_list = ['(' + or_connective.join(BDDModel.NOT + features[abs(l)] if l < 0 else features[l]
+                                         for l in clause) + ')'
+                for clause in clauses]
+    bdd_model = BDDModel()
+    bdd_model.from_textual_cnf(and_connective.join(cnf_list), [features[i] for i in sorted(features)])
+    return bdd_model
+
+
+def benchmark(path: str) -> None:
+    fm = FeatureIDEParser(path).transform()
+    # FmToPysat does not support the constraints of FeatureIDE models: only the tree is used
+    pysat_model = FmToPysat(FeatureModel(fm.root, [])).transform()
+    clauses = pysat_model.get_all_clauses().clauses
+    print(f'{path}: #Features: {len(pysat_model.variables)}, #Clauses: {len(clauses)}')
+
+    start_time = time.time()
+    textual = textual_bdd(clauses, pysat_model.features)
+    textual_time = time.time() - start_time
+    print(f'  Textual formula: {textual_time:.3f}s, #Nodes: {len(textual.root)}')
+
+    transformation = PySATToBDD(pysat_model)
+    start_time = time.time()
+    bdd_model = transformation.transform()
+    clauses_time = time.time() - start_time
+    stats = transformation.stats
+    print(f'  From clauses: {clauses_time:.3f}s, #Nodes: {stats["nodes"]}, '
+          f'peak #Nodes: {stats["peak_nodes"]}, speedup: {textual_time / clauses_time:.1f}x')
+
+    start_time = time.time()
+    fm_to_bdd = FmToBDD(fm)
+    fm_to_bdd.transform()
+    print(f'  FmToBDD (with constraints): {time.time() - start_time:.3f}s, '
+          f'#Nodes: {fm_to_bdd.stats["nodes"]}, peak #Nodes: {fm_to_bdd.stats["peak_nodes"]}')
+
+
+def main():
+    benchmark(JHIPSTER_FM)
+    benchmark(WEAFQAS_FM)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import random
+import time
+
+import numpy as np
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations import BDDProductDistribution
+from famapy.metamodels.bdd_metamodel.operations.bdd_feature_inclusion_probability import feature_inclusion_counts
+from famapy.metamodels.bdd_metamodel.operations.bdd_sampling import node_probabilities, random_walk
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+SAMPLE_SIZE = 10000
+# Synthetic BDD: x0 + x1 + ... + x{n-1} is a multiple of MODULUS
+NOF_VARS = 5000
+MODULUS = 100
+
+
+def timed(function) -> float:
+    start_time = time.time()
+    function()
+    return time.time() - start_time
+
+
+def modulus_bdd(nof_vars: int, modulus: int) -> BDDModel:
+    """BDD of the assignments with a number of selected variables multiple of `modulus`
+    (about nof_vars * modulus nodes), built bottom-up without recursion."""
+    bdd_model = BDDModel('autoref')
+    bdd_model.variables = [f'x{i}' for i in range(nof_vars)]
+    for name in bdd_model.variables:
+        bdd_model.bdd.declare(name)
+    # remainders[r]: the selected variables below are r modulo `modulus`
+    remainders = [bdd_model.bdd.true] + [bdd_model.bdd.false] * (modulus - 1)
+    for level in reversed(range(nof_vars)):
+        remainders = [bdd_model.find_or_add(level, remainders[r], remainders[(r + 1) % modulus])
+                      for r in range(modulus)]
+    bdd_model.root = remainders[0]
+    return bdd_model
+
+
+def benchmark(name: str, bdd_model: BDDModel, product_distribution: bool = True) -> None:
+    arrays = None
+
+    def export():
+        nonlocal arrays
+        arrays = bdd_model.to_arrays()
+
+    def walks():
+        table = node_probabilities(bdd_model, bdd_model.root)
+        root = bdd_model.reference(bdd_model.root)
+        for _ in range(SAMPLE_SIZE):
+            random_walk(table, root, bdd_model.nof_levels(), random)
+
+    export_time = timed(export)
+    # len(bdd_model.root) is recursive in dd, so the nodes are counted from the arrays
+    print(f'{name}: #Variables: {bdd_model.nof_levels()}, #Nodes: {len(arrays)}')
+    print(f'  Export: {export_time:.3f}s')
+    tasks = [('count', lambda: bdd_model.count_references(bdd_model.reachable_references(bdd_model.root)),
+              lambda: arrays.counts()),
+             ('FIP', lambda: feature_inclusion_counts(bdd_model, bdd_model.root),
+              arrays.feature_inclusion_counts),
+             ('sampler probabilities', lambda: node_probabilities(bdd_model, bdd_model.root),
+              arrays.high_probabilities),
+             (f'{SAMPLE_SIZE} random walks', walks,
+              lambda: arrays.random_walks(SAMPLE_SIZE, np.random.default_rng())),
+             ('PD', lambda: BDDProductDistribution().execute(bdd_model),
+              arrays.product_distribution)]
+    for task, traversal, array_pass in tasks[:None if product_distribution else -1]:
+        arrays._counts = None  # the counts are computed again by each pass
+        traversal_time = timed(traversal)
+        array_time = timed(array_pass)
+        print(f'  {task}: traversal: {traversal_time:.3f}s, arrays: {array_time:.3f}s, '
+              f'speedup: {traversal_time / max(array_time, 1e-6):.1f}x')
+
+
+def main():
+    for path in (JHIPSTER_FM, WEAFQAS_FM):
+        benchmark(path, FmToBDD(FeatureIDEParser(path).transform()).transform())
+    benchmark(f'x0 + ... + x{NOF_VARS - 1} = 0 (mod {MODULUS})', modulus_bdd(NOF_VARS, MODULUS),
+              product_distribution=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import os
+import time
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.operations import BDDSampling, BDDParallelSampling
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+SAMPLE_SIZE = 200000
+PROCESSES = [1, 2, 4, 8]
+
+
+def benchmark(path: str) -> None:
+    fm = FeatureIDEParser(path).transform()
+    bdd_model = FmToBDD(fm).transform()
+    print(f'{path}: #Features: {len(bdd_model.variables)}, #Nodes: {len(bdd_model.root)}')
+
+    start_time = time.time()
+    BDDSampling(SAMPLE_SIZE, with_replacement=True).execute(bdd_model)
+    sequential_time = time.time() - start_time
+    print(f'  Sequential: {SAMPLE_SIZE / sequential_time:.0f} configurations/s')
+
+    for processes in PROCESSES:
+        sampling = BDDParallelSampling(SAMPLE_SIZE, with_replacement=True, processes=processes)
+        sampling.set_seed(0)
+        start_time = time.time()
+        nof_configurations = len(sampling.execute(bdd_model).get_result())
+        parallel_time = time.time() - start_time
+        print(f'  {processes} processes: {nof_configurations / parallel_time:.0f} configurations/s, '
+              f'speedup: {sequential_time / parallel_time:.2f}x')
+
+
+def main():
+    print(f'#CPUs: {os.cpu_count()}')
+    benchmark(JHIPSTER_FM)
+    benchmark(WEAFQAS_FM)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import time
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.operations import (
+    BDDProductDistribution,
+    BDDProductDistributionBF,
+    BDDProductsNumber
+)
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+# The brute-force version enumerates all the products
+MAX_PRODUCTS_BF = 10**6
+
+
+def benchmark(path: str) -> None:
+    fm = FeatureIDEParser(path).transform()
+    bdd_model = FmToBDD(fm).transform()
+    nof_products = BDDProductsNumber().execute(bdd_model).get_result()
+    print(f'{path}: #Features: {len(bdd_model.variables)}, #Products: {nof_products}, '
+          f'#Nodes: {len(bdd_model.root)}')
+
+    start_time = time.time()
+    dist = BDDProductDistribution().execute(bdd_model).get_result()
+    end_time = time.time()
+    print(f'  BDDProductDistribution: {end_time-start_time:.4f}s')
+    assert sum(dist) == nof_products
+
+    if nof_products > MAX_PRODUCTS_BF:
+        print(f'  BDDProductDistributionBF: skipped (more than {MAX_PRODUCTS_BF} products)')
+        return
+    start_time = time.time()
+    dist_bf = BDDProductDistributionBF().execute(bdd_model).get_result()
+    end_time = time.time()
+    print(f'  BDDProductDistributionBF: {end_time-start_time:.4f}s')
+    assert dist == dist_bf
+
+
+def main():
+    benchmark(JHIPSTER_FM)
+    benchmark(WEAFQAS_FM)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import random
+import time
+
+from famapy.core.models import Configuration
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations import BDDSampling
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+SAMPLE_SIZE = 100000
+SAMPLE_SIZE_COUNTING = 100
+
+
+def counting_random_configuration(bdd_model: BDDModel) -> Configuration:
+    """Previous sampler: two counts of the BDD for each variable of each configuration."""
+    values = {}
+    u = bdd_model.root
+    n_vars = len(bdd_model.variables)
+    for feature in bdd_model.variables:
+        v_sel = bdd_model.bdd.let({feature: True}, u)
+        v_unsel = bdd_model.bdd.let({feature: False}, u)
+        selected = random.choices([True, False],
+                                  [bdd_model.bdd.count(v_sel, nvars=n_vars-1),
+                                   bdd_model.bdd.count(v_unsel, nvars=n_vars-1)], k=1)[0]
+        values[feature] = selected
+        u = bdd_model.bdd.let({feature: selected}, u)
+        n_vars -= 1
+    return Configuration(values)
+
+
+def benchmark(path: str) -> None:
+    fm = FeatureIDEParser(path).transform()
+    bdd_model = FmToBDD(fm).transform()
+    print(f'{path}: #Features: {len(bdd_model.variables)}, #Nodes: {len(bdd_model.root)}')
+
+    start_time = time.time()
+    for _ in range(SAMPLE_SIZE_COUNTING):
+        counting_random_configuration(bdd_model)
+    end_time = time.time()
+    counting_time = (end_time - start_time) / SAMPLE_SIZE_COUNTING
+    print(f'  Counting per variable: {counting_time * 1000:.3f} ms/configuration')
+
+    start_time = time.time()
+    BDDSampling(SAMPLE_SIZE, with_replacement=True).execute(bdd_model)
+    end_time = time.time()
+    walk_time = (end_time - start_time) / SAMPLE_SIZE
+    print(f'  Precomputed probabilities: {walk_time * 1000:.3f} ms/configuration '
+          f'({SAMPLE_SIZE} configurations in {end_time-start_time:.2f}s), '
+          f'speedup: {counting_time / walk_time:.0f}x')
+
+
+def main():
+    benchmark(JHIPSTER_FM)
+    benchmark(WEAFQAS_FM)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import time
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.bdd_metamodel.transformations.variable_ordering import (
+    VariableOrdering,
+    total_span,
+    variable_order
+)
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+JHIPSTER_FM = INPUT_FMS + 'jHipster.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+
+
+def benchmark(path: str, compile_bdd: bool = True) -> None:
+    fm = FeatureIDEParser(path).transform()
+    print(f'{path}: #Features: {len(fm.get_features())}, #Constraints: {len(fm.get_constraints())}')
+
+    for ordering in VariableOrdering:
+        transformation = FmToBDD(fm, ordering)
+        if not compile_bdd:
+            # Only the span of the static ordering, over the clauses of the tree:
+            # the recursion of the dd manager is too deep for the BDD of the model
+            for feature in fm.get_features():
+                transformation.add_feature(feature)
+            transformation.add_root(fm.root)
+            for relation in fm.get_relations():
+                transformation.add_relation(relation)
+            variables = list(transformation.variables.keys())
+            start_time = time.time()
+            order = variable_order(ordering, variables, transformation.clauses, fm.root)
+            ordering_time = time.time() - start_time
+            ids = [transformation.variables[name] for name in order]
+            print(f'  {ordering.value}: span: {total_span(ids, transformation.clauses)}, '
+                  f'ordering: {ordering_time:.3f}s')
+            continue
+
+        for reorder in (False, True):
+            transformation = FmToBDD(fm, ordering, reorder)
+            start_time = time.time()
+            transformation.transform()
+            compile_time = time.time() - start_time
+            stats = transformation.stats
+            print(f'  {ordering.value}{" + sifting" if reorder else ""}: #Nodes: {stats["nodes"]}, '
+                  f'peak #Nodes: {stats["peak_nodes"]}, time: {compile_time:.3f}s')
+
+
+def main():
+    benchmark(JHIPSTER_FM)
+    benchmark(WEAFQAS_FM)
+    benchmark(LINUX_FM, compile_bdd=False)
+
+
+if __name__ == "__main__":
+    main()
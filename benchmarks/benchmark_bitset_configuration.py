@@ -0,0 +1,54 @@
+import sys
+import time
+
+from famapy.core.models import BitsetConfiguration, ElementIndex
+from famapy.metamodels.fm_metamodel.models import FMConfiguration
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products import Glucose3Products
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+
+NOF_PRODUCTS = 1000
+NOF_COPIES = 3  # each configuration is repeated, as in the samples with replacement
+NOF_DEDUPLICATIONS = 5
+
+
+def timed(function) -> float:
+    start_time = time.time()
+    function()
+    return time.time() - start_time
+
+
+def main(path: str):
+    fm = FeatureIDEParser(path).transform()
+    sat_model = FmToPysat(fm).transform()
+    products = list(Glucose3Products().iter_products(sat_model, limit=NOF_PRODUCTS))
+    sat_model.delete_solvers()
+    configurations = [FMConfiguration({fm.get_feature_by_name(name): True for name in product})
+                      for product in products for _ in range(NOF_COPIES)]
+    print(f'#Features: {len(fm.get_features())}, #Configurations: {len(configurations)}')
+
+    dict_time = timed(lambda: [set(configurations) for _ in range(NOF_DEDUPLICATIONS)])
+    index = ElementIndex(fm.get_features())
+    bitsets = []
+    conversion_time = timed(lambda: bitsets.extend(BitsetConfiguration.from_configuration(index, configuration)
+                                                   for configuration in configurations))
+    bitset_time = timed(lambda: [set(bitsets) for _ in range(NOF_DEDUPLICATIONS)])
+    assert len(set(bitsets)) == len(set(configurations))
+    print(f'{NOF_DEDUPLICATIONS} deduplications: FMConfiguration: {dict_time:.3f}s, '
+          f'BitsetConfiguration: {bitset_time:.4f}s (+ {conversion_time:.3f}s of conversion), '
+          f'speedup: {dict_time / (bitset_time + conversion_time):.1f}x')
+
+    pairs = list(zip(bitsets[::NOF_COPIES], bitsets[NOF_COPIES::NOF_COPIES]))
+    distance_time = timed(lambda: [a.hamming_distance(b) for a, b in pairs])
+    dict_distance_time = timed(lambda: [len(a.get_selected_features() ^ b.get_selected_features())
+                                        for a, b in zip(configurations[::NOF_COPIES], configurations[NOF_COPIES::NOF_COPIES])])
+    print(f'Hamming distances: FMConfiguration: {dict_distance_time:.3f}s, '
+          f'BitsetConfiguration: {distance_time:.4f}s')
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else LINUX_FM)
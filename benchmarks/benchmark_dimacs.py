@@ -0,0 +1,56 @@
+import os
+import random
+import tempfile
+import time
+
+from famapy.metamodels.cnf_metamodel.models.cnf_model import CNFNotation
+from famapy.metamodels.cnf_metamodel.transformations.cnf_writer import CNFWriter
+from famapy.metamodels.cnf_metamodel.transformations.pysat_to_cnf import PysatToCNF
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.transformations.cnf_to_pysat import CNFReader
+from famapy.metamodels.pysat_metamodel.transformations.dimacs_reader import DimacsReader
+from famapy.metamodels.pysat_metamodel.transformations.dimacs_writer import DimacsWriter
+
+NOF_VARIABLES = 50000
+NOF_CLAUSES = 500000
+CLAUSE_SIZES = [2, 3, 4]
+
+
+def random_model(nof_variables: int, nof_clauses: int) -> PySATModel:
+    rng = random.Random(0)
+    model = PySATModel()
+    for var in range(1, nof_variables + 1):
+        model.variables[f'Feature_{var}'] = var
+        model.features[var] = f'Feature_{var}'
+    model.ctc_cnf.extend([rng.choice((-1, 1)) * rng.randint(1, nof_variables)
+                          for _ in range(rng.choice(CLAUSE_SIZES))]
+                         for _ in range(nof_clauses))
+    model.ctc_cnf.nv = nof_variables
+    return model
+
+
+def timed(function) -> float:
+    start_time = time.time()
+    function()
+    return time.time() - start_time
+
+
+def main():
+    model = random_model(NOF_VARIABLES, NOF_CLAUSES)
+    print(f'#Variables: {NOF_VARIABLES}, #Clauses: {NOF_CLAUSES}')
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ('formula.dimacs', 'formula.dimacs.gz'):
+            path = os.path.join(directory, name)
+            write_time = timed(lambda: DimacsWriter(path, model).transform())
+            read_time = timed(lambda: DimacsReader(path).transform())
+            print(f'  {name} ({os.path.getsize(path) / 2**20:.1f} MiB): '
+                  f'write: {write_time:.3f}s, read: {read_time:.3f}s')
+        path = os.path.join(directory, 'formula.txt')
+        writer = CNFWriter(path, PysatToCNF(model).transform())
+        writer.set_notation(CNFNotation.SHORT)
+        writer.transform()
+        print(f'  Textual CNF formula (CNFReader): read: {timed(lambda: CNFReader(path).transform()):.3f}s')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import sys
+import time
+import tracemalloc
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+
+
+def benchmark(path: str, streaming: bool) -> None:
+    tracemalloc.start()
+    start_time = time.time()
+    fm = FeatureIDEParser(path, streaming=streaming).transform()
+    end_time = time.time()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    mode = 'streaming' if streaming else 'DOM'
+    print(f'FeatureIDEParser ({mode}): {end_time-start_time:.3f}s, '
+          f'peak memory: {peak / 2**20:.1f} MiB, '
+          f'#Features: {len(fm.get_features())}, #CTCs: {len(fm.get_constraints())}')
+
+
+def main(path: str):
+    benchmark(path, streaming=False)
+    benchmark(path, streaming=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else LINUX_FM)
@@ -0,0 +1,63 @@
+import sys
+import time
+
+from famapy.metamodels.fm_metamodel.models.feature_model import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_backbone import Glucose3Backbone
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+
+
+def one_call_per_variable(model: PySATModel) -> tuple[list[str], list[str]]:
+    """Previous behaviour of the core and dead features operations."""
+    core_features = []
+    dead_features = []
+    with model.solver() as solver:
+        for name, variable in model.variables.items():
+            if not solver.solve(assumptions=[-variable]):
+                core_features.append(name)
+            if not solver.solve(assumptions=[variable]):
+                dead_features.append(name)
+    return core_features, dead_features
+
+
+def benchmark_backbone(fm: FeatureModel, model: PySATModel, hints: bool, unit_propagation: bool) -> None:
+    model.set_cached(Glucose3Backbone.CACHE_KEY, None)
+    operation = Glucose3Backbone()
+    if hints:
+        operation.set_feature_model(fm)
+    operation.set_unit_propagation(unit_propagation)
+    start_time = time.time()
+    backbone = operation.execute(model).get_backbone()
+    end_time = time.time()
+    print(f'Backbone (hints: {hints}, unit propagation: {unit_propagation}): '
+          f'{end_time-start_time:.3f}s, #SAT calls: {operation.nof_sat_calls}, '
+          f'#Core: {len([lit for lit in backbone if lit > 0])}, '
+          f'#Dead: {len([lit for lit in backbone if lit < 0])}')
+
+
+def main(path: str):
+    fm = FeatureIDEParser(path).transform()
+    # Only the tree of the model, since FmToPysat does not support all the kinds of constraints
+    fm = FeatureModel(fm.root, [])
+    model = FmToPysat(fm).transform()
+    print(f'#Variables: {len(model.variables)}')
+
+    start_time = time.time()
+    core_features, dead_features = one_call_per_variable(model)
+    end_time = time.time()
+    print(f'One SAT call per variable: {end_time-start_time:.3f}s, '
+          f'#SAT calls: {2 * len(model.variables)}, '
+          f'#Core: {len(core_features)}, #Dead: {len(dead_features)}')
+
+    for hints in (False, True):
+        for unit_propagation in (False, True):
+            benchmark_backbone(fm, model, hints, unit_propagation)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else LINUX_FM)
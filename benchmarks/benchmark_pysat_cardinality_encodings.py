@@ -0,0 +1,54 @@
+import time
+
+from pysat.card import EncType
+
+from famapy.metamodels.fm_metamodel.models.feature_model import Feature, FeatureModel, Relation
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid import Glucose3Valid
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+GROUP_SIZES = [8, 14, 50, 100, 300]
+MAX_COMBINATIONS_SIZE = 14  # the combinations encoding has 2^n clauses
+ENCODINGS = {'none': None, 'seqcounter': EncType.seqcounter, 'totalizer': EncType.totalizer,
+             'sortnetwrk': EncType.sortnetwrk}
+BDD_ENCODINGS = ['none', 'seqcounter']  # the totalizer and the networks lead to large intermediate BDDs
+
+
+def group_model(nof_children: int) -> FeatureModel:
+    """Root with a mandatory alternative group and an optional [2..5] group of `nof_children` children."""
+    root = Feature('Root')
+    alternative = Feature('Alternative', parent=root)
+    group = Feature('Group', parent=root)
+    root.add_relation(Relation(root, [alternative], 1, 1))
+    root.add_relation(Relation(root, [group], 0, 1))
+    alternative.add_relation(Relation(alternative, [Feature(f'A{i}', parent=alternative)
+                                                    for i in range(nof_children)], 1, 1))
+    group.add_relation(Relation(group, [Feature(f'G{i}', parent=group) for i in range(nof_children)], 2, 5))
+    return FeatureModel(root)
+
+
+def main():
+    for nof_children in GROUP_SIZES:
+        feature_model = group_model(nof_children)
+        print(f'Groups of {nof_children} children:')
+        for name, encoding in ENCODINGS.items():
+            if encoding is None and nof_children > MAX_COMBINATIONS_SIZE:
+                continue
+            options = ({'cardinality_threshold': None} if encoding is None
+                       else {'cardinality_threshold': 0, 'cardinality_encoding': encoding})
+            start_time = time.time()
+            pysat_model = FmToPysat(feature_model, **options).transform()
+            Glucose3Valid().execute(pysat_model)
+            sat_time = time.time() - start_time
+            line = (f'  {name}: #Clauses: {len(pysat_model.r_cnf.clauses)}, '
+                    f'#Auxiliary variables: {len(pysat_model.auxiliary_variables)}, '
+                    f'transformation + SAT: {sat_time:.3f}s')
+            if name in BDD_ENCODINGS:
+                start_time = time.time()
+                FmToBDD(feature_model, **options).transform()
+                line += f', BDD: {time.time() - start_time:.3f}s'
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import gc
+import sys
+import time
+import tracemalloc
+
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+
+NOF_CALLS = 20
+
+
+def main(path: str):
+    fm = FeatureIDEParser(path).transform()
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.time()
+    sat_model = FmToPysat(fm).transform()
+    transform_time = time.time() - start_time
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nof_clauses = len(sat_model.r_cnf) + len(sat_model.ctc_cnf)
+    print(f'#Variables: {len(sat_model.variables)}, #Clauses: {nof_clauses}')
+    print(f'FmToPysat: {transform_time:.3f}s, memory of the model: {memory / 2**20:.1f} MiB')
+
+    start_time = time.time()
+    for _ in range(NOF_CALLS):
+        sat_model.get_all_clauses()
+    print(f'get_all_clauses: {(time.time() - start_time) / NOF_CALLS * 1000:.2f} ms/call')
+
+    start_time = time.time()
+    with sat_model.solver() as session:
+        session.solve()
+    print(f'Loading the clauses into a solver session: {(time.time() - start_time) * 1000:.1f} ms')
+    sat_model.delete_solvers()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else LINUX_FM)
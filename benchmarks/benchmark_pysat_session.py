@@ -0,0 +1,69 @@
+import sys
+import time
+
+from pysat.solvers import Glucose3
+
+from famapy.core.models import Configuration
+from famapy.metamodels.fm_metamodel.models.feature_model import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid import Glucose3Valid
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid_configuration import Glucose3ValidConfiguration
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+
+NOF_OPERATIONS = 50
+
+
+def fresh_solver_valid_configuration(model: PySATModel, assumptions: list[int]) -> bool:
+    """Previous behaviour of the operations: a new solver loaded with all the clauses."""
+    glucose = Glucose3()
+    for clause in model.get_all_clauses():
+        glucose.add_clause(clause)
+    result = glucose.solve(assumptions=assumptions)
+    glucose.delete()
+    return result
+
+
+def main(path: str):
+    fm = FeatureIDEParser(path).transform()
+    # Only the tree of the model, since FmToPysat does not support all the kinds of constraints
+    sat_model = FmToPysat(FeatureModel(fm.root, [])).transform()
+    print(f'#Variables: {len(sat_model.variables)}, #Clauses: {len(sat_model.get_all_clauses().clauses)}')
+
+    features = fm.get_features()
+    configurations = [Configuration({features[i % len(features)]: True})
+                      for i in range(NOF_OPERATIONS)]
+    assumptions = [[sat_model.variables[feature.name] for feature in config.elements]
+                   for config in configurations]
+
+    start_time = time.time()
+    fresh_results = [fresh_solver_valid_configuration(sat_model, a) for a in assumptions]
+    end_time = time.time()
+    fresh_time = (end_time - start_time) / NOF_OPERATIONS
+    print(f'Fresh solver per operation: {fresh_time * 1000:.2f} ms/operation')
+
+    start_time = time.time()
+    Glucose3Valid().execute(sat_model)  # the first operation loads the clauses
+    end_time = time.time()
+    print(f'Session (first operation): {(end_time - start_time) * 1000:.2f} ms')
+
+    start_time = time.time()
+    session_results = []
+    for config in configurations:
+        operation = Glucose3ValidConfiguration()
+        operation.set_configuration(config)
+        session_results.append(operation.execute(sat_model).get_result())
+    end_time = time.time()
+    session_time = (end_time - start_time) / NOF_OPERATIONS
+    print(f'Session (next operations): {session_time * 1000:.2f} ms/operation, '
+          f'speedup: {fresh_time / session_time:.1f}x')
+    assert fresh_results == session_results
+    sat_model.delete_solvers()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else LINUX_FM)
@@ -0,0 +1,79 @@
+import time
+
+import numpy as np
+
+from famapy.core.models import Configuration
+from famapy.metamodels.fm_metamodel.models import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products import Glucose3Products
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid_configuration import Glucose3ValidConfiguration
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid_configurations import Glucose3ValidConfigurations
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+# Models in FeatureIDE format
+INPUT_FMS = 'input_fms/FeatureIDE_models/'
+LINUX_FM = INPUT_FMS + 'linux-2.6.33.3.xml'
+WEAFQAS_FM = INPUT_FMS + 'WeaFQAs.xml'
+
+# With the Tseitin transformation, the configurations that satisfy the clauses without
+# auxiliary variables are checked with the solver
+# (linux cannot be transformed without it, the CNF of its constraints is too large)
+BENCHMARKS = [(LINUX_FM, {}), (WEAFQAS_FM, {'tseitin': False})]
+
+NOF_PRODUCTS = 500  # each product is also mutated, flipping a feature
+
+
+def main():
+    for path, options in BENCHMARKS:
+        print(f'{path} {options}')
+        fm = FeatureIDEParser(path).transform()
+        benchmark(fm, FmToPysat(fm, **options).transform())
+
+
+def benchmark(fm: FeatureModel, sat_model: PySATModel):
+    features = np.array(sorted(sat_model.features))
+    rng = np.random.default_rng(0)
+    assignments = np.zeros((2 * NOF_PRODUCTS, features.max()), dtype=bool)
+    products = Glucose3Products().iter_products(sat_model, limit=NOF_PRODUCTS)
+    for row, product in enumerate(products):
+        selected = {sat_model.variables[name] for name in product}
+        assignments[row, [var - 1 for var in selected]] = True
+    assignments[NOF_PRODUCTS:] = assignments[:NOF_PRODUCTS]
+    flipped = rng.choice(features, NOF_PRODUCTS) - 1
+    assignments[np.arange(NOF_PRODUCTS, 2 * NOF_PRODUCTS), flipped] ^= True
+    configurations = [Configuration({fm.get_feature_by_name(sat_model.features[var]): bool(row[var - 1])
+                                     for var in features})
+                      for row in assignments]
+    print(f'#Features: {len(features)}, #Clauses: {len(sat_model.get_all_clauses())}, '
+          f'#Configurations: {len(configurations)}')
+
+    start_time = time.time()
+    expected = []
+    for configuration in configurations:
+        operation = Glucose3ValidConfiguration()
+        operation.set_configuration(configuration)
+        expected.append(operation.execute(sat_model).get_result())
+    solver_time = time.time() - start_time
+    print(f'Glucose3ValidConfiguration: {solver_time:.3f}s ({sum(expected)} valid)')
+
+    start_time = time.time()
+    operation = Glucose3ValidConfigurations()
+    operation.set_configurations(configurations)
+    result = operation.execute(sat_model).get_result()
+    batch_time = time.time() - start_time
+    print(f'Glucose3ValidConfigurations (configurations): {batch_time:.3f}s, speedup: {solver_time / batch_time:.1f}x')
+    assert result.tolist() == expected
+
+    start_time = time.time()
+    operation = Glucose3ValidConfigurations()
+    operation.set_assignments(assignments)
+    result = operation.execute(sat_model).get_result()
+    matrix_time = time.time() - start_time
+    print(f'Glucose3ValidConfigurations (matrix): {matrix_time:.3f}s, speedup: {solver_time / matrix_time:.1f}x')
+    assert result.tolist() == expected
+    sat_model.delete_solvers()
+
+
+if __name__ == "__main__":
+    main()
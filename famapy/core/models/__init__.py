@@ -1,5 +1,6 @@
 from .variability_model import VariabilityModel  # pylint: disable=cyclic-import
 from .configuration import Configuration  # pylint: disable=cyclic-import
+from .bitset_configuration import BitsetConfiguration, ElementIndex  # pylint: disable=cyclic-import
 from .ast import AST  # pylint: disable=cyclic-import
 
-__all__ = ["VariabilityModel", "Configuration", "AST"]
+__all__ = ["VariabilityModel", "Configuration", "BitsetConfiguration", "ElementIndex", "AST"]
@@ -1,4 +1,6 @@
-from typing import Optional, Any
+import weakref
+from collections.abc import Iterable
+from typing import Any, Callable, Optional, Union
 from enum import Enum
 
 
@@ -8,16 +10,50 @@ class ASTOperation(Enum):
     AND = 'AND'
     OR = 'OR'
     IMPLIES = 'IMPLIES'
-    NOT = 'NOT'   
+    NOT = 'NOT'
     EQUIVALENCE = 'EQUIVALENCE'
 
 
 class Node:
+    """Node of an AST: a feature, or an operation over its children.
 
-    def __init__(self, data: Any):
-        self.left: Optional['Node'] = None  # pylint: disable=unsubscriptable-object
-        self.right: Optional['Node'] = None  # pylint: disable=unsubscriptable-object
+    NOT has one child, AND and OR have any number of children (without children,
+    they are the constants TRUE and FALSE), and the other operations have two children.
+    `left` and `right` are the first and the second child.
+
+    The nodes built with `make_node` (e.g., the nodes of an AST) are hash-consed:
+    there is a single node for each formula, so equal subformulas are shared in memory
+    and compared by identity. Hash-consed nodes cannot be modified.
+    """
+
+    __slots__ = ('data', 'children', '_hash_consed', '__weakref__')
+
+    def __init__(self, data: Any, children: Optional[list['Node']] = None):
         self.data = data
+        self.children: list[Optional['Node']] = [] if children is None else list(children)
+        self._hash_consed = False
+
+    @property
+    def left(self) -> Optional['Node']:  # pylint: disable=unsubscriptable-object
+        return self.children[0] if len(self.children) > 0 else None
+
+    @left.setter
+    def left(self, node: Optional['Node']) -> None:  # pylint: disable=unsubscriptable-object
+        self._set_child(0, node)
+
+    @property
+    def right(self) -> Optional['Node']:  # pylint: disable=unsubscriptable-object
+        return self.children[1] if len(self.children) > 1 else None
+
+    @right.setter
+    def right(self, node: Optional['Node']) -> None:  # pylint: disable=unsubscriptable-object
+        self._set_child(1, node)
+
+    def _set_child(self, index: int, node: Optional['Node']) -> None:  # pylint: disable=unsubscriptable-object
+        if self._hash_consed:
+            raise AttributeError('Hash-consed nodes cannot be modified.')
+        self.children.extend([None] * (index + 1 - len(self.children)))
+        self.children[index] = node
 
     def is_feature(self) -> bool:
         return not self.is_op()
@@ -26,73 +62,254 @@ class Node:
         return isinstance(self.data, ASTOperation)
 
     def __str__(self) -> str:
-        data = self.data.name if self.is_op() else self.data
-            
-        if self.left and self.right:
-            return f'{data}[{self.left}][{self.right}]'
+        # Iterative, so deep ASTs do not reach the recursion limit
+        strings: dict[int, str] = {}
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in strings:
+                continue
+            children = [child for child in node.children if child is not None]
+            if not expanded and children:
+                stack.append((node, True))
+                stack.extend((child, False) for child in children)
+                continue
+            if node is TRUE or node is FALSE:
+                strings[id(node)] = 'TRUE' if node is TRUE else 'FALSE'
+            elif not node.children:
+                strings[id(node)] = str(node.data.name if node.is_op() else node.data)
+            else:
+                operands = list(node.children) + [None] * (2 - len(node.children))
+                strings[id(node)] = (node.data.name if node.is_op() else str(node.data)) + ''.join(
+                    '[]' if child is None else f'[{strings[id(child)]}]' for child in operands)
+        return strings[id(self)]
+
+
+# Hash-consed nodes, by their data and the ids of their (hash-consed) children.
+# The children of a node are alive as long as the node, so their ids are not reused.
+_HASH_CONSED: 'weakref.WeakValueDictionary[tuple[Any, tuple[int, ...]], Node]' = weakref.WeakValueDictionary()
+
+
+def _hash_cons(data: Any, children: tuple[Node, ...]) -> Node:
+    key = (data, tuple(map(id, children)))
+    node = _HASH_CONSED.get(key)
+    if node is None:
+        node = Node(data)
+        node.children = children
+        node._hash_consed = True  # pylint: disable=protected-access
+        _HASH_CONSED[key] = node
+    return node
+
+
+TRUE = _hash_cons(ASTOperation.AND, ())
+FALSE = _hash_cons(ASTOperation.OR, ())
+
+
+def make_node(data: Any, children: Iterable[Node] = ()) -> Node:
+    """Hash-consed node of the operation `data` over the children, or of the feature `data`.
+
+    The formula is simplified:
+      - ANDs and ORs are flattened, and their repeated children are removed.
+      - An AND (OR) with a subformula and its negation is FALSE (TRUE).
+      - Double negations are removed.
+      - The constants TRUE and FALSE are folded.
+    """
+    children = tuple(child if child._hash_consed else hash_cons(child)  # pylint: disable=protected-access
+                     for child in children)
+    simplified = _simplify(data, children) if children else None
+    return _hash_cons(data, children) if simplified is None else simplified
+
+
+def _simplify(data: Any, children: tuple[Node, ...]) -> Optional[Node]:
+    """Simplified formula of the operation over the hash-consed children, or None if it cannot be simplified."""
+    if data is ASTOperation.NOT and len(children) == 1:
+        child = children[0]
+        if child is TRUE or child is FALSE:
+            return FALSE if child is TRUE else TRUE
+        if child.data is ASTOperation.NOT:
+            return child.children[0]
+        return None
+    if data is ASTOperation.AND or data is ASTOperation.OR:
+        # The children are already flattened, and the neutral constant (e.g., TRUE in an AND) has no children
+        absorbing = FALSE if data is ASTOperation.AND else TRUE
+        operands = {}
+        for child in children:
+            for operand in (child.children if child.data is data else (child,)):
+                if operand is absorbing:
+                    return absorbing
+                operands[id(operand)] = operand
+        for operand in operands.values():
+            if operand.data is ASTOperation.NOT and id(operand.children[0]) in operands:
+                return absorbing
+        if len(operands) == 1:
+            return next(iter(operands.values()))
+        return _hash_cons(data, tuple(operands.values()))
+    if len(children) != 2:
+        return None
+    left, right = children
+    if data in (ASTOperation.IMPLIES, ASTOperation.REQUIRES):
+        if left is FALSE or right is TRUE or left is right:
+            return TRUE
+        if left is TRUE:
+            return right
+        if right is FALSE:
+            return make_node(ASTOperation.NOT, [left])
+    elif data == ASTOperation.EXCLUDES:
+        if left is FALSE or right is FALSE:
+            return TRUE
+        if left is TRUE or right is TRUE or left is right:
+            return make_node(ASTOperation.NOT, [right if left is TRUE else left])
+    elif data == ASTOperation.EQUIVALENCE:
+        if left is right:
+            return TRUE
+        for constant, other in ((left, right), (right, left)):
+            if constant is TRUE:
+                return other
+            if constant is FALSE:
+                return make_node(ASTOperation.NOT, [other])
+    return None
+
+
+def hash_cons(root: Node) -> Node:
+    """Hash-consed (and simplified) formula of the AST `root` (see `make_node`)."""
+    if root._hash_consed:  # pylint: disable=protected-access
+        return root
+    nodes: dict[int, Node] = {}
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in nodes:
+            continue
+        children = [child for child in node.children if child is not None]
+        if node._hash_consed:  # pylint: disable=protected-access
+            nodes[id(node)] = node
+        elif not expanded and children:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children)
+        else:
+            nodes[id(node)] = make_node(node.data, [nodes[id(child)] for child in children])
+    return nodes[id(root)]
+
 
-        if self.left and not self.right:
-            return f'{data}[{self.left}][]'
+# CNF clauses of the hash-consed formulas (see `AST.get_clauses`)
+_CLAUSES: 'weakref.WeakKeyDictionary[Node, list[list[Any]]]' = weakref.WeakKeyDictionary()
 
-        if not self.left and self.right:
-            return f'{data}[][{self.right}]'
 
-        return str(data)
+def as_operation(operation: Union[ASTOperation, str]) -> ASTOperation:
+    """Operation given by itself or by its name in any case (e.g., 'requires' or 'Implies')."""
+    if isinstance(operation, ASTOperation):
+        return operation
+    return ASTOperation(operation.upper())
 
 
 class AST:
-    """Abstract Syntax Tree (AST) to store constraints."""
+    """Abstract Syntax Tree (AST) to store constraints.
+
+    The root is hash-consed (see `make_node`), so the constraints share their equal subformulas.
+    """
 
     def __init__(self, root: Node):
-        self.root = root
+        self.root = hash_cons(root) if isinstance(root, Node) else root
+
+    @classmethod
+    def create_simple_binary_operation(cls, operation: Union[ASTOperation, str], left: str, right: str) -> 'AST':
+        return cls(make_node(as_operation(operation), [make_node(left), make_node(right)]))
 
     @classmethod
-    def create_simple_binary_operation(cls, operation: ASTOperation, left: str, right: str) -> 'AST':
-        ast = cls(Node(operation))
-        ast.root.left = Node(left)
-        ast.root.right = Node(right)
-        return ast
+    def create_simple_unary_operation(cls, operation: Union[ASTOperation, str], elem: str) -> 'AST':
+        return cls(make_node(as_operation(operation), [make_node(elem)]))
 
     @classmethod
-    def create_simple_unary_operation(cls, operation: ASTOperation, elem: str) -> 'AST':
-        ast = cls(Node(operation))
-        ast.root.left = Node(elem)
-        return ast
-    
+    def create_binary_operation(cls, operation: Union[ASTOperation, str], left: Node, right: Node) -> 'AST':
+        return cls(make_node(as_operation(operation), [left, right]))
+
     @classmethod
-    def create_binary_operation(cls, operation: ASTOperation, left: Node, right: Node) -> 'AST':
-        ast = cls(Node(operation))
-        ast.root.left = left
-        ast.root.right = right
-        return ast
+    def create_unary_operation(cls, operation: Union[ASTOperation, str], elem: Node) -> 'AST':
+        return cls(make_node(as_operation(operation), [elem]))
 
     @classmethod
-    def create_unary_operation(cls, operation: ASTOperation, elem: Node) -> 'AST':
-        ast = cls(Node(operation))
-        ast.root.left = elem
-        return ast
+    def create_operation(cls, operation: Union[ASTOperation, str], elems: list[Node]) -> 'AST':
+        """AST of an n-ary operation (AND or OR)."""
+        return cls(make_node(as_operation(operation), elems))
 
     def to_cnf(self) -> 'AST':
         return convert_into_cnf(self)
 
     def get_clauses(self) -> list[list[Any]]:
-        ast = self.to_cnf()
-        clauses = get_clauses(ast.root)
-        if len(clauses) > 0 and not isinstance(clauses[0], list):
-            return [clauses]
+        """Clauses of the AST in CNF; the literals are the names of the features, with '-' if negated.
+
+        The clauses are computed once for each formula and shared by all its ASTs,
+        so they must not be modified.
+        """
+        root = hash_cons(self.root)
+        clauses = _CLAUSES.get(root)
+        if clauses is None:
+            clauses = get_clauses(convert_into_cnf(AST(root)).root)
+            _CLAUSES[root] = clauses
         return clauses
-        
+
+    def get_tseitin_clauses(self, variables: dict[str, int],
+                            new_variable: Callable[[], int]) -> list[list[int]]:
+        """Clauses of the AST with the Plaisted-Greenbaum variant of the Tseitin transformation.
+
+        The features are the variables given in `variables` (KeyError if a feature is missing),
+        and each nested subformula that is not a literal is replaced by a new auxiliary variable
+        (given by `new_variable`) that implies it, so the clauses are linear in the size of the AST
+        instead of exponential as with the distribution of ORs over ANDs (see `get_clauses`).
+        Nested ANDs and ORs are flattened, so constraints that are already clauses, or
+        conjunctions of clauses, are encoded without auxiliary variables.
+        The formula is satisfiable with the same assignments of the features,
+        but the auxiliary variables are not determined by them (they must be projected away).
+
+        Ref.: [Plaisted and Greenbaum. 1986. A Structure-preserving Clause Form Translation.
+        Journal of Symbolic Computation. (https://doi.org/10.1016/S0747-7171(86)80028-1)]
+        """
+        return tseitin_clauses(self.root, variables, new_variable)
+
     def __str__(self) -> str:
         return str(self.root)
 
 
+def _fold(item: tuple[Node, bool],
+          operands: Callable[[tuple[Node, bool]], list[tuple[Node, bool]]],
+          combine: Callable[[tuple[Node, bool], list[Any]], Any],
+          results: Optional[dict[tuple[int, bool], tuple[Node, Any]]] = None) -> Any:
+    """Combine the results of the operands of each item (node, polarity), bottom-up and without recursion.
+
+    The items are combined once, so shared subformulas are not expanded again.
+    `results` memoizes the items already combined (and keeps their nodes, so their ids are not reused).
+    """
+    results = {} if results is None else results
+    stack: list[tuple[tuple[Node, bool], Optional[list[tuple[Node, bool]]]]] = [(item, None)]
+    while stack:
+        current, expanded = stack.pop()  # the operands of the item once it is expanded
+        node, positive = current
+        if (id(node), positive) in results:
+            continue
+        if expanded is None:
+            expanded = operands(current)
+            if expanded:
+                stack.append((current, expanded))
+                stack.extend((operand, None) for operand in expanded)
+                continue
+        values = [results[(id(operand), polarity)][1] for operand, polarity in expanded]
+        results[(id(node), positive)] = (node, combine(current, values))
+    return results[(id(item[0]), item[1])][1]
+
+
+def _children(item: tuple[Node, bool]) -> list[tuple[Node, bool]]:
+    node, positive = item
+    return [(child, positive) for child in node.children]
+
+
 def convert_into_cnf(ast: AST) -> AST:
-    """Convert to negation normal form.
+    """Convert to conjunctive normal form.
 
     Three steps are performed:
       1. Eliminate implications, equivalences, and excludes.
       2. Move NOTs inwards by repeatdly applying De Morgan's Law and eliminate doble negations.
       3. Distribute ORs invwards over ANDs, applying the Distribute property.
+    The ASTs are not modified, and the shared subformulas are transformed once.
     """
     ast = eliminate_complex_operators(ast)
     ast = move_nots_inwards(ast)
@@ -101,150 +318,167 @@ def convert_into_cnf(ast: AST) -> AST:
 
 def eliminate_implication(node: Node) -> Node:
     """Replace P => Q with !P ∨ Q."""
-    left = AST.create_unary_operation(ASTOperation.NOT, node.left).root
-    return AST.create_binary_operation(ASTOperation.OR, left, node.right).root
+    return make_node(ASTOperation.OR, [make_node(ASTOperation.NOT, [node.left]), node.right])
 
 def eliminate_equivalence(node: Node) -> Node:
     """Replace P <=> Q with (P ∨ !Q) ∧ (!P ∨ Q)."""
-    pnot = AST.create_unary_operation(ASTOperation.NOT, node.left).root
-    qnot = AST.create_unary_operation(ASTOperation.NOT, node.right).root
-    left = AST.create_binary_operation(ASTOperation.OR, node.left, qnot).root 
-    right = AST.create_binary_operation(ASTOperation.OR, pnot, node.right).root 
-    return AST.create_binary_operation(ASTOperation.AND, left, right).root 
+    pnot = make_node(ASTOperation.NOT, [node.left])
+    qnot = make_node(ASTOperation.NOT, [node.right])
+    left = make_node(ASTOperation.OR, [node.left, qnot])
+    right = make_node(ASTOperation.OR, [pnot, node.right])
+    return make_node(ASTOperation.AND, [left, right])
 
 def eliminate_exclusion(node: Node) -> Node:
     """Replace P EXCLUDES !Q with !P ∨ !Q."""
-    left = AST.create_unary_operation(ASTOperation.NOT, node.left).root
-    right = AST.create_unary_operation(ASTOperation.NOT, node.right).root
-    return AST.create_binary_operation(ASTOperation.OR, left, right).root 
+    left = make_node(ASTOperation.NOT, [node.left])
+    right = make_node(ASTOperation.NOT, [node.right])
+    return make_node(ASTOperation.OR, [left, right])
 
 def eliminate_complex_operators(ast: AST) -> AST:
     """Eliminate implications, equivalences, and excludes"""
-    node = ast.root
-    if node is None or not node.is_op():
-        return ast
-    new_node = None
-    if node.data == ASTOperation.REQUIRES or node.data == ASTOperation.IMPLIES:
-        new_node = eliminate_implication(node)
-    elif node.data == ASTOperation.EQUIVALENCE:
-        new_node = eliminate_equivalence(node)
-    elif node.data == ASTOperation.EXCLUDES:
-        new_node = eliminate_exclusion(node)
-    elif node.data == ASTOperation.NOT:
-        new_node = eliminate_complex_operators(AST(node.left)).root
-    else:
-        node.left = eliminate_complex_operators(AST(node.left)).root
-        node.right = eliminate_complex_operators(AST(node.right)).root
-        return AST(node)
-    return AST(new_node)
-
-def apply_demorganlaw(node: Node, operation: ASTOperation) -> Node:
-    """Apply De Morgan's Law.
-        
-    If operation is AND, replace !(P ∨ Q) with (!P) ∧ (!Q);
-    if operation is OR, replace !(P ∧ Q) with (!P) ∨ (!Q).
-    """
-    left = AST.create_unary_operation(ASTOperation.NOT, node.left).root
-    right = AST.create_unary_operation(ASTOperation.NOT, node.right).root
-    new_node = AST.create_binary_operation(operation, left, right).root
-    return new_node
+
+    def combine(item: tuple[Node, bool], children: list[Node]) -> Node:
+        node = make_node(item[0].data, children) if children else item[0]
+        if node.data in (ASTOperation.REQUIRES, ASTOperation.IMPLIES):
+            return eliminate_implication(node)
+        if node.data == ASTOperation.EQUIVALENCE:
+            return eliminate_equivalence(node)
+        if node.data == ASTOperation.EXCLUDES:
+            return eliminate_exclusion(node)
+        return node
+
+    return AST(_fold((hash_cons(ast.root), True), _children, combine))
 
 def move_nots_inwards(ast: AST) -> AST:
-    """Move NOTs inwards by repeatedly applying De Morgan's Law, 
+    """Move NOTs inwards by repeatedly applying De Morgan's Law,
     and eliminate doble negations by replacing !!P with P.
     """
-    node = ast.root
-    if node is None or not node.is_op():
-        return ast
-    if node.data != ASTOperation.NOT:
-        node.left = move_nots_inwards(AST(node.left)).root
-        node.right = move_nots_inwards(AST(node.right)).root
-        return AST(node)
-    else:
-        if not node.left.is_op():
-            return AST(node)
-        else:
-            new_node = None
-            if node.left.data == ASTOperation.OR:
-                new_node = apply_demorganlaw(node.left, ASTOperation.AND)
-            elif node.left.data == ASTOperation.AND:
-                new_node = apply_demorganlaw(node.left, ASTOperation.OR)
-            elif node.left.data == ASTOperation.NOT:
-                # Eliminate doble negation
-                new_node = node.left.left
-            return move_nots_inwards(AST(new_node))
-
-def apply_distribution(node: Node, and_node: Node) -> Node:
-    """Apply distribution property.
-    
-    Replace P ∨ (Q ∧ R) with (P ∨ Q) ∧ (P ∨ R).
-    """
-    left = AST.create_binary_operation(ASTOperation.OR, node, and_node.left).root
-    right = AST.create_binary_operation(ASTOperation.OR, node, and_node.right).root
-    return AST.create_binary_operation(ASTOperation.AND, left, right).root
+
+    def operands(item: tuple[Node, bool]) -> list[tuple[Node, bool]]:
+        node, positive = item
+        if node.data == ASTOperation.NOT:
+            return [(node.left, not positive)]
+        if node.data in (ASTOperation.AND, ASTOperation.OR):
+            return _children(item)
+        return []
+
+    def combine(item: tuple[Node, bool], children: list[Node]) -> Node:
+        node, positive = item
+        if node.data == ASTOperation.NOT:
+            return children[0]
+        if node.data in (ASTOperation.AND, ASTOperation.OR):
+            # De Morgan's Law: the negation of an AND is the OR of the negations, and vice versa
+            operation = node.data if positive else (
+                ASTOperation.OR if node.data == ASTOperation.AND else ASTOperation.AND)
+            return make_node(operation, children)
+        return node if positive else make_node(ASTOperation.NOT, [node])
+
+    return AST(_fold((hash_cons(ast.root), True), operands, combine))
 
 def distribute_ors(ast: AST) -> AST:
-    """Distribute ORs inwards over ANDs."""
-    node = ast.root
-    if node is None or not node.is_op():
-        return ast
-    if node.data != ASTOperation.OR:
-        node.left = distribute_ors(AST(node.left)).root
-        node.right = distribute_ors(AST(node.right)).root
-        return AST(node)
-    else:
-        new_node = None
-        if not node.left.is_op() and not node.right.is_op():
-            return AST(node)
-
-        if node.left.is_op():
-            if node.left.data == ASTOperation.AND:
-                new_node = apply_distribution(node.right, node.left)
-                return distribute_ors(AST(new_node))
-        
-        if node.right.is_op():
-            if node.right.data == ASTOperation.AND:
-                new_node = apply_distribution(node.left, node.right) 
-                return distribute_ors(AST(new_node))
-        
-        if new_node is None:
-            node.left = distribute_ors(AST(node.left)).root
-            node.right = distribute_ors(AST(node.right)).root
-            return AST(node)
+    """Distribute ORs inwards over ANDs (the AST must be in negation normal form)."""
+
+    def operands(item: tuple[Node, bool]) -> list[tuple[Node, bool]]:
+        return _children(item) if item[0].data in (ASTOperation.AND, ASTOperation.OR) else []
+
+    def combine(item: tuple[Node, bool], children: list[list[tuple[Node, ...]]]) -> list[tuple[Node, ...]]:
+        # The clauses of the subformula, as tuples of literals
+        node = item[0]
+        if node.data == ASTOperation.AND:
+            return list(dict.fromkeys(clause for clauses in children for clause in clauses))
+        if node.data == ASTOperation.OR:
+            # (P ∧ Q) ∨ R = (P ∨ R) ∧ (Q ∨ R), for each pair of clauses of the operands
+            product: list[tuple[Node, ...]] = [()]
+            for clauses in children:
+                product = list(dict.fromkeys(tuple(dict.fromkeys(left + right))
+                                             for left in product for right in clauses))
+            return [clause for clause in product if not _is_tautology(clause)]
+        return [(node,)]
+
+    clauses = _fold((hash_cons(ast.root), True), operands, combine)
+    return AST(make_node(ASTOperation.AND, [make_node(ASTOperation.OR, clause) for clause in clauses]))
+
+def _is_tautology(clause: tuple[Node, ...]) -> bool:
+    literals = {id(literal) for literal in clause}
+    return any(literal.data == ASTOperation.NOT and id(literal.left) in literals for literal in clause)
 
 def get_clauses(node: Node) -> list[list[Any]]:
     """Return the list of clauses represented by the AST root node in normal conjuntive form."""
-    if node is None or not node.is_op():
-        return []
-    if node.data == ASTOperation.AND:  # Each AND gives us two clauses
-        clauses = []
-        clauses_left = get_clauses(node.left)  # Recursive AND
-        # recursive ANDs may introduce additional clauses
-        if len(clauses_left) > 0 and isinstance(clauses_left[0], list):  
-            for c in clauses_left:
-                clauses.append(c)
-        else:
-            clauses.append(clauses_left)
+    conjuncts = node.children if node.data == ASTOperation.AND else [node]
+    clauses = []
+    for conjunct in conjuncts:
+        literals = conjunct.children if conjunct.data == ASTOperation.OR else [conjunct]
+        clauses.append(['-' + literal.left.data if literal.data == ASTOperation.NOT else literal.data
+                        for literal in literals])
+    return clauses
 
-        clauses_right = get_clauses(node.right)  # Recursive AND
-        # recursive ANDs may introduce additional clauses
-        if len(clauses_right) > 0 and isinstance(clauses_right[0], list):  
-            for c in clauses_right:
-                clauses.append(c)
-        else:
-            clauses.append(clauses_right)
-        return clauses
-    if node.data == ASTOperation.NOT:
-        return ['-' + node.left.data]
+
+def _nnf_operation(node: Node, positive: bool) -> tuple[str, Any]:
+    """Top operation of the subformula in negation normal form (NNF), with the given polarity.
+
+    Return ('var', (feature, positive)) for a literal,
+    and ('and', items) or ('or', items) for a conjunction or disjunction of the items (node, positive).
+    """
+    while node.is_op() and node.data == ASTOperation.NOT:
+        node, positive = node.left, not positive
+    if not node.is_op():
+        return ('var', (node.data, positive))
+    conjunction, disjunction = ('and', 'or') if positive else ('or', 'and')
+    if node.data == ASTOperation.AND:
+        return (conjunction, [(child, positive) for child in node.children])
     if node.data == ASTOperation.OR:
-        clause = []
-        if node.left.is_op():
-            clause += get_clauses(node.left)  # recursive OR belongs to the same clause
+        return (disjunction, [(child, positive) for child in node.children])
+    if node.data in (ASTOperation.IMPLIES, ASTOperation.REQUIRES):
+        return (disjunction, [(node.left, not positive), (node.right, positive)])
+    if node.data == ASTOperation.EXCLUDES:
+        return (disjunction, [(node.left, not positive), (node.right, not positive)])
+    # EQUIVALENCE: (P => Q) ∧ (Q => P)
+    forward = make_node(ASTOperation.IMPLIES, [node.left, node.right])
+    backward = make_node(ASTOperation.IMPLIES, [node.right, node.left])
+    return (conjunction, [(forward, positive), (backward, positive)])
+
+
+def _flatten(operation: str, items: list[tuple[Node, bool]]) -> list[tuple[Node, bool]]:
+    """Operands of the n-ary `operation` ('and' or 'or') over the items."""
+    operands = []
+    stack = list(reversed(items))
+    while stack:
+        node, positive = stack.pop()
+        kind, payload = _nnf_operation(node, positive)
+        if kind == operation:
+            stack.extend(reversed(payload))
         else:
-            clause.append(node.left.data)
-        if node.right.is_op():
-            clause += get_clauses(node.right)  # recursive OR belongs to the same clause
-        else:
-            clause.append(node.right.data)
-        return clause
-    return []
+            operands.append((node, positive))
+    return operands
+
+
+def tseitin_clauses(root: Node, variables: dict[str, int], new_variable: Callable[[], int]) -> list[list[int]]:
+    """Plaisted-Greenbaum clauses of the formula `root` (see `AST.get_tseitin_clauses`).
+
+    The subformulas are encoded bottom-up without recursion.
+    Shared subformulas (e.g., the operands of an equivalence) are encoded once per polarity.
+    """
+    clauses = []
+    literals: dict[tuple[int, bool], tuple[Node, int]] = {}  # literal of each item already encoded
+
+    def operands(item: tuple[Node, bool]) -> list[tuple[Node, bool]]:
+        kind, payload = _nnf_operation(*item)
+        return [] if kind == 'var' else _flatten(kind, payload)
+
+    def combine(item: tuple[Node, bool], operand_literals: list[int]) -> int:
+        kind, payload = _nnf_operation(*item)
+        if kind == 'var':
+            feature, positive = payload
+            return variables[feature] if positive else -variables[feature]
+        auxiliary = new_variable()
+        if kind == 'and':  # auxiliary => each operand
+            clauses.extend([-auxiliary, literal] for literal in operand_literals)
+        else:  # auxiliary => some operand
+            clauses.append([-auxiliary] + operand_literals)
+        return auxiliary
+
+    for conjunct in _flatten('and', [(hash_cons(root), True)]):
+        kind, payload = _nnf_operation(*conjunct)
+        disjuncts = _flatten('or', payload) if kind == 'or' else [conjunct]
+        clauses.append([_fold(disjunct, operands, combine, literals) for disjunct in disjuncts])
+    return clauses
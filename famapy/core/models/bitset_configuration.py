@@ -0,0 +1,155 @@
+from typing import Any, Iterable, Iterator
+
+from famapy.core.models.configuration import Configuration
+
+
+class ElementIndex:
+    """Bit position of each element (e.g., feature) of a variability model, for BitsetConfiguration.
+
+    The index is built once per model and shared by its configurations,
+    which can only be compared and combined with the configurations of the same index.
+    """
+
+    def __init__(self, elements: Iterable[Any]) -> None:
+        self.elements = list(elements)
+        self.positions = {element: position for position, element in enumerate(self.elements)}
+        if len(self.positions) != len(self.elements):
+            raise ValueError('The elements of the index must be distinct.')
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def bits(self, elements: Iterable[Any]) -> int:
+        """Integer with the bits of the elements set."""
+        return self._bits(self.positions[element] for element in elements)
+
+    def _bits(self, positions: Iterable[int]) -> int:
+        # The bits are set in a byte array, since or-ing big integers bit by bit is quadratic
+        buffer = bytearray((len(self.elements) + 7) // 8)
+        for position in positions:
+            buffer[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(buffer, 'little')
+
+    def elements_of(self, bits: int) -> Iterator[Any]:
+        """Elements whose bits are set, in the order of the index."""
+        for offset, byte in enumerate(bits.to_bytes((bits.bit_length() + 7) // 8, 'little')):
+            while byte:
+                low = byte & -byte
+                yield self.elements[8 * offset + low.bit_length() - 1]
+                byte ^= low
+
+
+class BitsetConfiguration:
+    """Immutable configuration stored as two integers: the bits of the selected elements and
+    the bits of the deselected ones (see `ElementIndex`); the other elements are not assigned.
+
+    Unlike Configuration, whose elements are a mutable dictionary hashed on every call,
+    the hash is computed once, and the equality and the set algebra (union, intersection,
+    difference, Hamming distance) are operations on integers.
+    Configurations are converted from and to the dictionaries of Configuration with
+    `from_configuration`/`from_elements` and `to_configuration`; `elements` returns the dictionary,
+    so the operations that only read the elements of a configuration accept bitset configurations.
+    """
+
+    __slots__ = ('index', 'selected', 'deselected', '_hash')
+
+    def __init__(self, index: ElementIndex, selected: int, deselected: int = 0) -> None:
+        if selected & deselected:
+            raise ValueError('An element cannot be selected and deselected.')
+        object.__setattr__(self, 'index', index)
+        object.__setattr__(self, 'selected', selected)
+        object.__setattr__(self, 'deselected', deselected)
+        object.__setattr__(self, '_hash', hash((selected, deselected)))
+
+    @classmethod
+    def from_elements(cls, index: ElementIndex, elements: dict[Any, bool]) -> 'BitsetConfiguration':
+        positions = index.positions
+        selected = index._bits(positions[element] for element, value in elements.items() if value)
+        deselected = index._bits(positions[element] for element, value in elements.items() if not value)
+        return cls(index, selected, deselected)
+
+    @classmethod
+    def from_configuration(cls, index: ElementIndex, configuration: Configuration) -> 'BitsetConfiguration':
+        return cls.from_elements(index, configuration.elements)
+
+    @classmethod
+    def from_selected(cls, index: ElementIndex, elements: Iterable[Any],
+                      complete: bool = False) -> 'BitsetConfiguration':
+        """Configuration with the given elements selected; if complete, the other ones are deselected."""
+        selected = index.bits(elements)
+        deselected = ((1 << len(index)) - 1) & ~selected if complete else 0
+        return cls(index, selected, deselected)
+
+    @property
+    def elements(self) -> dict[Any, bool]:
+        elements = {element: True for element in self.index.elements_of(self.selected)}
+        elements.update((element, False) for element in self.index.elements_of(self.deselected))
+        return elements
+
+    def to_configuration(self) -> Configuration:
+        return Configuration(self.elements)
+
+    def is_selected(self, element: Any) -> bool:
+        position = self.index.positions.get(element)
+        return position is not None and bool(self.selected >> position & 1)
+
+    def get_selected_features(self) -> set[Any]:
+        return set(self.index.elements_of(self.selected))
+
+    def is_complete(self) -> bool:
+        """Whether all the elements of the index are assigned."""
+        return (self.selected | self.deselected) == (1 << len(self.index)) - 1
+
+    def _check_index(self, other: 'BitsetConfiguration') -> None:
+        if other.index is not self.index:
+            raise ValueError('The configurations have different element indexes.')
+
+    def union(self, other: 'BitsetConfiguration') -> 'BitsetConfiguration':
+        """Elements selected in any configuration (the other assigned elements are deselected)."""
+        self._check_index(other)
+        selected = self.selected | other.selected
+        return BitsetConfiguration(self.index, selected, (self.deselected | other.deselected) & ~selected)
+
+    def intersection(self, other: 'BitsetConfiguration') -> 'BitsetConfiguration':
+        """Elements selected in both configurations (the other assigned elements are deselected)."""
+        self._check_index(other)
+        selected = self.selected & other.selected
+        return BitsetConfiguration(self.index, selected,
+                                   (self.selected | self.deselected | other.selected | other.deselected) & ~selected)
+
+    def difference(self, other: 'BitsetConfiguration') -> 'BitsetConfiguration':
+        """Elements selected in this configuration but not in the other one
+        (the other elements assigned in this configuration are deselected)."""
+        self._check_index(other)
+        selected = self.selected & ~other.selected
+        return BitsetConfiguration(self.index, selected, (self.selected | self.deselected) & ~selected)
+
+    def hamming_distance(self, other: 'BitsetConfiguration') -> int:
+        """Number of elements selected in only one of the configurations."""
+        self._check_index(other)
+        return (self.selected ^ other.selected).bit_count()
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('BitsetConfiguration is immutable.')
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (BitsetConfiguration, (self.index, self.selected, self.deselected))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitsetConfiguration):
+            return (self._hash == other._hash and self.selected == other.selected
+                    and self.deselected == other.deselected and self.index is other.index)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __len__(self) -> int:
+        return self.selected.bit_count()
+
+    def __str__(self) -> str:
+        return str(self.elements)
@@ -1,2 +1,30 @@
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
+
+
 def extract_filename_extension(filename: str) -> str:
     return filename.split('.')[-1]
+
+
+def iter_limited(items: Iterable[Any],
+                 limit: Optional[int] = None,
+                 batch_size: Optional[int] = None) -> Iterator[Any]:
+    """Yield at most `limit` items, one by one or in lists of `batch_size` items.
+
+    The source iterator is closed when the limit is reached or the consumer stops
+    iterating, so generators holding resources (e.g., solvers) release them.
+    """
+    source = iter(items)
+    try:
+        limited = source if limit is None else islice(source, limit)
+        if batch_size is None:
+            yield from limited
+        else:
+            batch = list(islice(limited, batch_size))
+            while batch:
+                yield batch
+                batch = list(islice(limited, batch_size))
+    finally:
+        close = getattr(source, 'close', None)
+        if close is not None:
+            close()
@@ -1,4 +1,13 @@
-from dd.autoref import BDD, Function
+import time
+from typing import Optional
+
+from dd import autoref
+from dd.autoref import Function
+
+try:
+    from dd import cudd
+except ImportError:  # dd installed without the CUDD bindings
+    cudd = None
 
 from famapy.core.models import VariabilityModel
 
@@ -9,8 +18,14 @@ class BDDModel(VariabilityModel):
     """A Binary Decision Diagram (BDD) representation of the feature model given as a CNF formula.
 
     It relies on the dd module: https://pypi.org/project/dd/
+    The BDD manager is the CUDD one (`dd.cudd`) when dd is installed with the CUDD bindings,
+    and the pure Python one (`dd.autoref`) otherwise, unless the backend is given.
+    Both managers have the same interface; the differences in the traversal of the nodes
+    are hidden by the integer references (see `reference` and `succ`).
     """
 
+    BACKENDS = ('autoref', 'cudd')
+
     CNF_NOTATION = TextCNFNotation.JAVA_SHORT
     NOT = CNF_NOTATION.value[CNFLogicConnective.NOT]
     AND = CNF_NOTATION.value[CNFLogicConnective.AND]
@@ -20,9 +35,27 @@ class BDDModel(VariabilityModel):
     def get_extension() -> str:
         return 'bdd'
 
-    def __init__(self):
-        self.bdd = BDD()  # BDD manager
+    @staticmethod
+    def available_backends() -> list[str]:
+        return [backend for backend in BDDModel.BACKENDS if backend != 'cudd' or cudd is not None]
+
+    def __init__(self, backend: Optional[str] = None):
+        if backend is None:
+            backend = 'autoref' if cudd is None else 'cudd'
+        if backend not in BDDModel.BACKENDS:
+            raise ValueError(f'Unknown BDD backend: {backend}.')
+        if backend == 'cudd' and cudd is None:
+            raise ValueError('The CUDD backend is not available (dd is installed without dd.cudd).')
+        self.backend = backend
+        self.bdd = cudd.BDD() if backend == 'cudd' else autoref.BDD()  # BDD manager
+        if backend == 'cudd':
+            # As in dd.autoref, the variables are only reordered on request (see `reorder`)
+            self.bdd.configure(reordering=False)
+        # Nodes and successors of the references of the last traversal (see `reachable_references`)
+        self._nodes: dict[int, Function] = {}
+        self._succ: dict[int, tuple[int, int, int]] = {}
         self.textual_cnf_formula = None
+        self.cnf_formula = None
         self.root = None
         self.variables = []
 
@@ -47,6 +80,114 @@ class BDDModel(VariabilityModel):
 
         # self.root = self.bdd.var(self.bdd.var_at_level(0))
         
+    def from_clauses(self, clauses: list[list[int]], variables: list[str],
+                     order: list[str] = None, reorder: bool = False) -> dict[str, float]:
+        """Build the BDD directly from the clauses, without a textual formula.
+
+        The literal `i` (`-i`) is the variable `variables[i-1]` (negated).
+        Literals greater than the number of variables are auxiliary variables (e.g., of cardinality
+        encodings): they are existentially quantified, so the BDD is only over the variables
+        (see `_projected_conjunct`).
+        The variables are declared (and ordered) as in `order`, or as in `variables` by default.
+        Clauses are sorted by their first and last variables, so clauses over close variables
+        (e.g., the clauses of a relation) are conjoined first, and the conjunctions are combined
+        in a balanced binary tree to keep the intermediate BDDs small.
+        If `reorder` is True, the variables are reordered by sifting once the BDD is built.
+
+        Return the statistics of the construction: number of clauses, time (in seconds),
+        peak number of nodes in the manager, and number of nodes of the resulting BDD.
+        """
+        start_time = time.time()
+        self.variables = variables
+        for v in (self.variables if order is None else order):
+            self.bdd.declare(v)
+
+        nodes = {}
+        levels = {}
+        for i, v in enumerate(self.variables, 1):
+            nodes[i] = self.bdd.var(v)
+            nodes[-i] = ~nodes[i]
+            levels[i] = levels[-i] = self.bdd.level_of_var(v)
+
+        nof_vars = len(self.variables)
+        plain_clauses = [clause for clause in clauses if all(abs(literal) <= nof_vars for literal in clause)]
+        keyed_conjuncts = []  # (first and last levels, conjunct)
+        for clause in plain_clauses:
+            disjunction = self.bdd.false
+            for literal in sorted(clause, key=levels.get, reverse=True):  # bottom-up
+                disjunction = disjunction | nodes[literal]
+            keyed_conjuncts.append(((min(map(levels.get, clause), default=0),
+                                     max(map(levels.get, clause), default=0)), disjunction))
+        if len(plain_clauses) < len(clauses):
+            for component in _auxiliary_components(clauses, nof_vars):
+                support = {levels[literal] for clause in component for literal in clause if abs(literal) <= nof_vars}
+                keyed_conjuncts.append(((min(support, default=0), max(support, default=0)),
+                                        self._projected_conjunct(component, levels)))
+        keyed_conjuncts.sort(key=lambda keyed: keyed[0])
+        conjuncts = [conjunct for _, conjunct in keyed_conjuncts]
+
+        peak_nodes = len(self.bdd)
+        while len(conjuncts) > 1:
+            pairs = [conjuncts[i] & conjuncts[i + 1] for i in range(0, len(conjuncts) - 1, 2)]
+            if len(conjuncts) % 2 == 1:
+                pairs.append(conjuncts[-1])
+            conjuncts = pairs
+            peak_nodes = max(peak_nodes, len(self.bdd))
+        self.root = conjuncts[0] if conjuncts else self.bdd.true
+        if reorder:
+            self.reorder()
+            peak_nodes = max(peak_nodes, len(self.bdd))
+
+        return {'clauses': len(clauses),
+                'time': time.time() - start_time,
+                'peak_nodes': peak_nodes,
+                'nodes': len(self.root)}
+
+    def _projected_conjunct(self, clauses: list[list[int]], levels: dict[int, int]) -> Function:
+        """Conjunction of the clauses with their auxiliary variables existentially quantified.
+
+        The clauses are conjoined in a scratch manager where each auxiliary variable is placed
+        right below the last variable it shares a clause with, and the projection is copied
+        into this manager.
+        """
+        nof_vars = len(self.variables)
+        variables = sorted({abs(literal) for clause in clauses for literal in clause})
+        position = {var: (levels[var], 0, var) for var in variables if var <= nof_vars}
+        for clause in clauses:
+            last_level = max((levels[abs(literal)] for literal in clause if abs(literal) <= nof_vars), default=-1)
+            for literal in clause:
+                if abs(literal) > nof_vars:
+                    position[abs(literal)] = max(position.get(abs(literal), (-1, 1, 0)), (last_level, 1, abs(literal)))
+        names = {var: self.variables[var - 1] for var in variables if var <= nof_vars}
+        taken = set(self.variables)
+        for var in variables:
+            if var > nof_vars:
+                names[var] = f'_aux{var}'
+                while names[var] in taken:
+                    names[var] = '_' + names[var]
+
+        scratch = BDDModel(self.backend)
+        ids = {var: i for i, var in enumerate(variables, 1)}
+        scratch.from_clauses([[ids[literal] if literal > 0 else -ids[-literal] for literal in clause]
+                              for clause in clauses],
+                             [names[var] for var in variables],
+                             order=[names[var] for var in sorted(variables, key=position.get)])
+        projection = scratch.bdd.exist([names[var] for var in variables if var > nof_vars], scratch.root)
+        return self.copy(scratch, projection)
+
+    def copy(self, source: 'BDDModel', u: Function) -> Function:
+        """Copy the function `u` of another model into this one.
+
+        The variables of `u` must be declared here in the same relative order.
+        """
+        functions = {1: self.bdd.true, -1: self.bdd.false}
+        for ref in reversed(source.reachable_references(u)):  # children before parents
+            if abs(ref) != 1:
+                level, low, high = source.succ(ref)
+                functions[ref] = self.find_or_add(self.bdd.level_of_var(source.bdd.var_at_level(level)),
+                                                  functions[low], functions[high])
+        return functions[source.reference(u)]
+
     def index(self, n: Function) -> int:
         """Position of the variable that labels the node `n` in the ordering (i.e., the level).
             
@@ -68,4 +209,142 @@ class BDDModel(VariabilityModel):
     def get_low_node(self, node: Function) -> Function:
         # TODO: check!!!
         return ~node.low if node.negated and not self.is_terminal_node(node.low) else node.low
-        
\ No newline at end of file
+        
+
+    def reorder(self, order: Optional[dict[str, int]] = None) -> None:
+        """Reorder the variables to the given levels, or by sifting if no order is given."""
+        if self.backend == 'cudd':
+            cudd.reorder(self.bdd, order)
+        else:
+            autoref.reorder(self.bdd, order)
+        self._nodes = {}
+        self._succ = {}
+
+    def let(self, values: dict[str, bool], u: Function) -> Function:
+        """Function `u` with the variables replaced by the given values."""
+        return self.bdd.let(values, u) if values else u
+
+    def count(self, u: Function, nvars: Optional[int] = None) -> int:
+        """Number of solutions of the function over `nvars` variables (all the variables by default).
+
+        CUDD counts the solutions with floating point numbers,
+        so they are counted exactly from the node counts instead.
+        """
+        nof_levels = self.nof_levels()
+        nvars = nof_levels if nvars is None else nvars
+        if self.backend != 'cudd':
+            return self.bdd.count(u, nvars=nvars)
+        count = self.bdd.count(u, nvars=nvars)
+        if count < 2 ** 53:  # exact as a floating point number
+            return int(count)
+        root = self.reference(u)
+        count = self.count_references(self.reachable_references(u))
+        return (count[root] << self.level_of(root)) >> (nof_levels - nvars)
+
+    def find_or_add(self, level: int, low: Function, high: Function) -> Function:
+        """Node at the level with the given children, which must be below the level."""
+        if self.backend == 'cudd':
+            return self.bdd.ite(self.bdd.var(self.bdd.var_at_level(level)), high, low)
+        return self.bdd.find_or_add(self.bdd.var_at_level(level), low, high)
+
+    # Traversal of the nodes through integer references.
+    # A reference is the integer of the (not complemented) node of a function, negative if
+    # the edge is complemented; the terminals are the references 1 (true) and -1 (false).
+    # The references are stable while the nodes are alive, but only the nodes of the last
+    # traversal are kept by the model (see `reachable_references`), so that the functions
+    # no longer used by the caller can be released by the manager.
+
+    def reference(self, u: Function) -> int:
+        """Integer reference of the function."""
+        regular = ~u if u.negated else u
+        ref = 1 if regular == self.bdd.true else int(regular)
+        self._nodes[ref] = regular
+        return -ref if u.negated else ref
+
+    def to_arrays(self, u: Optional[Function] = None) -> 'BDDNodeArrays':
+        """Nodes of the function `u` (the root by default) as NumPy arrays (see `BDDNodeArrays`)."""
+        from famapy.metamodels.bdd_metamodel.models.bdd_node_arrays import BDDNodeArrays  # NumPy is only needed here
+        return BDDNodeArrays(self, self.root if u is None else u)
+
+    def nof_levels(self) -> int:
+        """Number of variables in the BDD; the terminals are at this level."""
+        return len(self.bdd.vars)
+
+    def succ(self, ref: int) -> tuple[int, int, int]:
+        """Level, low and high references of a non-terminal node.
+
+        The complement of `ref` is propagated to its children,
+        so the children represent the cofactors of the function `ref`.
+        """
+        succ = self._succ.get(abs(ref))
+        if succ is None:
+            level, low, high = self.bdd.succ(self._nodes[abs(ref)])
+            succ = (level, self.reference(low), self.reference(high))
+            self._succ[abs(ref)] = succ
+        level, low, high = succ
+        if ref < 0:
+            return level, -low, -high
+        return level, low, high
+
+    def level_of(self, ref: int) -> int:
+        if abs(ref) == 1:
+            return self.nof_levels()
+        return self.succ(abs(ref))[0]
+
+    def reachable_references(self, node: Function) -> list[int]:
+        """References reachable from `node`, sorted by level (parents before children).
+
+        A node reached through both complemented and regular edges appears twice.
+        The traversal replaces the nodes kept by the previous one, so the references of
+        other functions must be traversed again before calling `succ` on them.
+        """
+        self._nodes = {}
+        self._succ = {}
+        root = self.reference(node)
+        visited = {root}
+        stack = [root]
+        while stack:
+            ref = stack.pop()
+            if abs(ref) != 1:
+                _, low, high = self.succ(ref)
+                for child in (low, high):
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append(child)
+        return sorted(visited, key=self.level_of)
+
+    def count_references(self, refs: list[int]) -> dict[int, int]:
+        """Number of solutions of each reference over the variables from its level to the last one.
+
+        `refs` must be sorted by level and closed under successors (see `reachable_references`).
+        """
+        count = {1: 1, -1: 0}
+        for ref in reversed(refs):
+            if abs(ref) != 1:
+                level, low, high = self.succ(ref)
+                count[ref] = ((count[low] << (self.level_of(low) - level - 1))
+                              + (count[high] << (self.level_of(high) - level - 1)))
+        return count
+
+
+def _auxiliary_components(clauses: list[list[int]], nof_vars: int) -> list[list[list[int]]]:
+    """Clauses with auxiliary variables (greater than `nof_vars`), grouped by shared auxiliary variables."""
+    parent = {}
+
+    def find(var: int) -> int:
+        while parent.setdefault(var, var) != var:
+            parent[var] = parent[parent[var]]
+            var = parent[var]
+        return var
+
+    auxiliary_clauses = []
+    for clause in clauses:
+        auxiliary = [abs(literal) for literal in clause if abs(literal) > nof_vars]
+        if auxiliary:
+            auxiliary_clauses.append((auxiliary[0], clause))
+            for var in auxiliary[1:]:
+                parent[find(var)] = find(auxiliary[0])
+    components = {}
+    for var, clause in auxiliary_clauses:
+        components.setdefault(find(var), []).append(clause)
+    return list(components.values())
@@ -0,0 +1,239 @@
+from typing import Optional
+
+import numpy as np
+
+from dd.autoref import Function
+
+
+class BDDNodeArrays:
+    """The nodes of a BDD function flattened into NumPy arrays.
+
+    The (not complemented) nodes reachable from the function are sorted by level, so the
+    parents are before their children and the 1-terminal node is the last one.
+    For each node, the arrays store its level, the indexes of its low and high children,
+    and whether each edge is complemented.
+    The nodes of each level are contiguous (see `level_slice`), so the analyses below are
+    computed with a NumPy pass per level instead of a Python step per node,
+    and without recursion, whatever the size of the BDD.
+
+    Counts are exact: they are int64 arrays when the number of variables allows it,
+    and arrays of Python integers otherwise.
+    The array of a function is built with `BDDModel.to_arrays`.
+    """
+
+    def __init__(self, bdd_model: 'BDDModel', u: Function) -> None:
+        self.nof_levels = bdd_model.nof_levels()
+        refs = bdd_model.reachable_references(u)  # sorted by level
+        root = bdd_model.reference(u)
+
+        # Not complemented nodes, the 1-terminal node (at the last level) being the last one
+        nodes = list(dict.fromkeys(abs(ref) for ref in refs))
+        succ = {node: bdd_model.succ(node) for node in nodes[:-1]}
+        index = {node: i for i, node in enumerate(nodes)}
+        size = len(nodes)
+        self.level = np.full(size, self.nof_levels, dtype=np.int64)
+        self.low = np.full(size, size - 1, dtype=np.int64)
+        self.high = np.full(size, size - 1, dtype=np.int64)
+        self.low_complement = np.zeros(size, dtype=bool)
+        self.high_complement = np.zeros(size, dtype=bool)
+        for i, node in enumerate(nodes[:-1]):
+            level, low, high = succ[node]
+            self.level[i] = level
+            self.low[i] = index[abs(low)]
+            self.high[i] = index[abs(high)]
+            self.low_complement[i] = low < 0
+            self.high_complement[i] = high < 0
+        self.root = index[abs(root)]
+        self.root_complement = root < 0
+        # Nodes of the level `l` are in [level_starts[l], level_starts[l+1])
+        self.level_starts = np.searchsorted(self.level, np.arange(self.nof_levels + 2))
+        self.level_vars = [bdd_model.bdd.var_at_level(level) for level in range(self.nof_levels)]
+
+        # Values of the counts: int64 while the number of assignments fits
+        self.dtype = np.int64 if self.nof_levels < 62 else object
+        self._counts = None
+
+    def __len__(self) -> int:
+        return len(self.level)
+
+    def level_slice(self, level: int) -> slice:
+        return slice(self.level_starts[level], self.level_starts[level + 1])
+
+    def _powers_of_two(self, exponents: np.ndarray) -> np.ndarray:
+        return np.left_shift(np.ones(len(exponents), dtype=self.dtype), exponents.astype(self.dtype))
+
+    def _edge_counts(self, children: np.ndarray, complemented: np.ndarray) -> np.ndarray:
+        """Solutions of the edges over the variables from the level of the children."""
+        counts = self.counts()[children]
+        return np.where(complemented, self._assignments[children] - counts, counts)
+
+    def counts(self) -> np.ndarray:
+        """Number of solutions of each node over the variables from its level to the last one."""
+        if self._counts is None:
+            self._assignments = self._powers_of_two(self.nof_levels - self.level)
+            self._counts = np.zeros(len(self), dtype=self.dtype)
+            self._counts[-1] = 1
+            for level in reversed(range(self.nof_levels)):
+                nodes = self.level_slice(level)
+                if nodes.start == nodes.stop:
+                    continue
+                self._counts[nodes] = (self._branch_counts(level, nodes, False)
+                                       + self._branch_counts(level, nodes, True))
+        return self._counts
+
+    def _branch_counts(self, level: int, nodes: slice, high: bool,
+                       complemented: Optional[np.ndarray] = None) -> np.ndarray:
+        """Solutions of the nodes through a branch, including the variables skipped by the edges.
+
+        The nodes are complemented where `complemented` is True.
+        """
+        children = self.high[nodes] if high else self.low[nodes]
+        edge_complement = self.high_complement[nodes] if high else self.low_complement[nodes]
+        if complemented is not None:
+            edge_complement = edge_complement ^ complemented
+        gaps = self.level[children] - level - 1
+        return np.left_shift(self._edge_counts(children, edge_complement), gaps.astype(self.dtype))
+
+    def count(self) -> int:
+        """Number of solutions of the function over all the variables."""
+        counts = self.counts()
+        solutions = int(self._assignments[self.root] - counts[self.root] if self.root_complement
+                        else counts[self.root])
+        return solutions << int(self.level[self.root])
+
+    def feature_inclusion_counts(self) -> tuple[int, list[int]]:
+        """Number of solutions and, for each level, number of solutions with its variable selected.
+
+        The assignments of the variables above each node that reach it are propagated top-down,
+        separately for the paths that reach the node through an even or an odd number of
+        complemented edges, since they lead to the solutions of the node or of its complement.
+        """
+        nof_levels = self.nof_levels
+        counts = self.counts()
+        total = self.count()
+        root_level = int(self.level[self.root])
+        paths = np.zeros((2, len(self)), dtype=self.dtype)  # even and odd complemented paths
+        paths[int(self.root_complement), self.root] = 1 << root_level
+        selected = [0] * (nof_levels + 1)
+        skipped = np.zeros(nof_levels + 1, dtype=self.dtype)  # Half of the solutions select a skipped variable
+        if root_level > 0:
+            skipped[0] += total >> 1
+            skipped[root_level] -= total >> 1
+
+        for level in range(nof_levels):
+            nodes = self.level_slice(level)
+            if nodes.start == nodes.stop:
+                continue
+            for high in (False, True):
+                children = self.high[nodes] if high else self.low[nodes]
+                edge_complement = self.high_complement[nodes] if high else self.low_complement[nodes]
+                gaps = (self.level[children] - level - 1).astype(self.dtype)
+                even = np.left_shift(np.where(edge_complement, paths[1, nodes], paths[0, nodes]), gaps)
+                odd = np.left_shift(np.where(edge_complement, paths[0, nodes], paths[1, nodes]), gaps)
+                np.add.at(paths[0], children, even)
+                np.add.at(paths[1], children, odd)
+                solutions = even * counts[children] + odd * (self._assignments[children] - counts[children])
+                if high:
+                    selected[level] += int(solutions.sum())
+                with_gap = gaps > 0
+                if with_gap.any():
+                    halves = solutions[with_gap] >> 1
+                    skipped[level + 1] += halves.sum()
+                    np.subtract.at(skipped, self.level[children][with_gap], halves)
+
+        accumulated = 0
+        for level in range(nof_levels):
+            accumulated += int(skipped[level])
+            selected[level] += accumulated
+        return total, selected[:nof_levels]
+
+    def product_distribution(self, fixed_levels: frozenset[int] = frozenset()) -> list[int]:
+        """Number of solutions with 0, 1, ..., n selected variables, being n the free variables.
+
+        The variables at the `fixed_levels` are not counted (the function must not depend on them).
+        As in `BDDProductDistribution`, the distribution of each node is encoded in a big integer,
+        with a coefficient every `nof_levels + 1` bits.
+        """
+        nof_levels = self.nof_levels
+        free_above = np.zeros(nof_levels + 1, dtype=np.int64)
+        free_above[1:] = np.cumsum([level not in fixed_levels for level in range(nof_levels)])
+        nof_free = int(free_above[nof_levels])
+        bits = nof_levels + 1
+        x = 1 << bits
+        binomials = {}
+
+        def binomial(nof_vars: np.ndarray) -> np.ndarray:
+            for n in np.unique(nof_vars):
+                if n not in binomials:
+                    binomials[n] = (1 + x) ** int(n)
+            return np.array([binomials[n] for n in nof_vars.tolist()], dtype=object)
+
+        all_free = binomial(nof_free - free_above[self.level])  # assignments of the free variables below
+        dist = np.zeros(len(self), dtype=object)
+        dist[-1] = 1
+
+        def edge_dist(children: np.ndarray, complemented: np.ndarray) -> np.ndarray:
+            return np.where(complemented, all_free[children] - dist[children], dist[children])
+
+        for level in reversed(range(nof_levels)):
+            nodes = self.level_slice(level)
+            if nodes.start == nodes.stop:
+                continue
+            low, high = self.low[nodes], self.high[nodes]
+            dist[nodes] = (edge_dist(low, self.low_complement[nodes])
+                           * binomial(free_above[self.level[low]] - free_above[level + 1])
+                           + x * edge_dist(high, self.high_complement[nodes])
+                           * binomial(free_above[self.level[high]] - free_above[level + 1]))
+
+        root = np.array([self.root])
+        encoded = int(edge_dist(root, np.array([self.root_complement]))[0]
+                      * binomial(free_above[self.level[root]])[0])
+        mask = x - 1
+        return [(encoded >> (bits * k)) & mask for k in range(nof_free + 1)]
+
+    def high_probabilities(self) -> np.ndarray:
+        """Probability of taking the high branch of each node in a uniform random walk.
+
+        The first row is for the nodes reached through an even number of complemented edges,
+        and the second one for the nodes reached through an odd number (i.e., the complements).
+        """
+        probabilities = np.zeros((2, len(self)))
+        counts = self.counts()
+        for level in range(self.nof_levels):
+            nodes = self.level_slice(level)
+            if nodes.start == nodes.stop:
+                continue
+            for complemented in (False, True):
+                negated = np.full(nodes.stop - nodes.start, complemented)
+                solutions_high = self._branch_counts(level, nodes, True, negated)
+                total = self._branch_counts(level, nodes, False, negated) + solutions_high
+                nonzero = total > 0
+                probability = np.zeros(len(total))
+                probability[nonzero] = (solutions_high[nonzero] / total[nonzero]).astype(float)
+                probabilities[int(complemented), nodes] = probability
+        return probabilities
+
+    def random_walks(self, size: int, rng: np.random.Generator,
+                     probabilities: Optional[np.ndarray] = None) -> np.ndarray:
+        """Values (by level) of `size` uniformly random solutions, as a (size, nof_levels) boolean array.
+
+        All the walks go down the BDD at the same time, one node per step.
+        The variables skipped by the walks take the values of fair coins.
+        It raises ValueError if the function has no solutions.
+        """
+        if self.count() == 0:
+            raise ValueError('The BDD has no solutions.')
+        if probabilities is None:
+            probabilities = self.high_probabilities()
+        values = rng.random((size, self.nof_levels)) < 0.5
+        node = np.full(size, self.root)
+        odd = np.full(size, self.root_complement)
+        walking = np.nonzero(self.level[node] < self.nof_levels)[0]
+        while len(walking) > 0:
+            current, current_odd = node[walking], odd[walking]
+            high = rng.random(len(walking)) < probabilities[current_odd.astype(np.int64), current]
+            values[walking, self.level[current]] = high
+            node[walking] = np.where(high, self.high[current], self.low[current])
+            odd[walking] = current_odd ^ np.where(high, self.high_complement[current], self.low_complement[current])
+            walking = walking[self.level[node[walking]] < self.nof_levels]
+        return values
@@ -1,9 +1,13 @@
 from .bdd_products import BDDProducts
 from .bdd_products_number import BDDProductsNumber
 from .bdd_sampling import BDDSampling
+from .bdd_parallel_sampling import BDDParallelSampling
 from .bdd_product_distribution_bf import BDDProductDistributionBF
+from .bdd_product_distribution import BDDProductDistribution
 from .bdd_feature_inclusion_probability_bf import BDDFeatureInclusionProbabilityBF
+from .bdd_feature_inclusion_probability import BDDFeatureInclusionProbability
 
 
-__all__ = ['BDDProducts', 'BDDProductsNumber', 'BDDSampling',
-           'BDDProductDistributionBF', 'BDDFeatureInclusionProbabilityBF']
\ No newline at end of file
+__all__ = ['BDDProducts', 'BDDProductsNumber', 'BDDSampling', 'BDDParallelSampling',
+           'BDDProductDistributionBF', 'BDDFeatureInclusionProbabilityBF',
+           'BDDFeatureInclusionProbability', 'BDDProductDistribution']
\ No newline at end of file
@@ -0,0 +1,126 @@
+import random
+from multiprocessing import Pool
+from typing import Iterator, Optional
+
+from famapy.core.models import Configuration
+from famapy.core.operations import Sampling
+
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations import BDDProductsNumber
+from famapy.metamodels.bdd_metamodel.operations.bdd_sampling import (
+    distinct_ranks,
+    node_counts,
+    node_probabilities,
+    random_walk,
+    unrank
+)
+
+
+class BDDParallelSampling(Sampling):
+    """Uniform Random Sampling (URS) using a BDD and a pool of worker processes.
+
+    The sample is split in chunks of `chunk_size` configurations which are generated by the
+    workers with the same algorithms as `BDDSampling`:
+      - with replacement, each chunk is generated by random walks with its own generator,
+        seeded from the seed of the sampling and the index of the chunk;
+      - without replacement, distinct ranks are drawn in the main process and each chunk of
+        ranks is unranked by a worker.
+    Thus, the same seed gives the same sample regardless of the number of processes.
+
+    The BDD is not shipped to the workers: the node table needed by the walks (or by the
+    unranking) is computed once and sent to each worker when the pool starts.
+    The chunks are merged in order, and yielded as soon as they are finished (see `iter_sample`).
+    """
+
+    def __init__(self, size: int, with_replacement: bool=False,
+                 partial_configuration: Configuration=None,
+                 processes: Optional[int]=None,
+                 chunk_size: int=10000) -> None:
+        self.result = []
+        self.bdd_model = None
+        self.size = size
+        self.with_replacement = with_replacement
+        self.partial_configuration = partial_configuration
+        self.processes = processes  # number of workers (the number of CPUs by default)
+        self.chunk_size = chunk_size
+        self.seed = None
+
+    def execute(self, bdd_model: BDDModel) -> 'BDDParallelSampling':
+        self.bdd_model = bdd_model
+        self.result = self.sample(self.size, self.with_replacement, self.partial_configuration)
+        return self
+
+    def get_result(self) -> list[Configuration]:
+        return self.result
+
+    def set_seed(self, seed: int) -> None:
+        """Seed of the sampling, for reproducible samples."""
+        self.seed = seed
+
+    def sample(self, size: int, with_replacement: bool=False,
+               partial_configuration: Configuration=None) -> list[Configuration]:
+        return list(self.iter_sample(size, with_replacement, partial_configuration))
+
+    def iter_sample(self, size: int, with_replacement: bool=False,
+                    partial_configuration: Configuration=None) -> Iterator[Configuration]:
+        """Yield the configurations of the sample as the chunks are finished by the workers."""
+        nof_configs = BDDProductsNumber(partial_configuration).execute(self.bdd_model).get_result()
+        if size < 0 or (size > nof_configs and not with_replacement) or (size > 0 and nof_configs == 0):
+            raise ValueError('Sample larger than population or is negative.')
+
+        seed = random.getrandbits(64) if self.seed is None else self.seed
+        values = {} if partial_configuration is None else (
+                {f: selected for f, selected in partial_configuration.elements.items()})
+        u = self.bdd_model.let(values, self.bdd_model.root)
+        level_vars = [self.bdd_model.bdd.var_at_level(level) for level in range(self.bdd_model.nof_levels())]
+
+        if with_replacement:
+            table = node_probabilities(self.bdd_model, u)
+            free_levels = None
+            tasks = [(seed, index, min(self.chunk_size, size - start))
+                     for index, start in enumerate(range(0, size, self.chunk_size))]
+        else:
+            fixed_levels = {self.bdd_model.bdd.level_of_var(f) for f in values}
+            table = node_counts(self.bdd_model, u, fixed_levels)
+            free_levels = [level for level in range(len(level_vars)) if level not in fixed_levels]
+            ranks = distinct_ranks(nof_configs, size, _chunk_random(seed, -1))
+            tasks = [ranks[start:start + self.chunk_size] for start in range(0, size, self.chunk_size)]
+
+        with Pool(self.processes, initializer=_init_worker,
+                  initargs=(table, self.bdd_model.reference(u), level_vars, free_levels, values)) as pool:
+            for chunk in pool.imap(_sample_chunk, tasks):
+                yield from chunk
+
+
+# Worker processes
+
+_worker = {}  # state of the worker, set by `_init_worker`
+
+
+def _chunk_random(seed: int, index: int) -> random.Random:
+    """Independent generator of a chunk (-1 for the main process)."""
+    return random.Random(f'{seed}:{index}')
+
+
+def _init_worker(table: dict, root: int, level_vars: list[str],
+                 free_levels: Optional[list[int]], values: dict[str, bool]) -> None:
+    _worker.update(table=table, root=root, level_vars=level_vars,
+                   free_levels=free_levels, values=values)
+
+
+def _sample_chunk(task) -> list[Configuration]:
+    table, root = _worker['table'], _worker['root']
+    level_vars, values = _worker['level_vars'], _worker['values']
+    if _worker['free_levels'] is None:
+        seed, index, size = task
+        rng = _chunk_random(seed, index)
+        solutions = (random_walk(table, root, len(level_vars), rng) for _ in range(size))
+    else:
+        solutions = (unrank(table, root, rank, _worker['free_levels']) for rank in task)
+
+    configurations = []
+    for bits in solutions:
+        config = dict(zip(level_vars, bits))
+        config.update(values)
+        configurations.append(Configuration(config))
+    return configurations
@@ -0,0 +1,95 @@
+from famapy.core.models import Configuration
+
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations.interfaces import ProductDistribution
+
+
+class BDDProductDistribution(ProductDistribution):
+    """The Product Distribution (PD) algorithm determines the number of solutions
+    having a given number of variables.
+
+    This implementation traverses the BDD nodes once, bottom-up, computing the distribution
+    of each node from the distributions of its children.
+    The variables skipped by an edge are free, so the distribution of the child is convolved
+    with the binomial coefficients of the number of skipped variables.
+
+    The distributions are encoded as big integers (one coefficient every `n+1` bits,
+    being `n` the number of variables), so the convolutions are integer multiplications
+    and the binomial coefficients are the powers of (1 + 2^(n+1)).
+    The distribution of a complemented edge is obtained from the distribution of the node.
+
+    It also supports the computation of the distribution from a partial configuration.
+
+    Ref.: [Heradio et al. 2019. Supporting the Statistical Analysis of Variability Models. SPLC.
+    (https://doi.org/10.1109/ICSE.2019.00091)]
+    """
+
+    def __init__(self, partial_configuration: Configuration=None) -> None:
+        self.result = []
+        self.partial_configuration = partial_configuration
+
+    def execute(self, bdd_model: BDDModel) -> 'BDDProductDistribution':
+        self.bdd_model = bdd_model
+        self.result = self.product_distribution(self.partial_configuration)
+        return self
+
+    def get_result(self) -> list[int]:
+        return self.result
+
+    def product_distribution(self, partial_configuration: Configuration=None) -> list[int]:
+        """It accounts for how many solutions have no variables, one variable, two variables, ..., all variables."""
+        values = {} if partial_configuration is None else (
+            {f: selected for f, selected in partial_configuration.elements.items()})
+        u = self.bdd_model.let(values, self.bdd_model.root)
+
+        nof_levels = self.bdd_model.nof_levels()
+        fixed_levels = {self.bdd_model.bdd.level_of_var(f) for f in values}
+        # Number of free (not fixed) variables above each level
+        free_above = [0] * (nof_levels + 1)
+        for level in range(nof_levels):
+            free_above[level + 1] = free_above[level] + (level not in fixed_levels)
+        nof_free = free_above[nof_levels]
+
+        bits = nof_levels + 1  # a coefficient is at most 2^nof_levels
+        x = 1 << bits
+        binomials = {}  # binomials[g] encodes the coefficients of (1 + x)^g
+
+        def binomial(nof_vars: int) -> int:
+            if nof_vars not in binomials:
+                binomials[nof_vars] = (1 + x) ** nof_vars
+            return binomials[nof_vars]
+
+        levels = {}
+        dist = {1: 1}  # distributions of the regular (not complemented) nodes
+
+        def get_dist(ref: int) -> int:
+            if ref > 0:
+                return dist[ref]
+            if ref == -1:
+                return 0
+            # Complemented edge: all the assignments minus the solutions of the node
+            return binomial(nof_free - free_above[levels[-ref]]) - dist[-ref]
+
+        def free_between(level: int, child: int) -> int:
+            child_level = nof_levels if abs(child) == 1 else levels[abs(child)]
+            return free_above[child_level] - free_above[level + 1]
+
+        nodes = sorted({abs(ref) for ref in self.bdd_model.reachable_references(u)} - {1},
+                       key=self.bdd_model.level_of, reverse=True)
+        for node in nodes:
+            levels[node] = self.bdd_model.level_of(node)
+        for node in nodes:  # children before parents
+            level, low, high = self.bdd_model.succ(node)
+            dist[node] = (get_dist(low) * binomial(free_between(level, low))
+                          + x * get_dist(high) * binomial(free_between(level, high)))
+
+        root = self.bdd_model.reference(u)
+        root_level = nof_levels if abs(root) == 1 else levels[abs(root)]
+        encoded = get_dist(root) * binomial(free_above[root_level])
+
+        nof_selected = sum(1 for selected in values.values() if selected)
+        result = [0] * (len(self.bdd_model.variables) + 1)
+        mask = x - 1
+        for k in range(nof_free + 1):
+            result[k + nof_selected] = (encoded >> (bits * k)) & mask
+        return result
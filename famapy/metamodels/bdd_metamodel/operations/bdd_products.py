@@ -1,5 +1,8 @@
+from typing import Iterator, Optional
+
 from famapy.core.models import Configuration
 from famapy.core.operations import Products
+from famapy.core.utils import iter_limited
 
 from famapy.metamodels.bdd_metamodel.models.bdd_model import BDDModel
 
@@ -23,19 +26,31 @@ class BDDProducts(Products):
         return self.result
 
     def get_products(self, partial_configuration: Configuration=None) -> list[Configuration]:
+        return list(self._enumerate_products(partial_configuration))
+
+    def iter_products(self,
+                      bdd_model: BDDModel,
+                      limit: Optional[int] = None,
+                      batch_size: Optional[int] = None) -> Iterator[Configuration]:
+        """Products (from the partial configuration, if any) computed lazily.
+
+        At most `limit` products are yielded, one by one or in lists of `batch_size` products.
+        """
+        self.bdd_model = bdd_model
+        return iter_limited(self._enumerate_products(self.partial_configuration), limit, batch_size)
+
+    def _enumerate_products(self, partial_configuration: Configuration=None) -> Iterator[Configuration]:
         if partial_configuration is None:
             u = self.bdd_model.root
             care_vars = self.bdd_model.variables
             elements = {}
         else:
             values = {f: selected for f, selected in partial_configuration.elements.items()}
-            u = self.bdd_model.bdd.let(values, self.bdd_model.root)
+            u = self.bdd_model.let(values, self.bdd_model.root)
             care_vars = set(self.bdd_model.variables) - values.keys()
             elements = partial_configuration.elements
         
-        configs = []
         for c in self.bdd_model.bdd.pick_iter(u, care_vars=care_vars):
             features = {f: True for f in c.keys() if c[f]}
             features = features | elements
-            configs.append(Configuration(features))
-        return configs
+            yield Configuration(features)
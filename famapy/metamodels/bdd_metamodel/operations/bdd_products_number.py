@@ -29,10 +29,10 @@ class BDDProductsNumber(ProductsNumber):
             n_vars = len(self.bdd_model.variables)
         else:
             values = {f: selected for f, selected in partial_configuration.elements.items()}
-            u = self.bdd_model.bdd.let(values, self.bdd_model.root)
+            u = self.bdd_model.let(values, self.bdd_model.root)
             n_vars = len(self.bdd_model.variables) - len(values)
         
-        return self.bdd_model.bdd.count(u, nvars=n_vars)
+        return self.bdd_model.count(u, nvars=n_vars)
 
     def get_products_number(self) -> int:
         return self.get_number_of_configurations()
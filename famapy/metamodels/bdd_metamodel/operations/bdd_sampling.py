@@ -1,4 +1,7 @@
-import random 
+import random
+from bisect import bisect_left
+
+from dd.autoref import Function
 
 from famapy.core.models import Configuration
 from famapy.core.operations import Sampling
@@ -9,24 +12,36 @@ from famapy.metamodels.bdd_metamodel.operations import BDDProductsNumber
 
 class BDDSampling(Sampling):
     """Uniform Random Sampling (URS) using a Binary Decision Diagram (BDD).
-    
-    This is an adaptation of 
-    [Heradio et al. 2021. 
-    Uniform and Scalable Sampling of Highly Configurable Systems. 
+
+    This is an adaptation of
+    [Heradio et al. 2021.
+    Uniform and Scalable Sampling of Highly Configurable Systems.
     Empirical Software Engineering]
     which relies on counting-based sampling inspired in the original Knuth algorithm.
 
+    The probability of taking the high branch of every node is computed once with a single
+    BDD traversal, and then each configuration is generated by a walk from the root to the
+    1-terminal node, choosing the value of the skipped variables with fair coins.
+
+    Samples without replacement draw distinct ranks in [0, N), being N the number of
+    configurations, and unrank each of them into a configuration following the solution
+    counts of the nodes, so the configurations are distinct without retrying.
+
     This implementation supports samples with and without replacement,
     as well as samples from a given partial configuration.
     """
 
-    def __init__(self, size: int, with_replacement: bool=False, 
+    def __init__(self, size: int, with_replacement: bool=False,
                  partial_configuration: Configuration=None) -> None:
         self.result = []
         self.bdd_model = None
-        self.size = size 
-        self.with_replacement = with_replacement 
+        self.size = size
+        self.with_replacement = with_replacement
         self.partial_configuration = partial_configuration
+        self.random = random  # random generator (the global one by default)
+        self._node_table = None  # ((model, root reference), node table) of the last sampled function
+        self._count_table = None  # ((model, root reference), counts table) of the last unranked function
+        self._level_vars = []  # variable at each level
 
     def execute(self, bdd_model: BDDModel) -> 'BDDSampling':
         self.bdd_model = bdd_model
@@ -36,24 +51,25 @@ class BDDSampling(Sampling):
     def get_result(self) -> list[Configuration]:
         return self.result
 
-    def sample(self, size: int, with_replacement: bool=False, 
+    def set_seed(self, seed: int) -> None:
+        """Seed of the random generator, for reproducible samples."""
+        self.random = random.Random(seed)
+
+    def sample(self, size: int, with_replacement: bool=False,
                partial_configuration: Configuration=None) -> list[Configuration]:
         nof_configs = BDDProductsNumber(partial_configuration).execute(self.bdd_model).get_result()
-        if size < 0 or (size > nof_configs and not with_replacement):
+        if size < 0 or (size > nof_configs and not with_replacement) or (size > 0 and nof_configs == 0):
             raise ValueError('Sample larger than population or is negative.')
 
-        configurations = []
-        for _ in range(size):
-            config = self.get_random_configuration(partial_configuration)
-            configurations.append(config)
+        values = {} if partial_configuration is None else (
+                {f: selected for f, selected in partial_configuration.elements.items()})
+        u = self.bdd_model.let(values, self.bdd_model.root)
 
         if not with_replacement:
-            configurations = set(configurations)
-            while len(configurations) < size:
-                config = self.get_random_configuration(partial_configuration)
-                configurations.add(config)
+            ranks = distinct_ranks(nof_configs, size, self.random)
+            return [self._unrank_configuration(u, values, rank) for rank in ranks]
 
-        return list(configurations)
+        return [self._random_configuration(u, values) for _ in range(size)]
 
     def get_random_configuration(self, partial_configuration: Configuration=None) -> Configuration:
         # Initialize the configurations and values for BDD nodes with already known features
@@ -61,26 +77,211 @@ class BDDSampling(Sampling):
                 {f: selected for f, selected in partial_configuration.elements.items()})
 
         # Set the BDD nodes with the already known features values
-        u = self.bdd_model.bdd.let(values, self.bdd_model.root)
-
-        care_vars = set(self.bdd_model.variables) - values.keys()
-        n_vars = len(care_vars)
-        for feature in care_vars:
-            # Number of configurations with the feature selected
-            v_sel = self.bdd_model.bdd.let({feature: True}, u)
-            nof_configs_var_selected = self.bdd_model.bdd.count(v_sel, nvars=n_vars-1)
-            # Number of configurations with the feature unselected
-            v_unsel = self.bdd_model.bdd.let({feature: False}, u)
-            nof_configs_var_unselected = self.bdd_model.bdd.count(v_unsel, nvars=n_vars-1)
-
-            # Randomly select or not the feature
-            selected = random.choices([True, False], 
-                                      [nof_configs_var_selected, nof_configs_var_unselected], 
-                                      k=1)[0]
-
-            # Update configuration and BDD node for the new feature
-            values[feature] = selected
-            u = self.bdd_model.bdd.let({feature: selected}, u)
-                
-            n_vars -= 1
-        return Configuration(values)
+        u = self.bdd_model.let(values, self.bdd_model.root)
+        return self._random_configuration(u, values)
+
+    def _random_configuration(self, u: Function, values: dict[str, bool]) -> Configuration:
+        key = (id(self.bdd_model), self.bdd_model.reference(u))
+        if self._node_table is None or self._node_table[0] != key:
+            self._node_table = (key, node_probabilities(self.bdd_model, u))
+            self._update_level_vars()
+        bits = random_walk(self._node_table[1], self.bdd_model.reference(u), len(self._level_vars), self.random)
+        return self._configuration(bits, values)
+
+    def _unrank_configuration(self, u: Function, values: dict[str, bool], rank: int) -> Configuration:
+        key = (id(self.bdd_model), self.bdd_model.reference(u))
+        if self._count_table is None or self._count_table[0] != key:
+            fixed_levels = {self.bdd_model.bdd.level_of_var(f) for f in values}
+            free_levels = [level for level in range(self.bdd_model.nof_levels())
+                           if level not in fixed_levels]
+            self._count_table = (key, (node_counts(self.bdd_model, u, fixed_levels), free_levels))
+            self._update_level_vars()
+        table, free_levels = self._count_table[1]
+        bits = unrank(table, self.bdd_model.reference(u), rank, free_levels)
+        return self._configuration(bits, values)
+
+    def _update_level_vars(self) -> None:
+        self._level_vars = [self.bdd_model.bdd.var_at_level(level)
+                            for level in range(self.bdd_model.nof_levels())]
+
+    def _configuration(self, bits: list[bool], values: dict[str, bool]) -> Configuration:
+        config = dict(zip(self._level_vars, bits))
+        config.update(values)
+        return Configuration(config)
+
+
+def node_probabilities(bdd_model: BDDModel, u: Function) -> dict[int, tuple[int, int, int, float]]:
+    """Table with the level, the low and high references, and the probability of
+    taking the high branch in a uniform random walk, for each node reachable from `u`.
+
+    The probability of a branch is the proportion of the solutions of the node
+    that are reached through that branch (including the skipped variables).
+    """
+    refs = bdd_model.reachable_references(u)
+    count = bdd_model.count_references(refs)
+    table = {}
+    for ref in refs:
+        if abs(ref) != 1:
+            level, low, high = bdd_model.succ(ref)
+            solutions_low = count[low] << (bdd_model.level_of(low) - level - 1)
+            solutions_high = count[high] << (bdd_model.level_of(high) - level - 1)
+            total = solutions_low + solutions_high
+            probability = solutions_high / total if total > 0 else 0.0
+            table[ref] = (level, low, high, probability)
+    return table
+
+
+def random_walk(table: dict[int, tuple[int, int, int, float]],
+                root: int,
+                nof_levels: int,
+                rng: random.Random) -> list[bool]:
+    """Values (by level) of a uniformly random solution of the node `root`.
+
+    The variables that are not in the path from the root to the 1-terminal node
+    take random values.
+    """
+    if root == -1:
+        raise ValueError('The BDD has no solutions.')
+    bits = [False] * nof_levels
+    if nof_levels > 0:
+        bits = [bit == '1' for bit in format(rng.getrandbits(nof_levels), f'0{nof_levels}b')]
+    ref = root
+    while ref != 1:
+        level, low, high, probability = table[ref]
+        if rng.random() < probability:
+            bits[level] = True
+            ref = high
+        else:
+            bits[level] = False
+            ref = low
+    return bits
+
+
+def node_counts(bdd_model: BDDModel,
+                u: Function,
+                fixed_levels: set[int]=frozenset()) -> dict[int, tuple[int, int, int, int]]:
+    """Table with the level, the low and high references, and the number of solutions,
+    for each reference reachable from `u` (including the terminals).
+
+    The solutions of a reference are counted over the variables from its level to the
+    last one, excluding the variables at `fixed_levels`, which must not appear in `u`.
+    """
+    nof_levels = bdd_model.nof_levels()
+    free_above = [0] * (nof_levels + 1)  # number of free variables above each level
+    for level in range(nof_levels):
+        free_above[level + 1] = free_above[level] + (level not in fixed_levels)
+
+    table = {1: (nof_levels, 1, 1, 1), -1: (nof_levels, -1, -1, 0)}
+    refs = bdd_model.reachable_references(u)
+    for ref in reversed(refs):  # children before parents
+        if abs(ref) != 1:
+            level, low, high = bdd_model.succ(ref)
+            count = 0
+            for child in (low, high):
+                child_level, _, _, child_count = table[child]
+                count += child_count << (free_above[child_level] - free_above[level + 1])
+            table[ref] = (level, low, high, count)
+    return table
+
+
+def unrank(table: dict[int, tuple[int, int, int, int]],
+           root: int,
+           rank: int,
+           free_levels: list[int]) -> list[bool]:
+    """Values (by level) of the solution of the node `root` with the given rank.
+
+    The solutions are ranked in lexicographic order of the values of the free levels
+    (False before True, from the first level to the last one),
+    so the rank must be in [0, N), being N the number of solutions of `root` over the
+    `free_levels` (see `node_counts`). The values of the other levels are False.
+    """
+    nof_levels = table[1][0]
+    level, _, _, count = table[root]
+    total = count << bisect_left(free_levels, level)
+    if not 0 <= rank < total:
+        raise ValueError(f'Rank {rank} out of range [0, {total}).')
+
+    bits = [False] * nof_levels
+    skipped, rank = divmod(rank, count)
+    _set_levels(bits, free_levels[:bisect_left(free_levels, level)], skipped)
+    ref = root
+    while ref != 1:
+        level, low, high, _ = table[ref]
+        child_level, _, _, child_count = table[low]
+        start = bisect_left(free_levels, level + 1)
+        end = bisect_left(free_levels, child_level)
+        solutions_low = child_count << (end - start)
+        if rank < solutions_low:
+            ref = low
+        else:
+            rank -= solutions_low
+            bits[level] = True
+            ref = high
+            child_level, _, _, child_count = table[high]
+            end = bisect_left(free_levels, child_level)
+        skipped, rank = divmod(rank, child_count)
+        _set_levels(bits, free_levels[start:end], skipped)
+    return bits
+
+
+def rank(table: dict[int, tuple[int, int, int, int]],
+         root: int,
+         bits: list[bool],
+         free_levels: list[int]) -> int:
+    """Rank of the solution of the node `root` with the given values (by level).
+
+    It is the inverse of `unrank`: the values of the levels that are not free are ignored.
+    """
+    level, _, _, count = table[root]
+    result = _get_levels(bits, free_levels[:bisect_left(free_levels, level)]) * count
+    ref = root
+    while abs(ref) != 1:
+        level, low, high, _ = table[ref]
+        start = bisect_left(free_levels, level + 1)
+        if bits[level]:
+            low_level, _, _, low_count = table[low]
+            result += low_count << (bisect_left(free_levels, low_level) - start)
+            ref = high
+        else:
+            ref = low
+        child_level, _, _, child_count = table[ref]
+        skipped = _get_levels(bits, free_levels[start:bisect_left(free_levels, child_level)])
+        result += skipped * child_count
+    if ref == -1:
+        raise ValueError('The values are not a solution.')
+    return result
+
+
+def _get_levels(bits: list[bool], levels: list[int]) -> int:
+    """Number whose binary digits are the values of the levels (the first level is the most significant)."""
+    value = 0
+    for level in levels:
+        value = (value << 1) | bits[level]
+    return value
+
+
+def _set_levels(bits: list[bool], levels: list[int], value: int) -> None:
+    """Assign the binary digits of `value` to the levels (the first level is the most significant)."""
+    for level in reversed(levels):
+        bits[level] = bool(value & 1)
+        value >>= 1
+
+
+def distinct_ranks(population: int, k: int, rng: random.Random) -> list[int]:
+    """k distinct ranks uniformly chosen from [0, population), in random order.
+
+    It uses Floyd's algorithm, so it draws exactly k random numbers and it does not
+    need the population to fit in memory (or in a machine word).
+    """
+    if not 0 <= k <= population:
+        raise ValueError('Sample larger than population or is negative.')
+    ranks = set()
+    result = []
+    for j in range(population - k, population):
+        rank = rng.randrange(j + 1)
+        if rank in ranks:
+            rank = j
+        ranks.add(rank)
+        result.append(rank)
+    rng.shuffle(result)
+    return result
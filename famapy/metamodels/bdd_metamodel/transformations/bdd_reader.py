@@ -0,0 +1,84 @@
+from typing import Optional
+
+from famapy.core.transformations import TextToModel
+
+from famapy.metamodels.bdd_metamodel.models.bdd_model import BDDModel
+
+
+class BDDReader(TextToModel):
+    """Load a BDD dumped in dddmp format (version 2.0 or 3.0, ASCII mode) into a BDDModel.
+
+    The variables are declared following the '.orderedvarnames' field, so the BDD keeps
+    the variable ordering of the dump.
+    The names of the variables are restored from the '.varnames' field (version 3.0),
+    or from the '.suppvarnames' and '.ids' fields (version 2.0).
+    """
+
+    @staticmethod
+    def get_source_extension() -> str:
+        return 'dddmp'
+
+    def __init__(self, path: str, backend: Optional[str] = None) -> None:
+        self._path = path
+        self.destination_model = BDDModel(backend)
+
+    def transform(self) -> BDDModel:
+        header = {}
+        nodes = []
+        with open(self._path, 'r') as file:
+            in_nodes = False
+            for line in file:
+                tokens = line.split()
+                if not tokens:
+                    continue
+                if tokens[0] == '.nodes':
+                    in_nodes = True
+                elif tokens[0] == '.end':
+                    break
+                elif in_nodes:
+                    nodes.append(tokens)
+                elif tokens[0].startswith('.'):
+                    header[tokens[0]] = tokens[1:]
+
+        if header.get('.mode', ['A']) != ['A']:
+            raise ValueError('Only the ASCII mode of the dddmp format is supported.')
+        if '.orderedvarnames' not in header:
+            raise ValueError('The dddmp file has no ".orderedvarnames" field.')
+        ordered_names = header['.orderedvarnames']
+        if '.varnames' in header:
+            names = header['.varnames']
+            variables = list(names)
+        else:
+            # Only the indexes of the support are known: the other variables fill the gaps
+            names = dict(zip(map(int, header.get('.ids', [])), header.get('.suppvarnames', [])))
+            supported = set(names.values())
+            others = iter([name for name in ordered_names if name not in supported])
+            variables = [names[i] if i in names else next(others) for i in range(len(ordered_names))]
+        varinfo = int(header.get('.varinfo', ['0'])[0])
+
+        bdd = self.destination_model.bdd
+        for name in ordered_names:
+            bdd.declare(name)
+        self.destination_model.variables = variables
+
+        functions = {}
+        for tokens in nodes:
+            node_id = int(tokens[0])
+            if tokens[1] == 'T':
+                functions[node_id] = bdd.true
+                continue
+            # Node: id [info] index then else; the info is the name of the variable for varinfo 3
+            name = tokens[1] if varinfo == 3 else names[int(tokens[-3])]
+            then_function = self._function(functions, int(tokens[-2]))
+            else_function = self._function(functions, int(tokens[-1]))
+            # The children are below the node, so the node is added directly
+            functions[node_id] = self.destination_model.find_or_add(bdd.level_of_var(name),
+                                                                    else_function, then_function)
+
+        root = int(header['.rootids'][0])
+        self.destination_model.root = self._function(functions, root)
+        return self.destination_model
+
+    @staticmethod
+    def _function(functions: dict, ref: int):
+        return functions[ref] if ref > 0 else ~functions[-ref]
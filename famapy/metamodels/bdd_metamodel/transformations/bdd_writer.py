@@ -45,13 +45,63 @@ class BDDWriter(ModelToText):
         self._roots = roots
 
     def transform(self) -> None:
-        self._source_model.bdd.dump(filename=self._path, roots=self._roots)
-        if self._output_format == BDDDumpFormat.DDDMPv3:
-             # Convert to dddmp format version 3.0 (adding the '.varnames' field)
-            dddmp_v2_to_v3(self._path)
+        if self._output_format in (BDDDumpFormat.DDDMPv2, BDDDumpFormat.DDDMPv3):
+            # The dd manager does not write the dddmp format (only CUDD does)
+            root = self._source_model.root if not self._roots else self._roots[0]
+            with open(self._path, 'w') as file:
+                file.write(dddmp_text(self._source_model, root,
+                                      version3=self._output_format == BDDDumpFormat.DDDMPv3))
+        else:
+            self._source_model.bdd.dump(filename=self._path, roots=self._roots)
         return None
 
 
+def dddmp_text(bdd_model: BDDModel, root: Function, version3: bool = True) -> str:
+    """Text of the BDD of `root` in dddmp format (ASCII mode, with the variable names as node info).
+
+    The index of a variable is its position in `bdd_model.variables`,
+    and its permutation index is its level.
+    As in CUDD, the then edges are never complemented.
+    """
+    indexes = {v: i for i, v in enumerate(bdd_model.variables)}
+    ordered_names = [bdd_model.bdd.var_at_level(level) for level in range(bdd_model.nof_levels())]
+    node_ids = {1: 1}  # dd node (not complemented) -> dddmp reference
+    lines = ['1 T 1 0 0']
+
+    def reference(ref: int) -> int:
+        dddmp_ref = node_ids[abs(ref)]
+        return dddmp_ref if ref > 0 else -dddmp_ref
+
+    refs = sorted({abs(ref) for ref in bdd_model.reachable_references(root)} - {1},
+                  key=bdd_model.level_of, reverse=True)  # children before parents
+    for node in refs:
+        level, low, high = bdd_model.succ(node)
+        then_ref, else_ref, sign = reference(high), reference(low), 1
+        if then_ref < 0:  # node = ~ite(var, ~high, ~low)
+            then_ref, else_ref, sign = -then_ref, -else_ref, -1
+        name = ordered_names[level]
+        lines.append(f'{len(lines) + 1} {name} {indexes[name]} {then_ref} {else_ref}')
+        node_ids[node] = sign * len(lines)
+
+    support = sorted({bdd_model.bdd.var_at_level(bdd_model.level_of(node)) for node in refs}, key=indexes.get)
+    header = ['.ver DDDMP-3.0' if version3 else '.ver DDDMP-2.0',
+              '.mode A',
+              '.varinfo 3',
+              f'.nnodes {len(lines)}',
+              f'.nvars {len(bdd_model.variables)}',
+              f'.nsuppvars {len(support)}',
+              '.suppvarnames ' + ' '.join(support)]
+    if version3:
+        header.append('.varnames ' + ' '.join(bdd_model.variables))
+    header.extend(['.orderedvarnames ' + ' '.join(ordered_names),
+                   '.ids ' + ' '.join(str(indexes[v]) for v in support),
+                   '.permids ' + ' '.join(str(bdd_model.bdd.level_of_var(v)) for v in support),
+                   '.nroots 1',
+                   f'.rootids {reference(bdd_model.reference(root))}',
+                   '.nodes'])
+    return '\n'.join(header + lines + ['.end']) + '\n'
+
+
 def dddmp_v2_to_v3(filepath: str):
     """Convert the file with the BDD dump in format dddmp version 2 to version 3.
 
@@ -1,5 +1,10 @@
+import hashlib
 import itertools
-from typing import Any
+import os
+import time
+from typing import Any, Optional
+
+from pysat.formula import IDPool
 
 from famapy.core.exceptions import ElementNotFound
 from famapy.core.models import VariabilityModel
@@ -10,9 +15,33 @@ from famapy.metamodels.fm_metamodel.models.feature_model import (  # pylint: dis
     Relation,
 )
 from famapy.metamodels.bdd_metamodel.models.bdd_model import BDDModel
+from famapy.metamodels.bdd_metamodel.transformations.bdd_reader import BDDReader
+from famapy.metamodels.bdd_metamodel.transformations.bdd_writer import BDDWriter
+from famapy.metamodels.bdd_metamodel.transformations.variable_ordering import (
+    VariableOrdering,
+    variable_order
+)
+from famapy.metamodels.pysat_metamodel.transformations.cardinality_encodings import (
+    DEFAULT_CARDINALITY_ENCODING,
+    DEFAULT_CARDINALITY_THRESHOLD,
+    at_most,
+    group_cardinality
+)
 
 
 class FmToBDD(ModelToModel):
+    """Compile the BDD of a feature model from the clauses of its CNF.
+
+    If a cache directory is given, the compiled BDDs are stored there in dddmp format,
+    named by a hash of the clauses, the variables and the ordering options,
+    and the BDD is loaded from the cache instead of compiled when the same model is transformed again.
+
+    As in FmToPysat, the large alternative and [min..max] groups are encoded with the cardinality
+    encodings of pysat.card; their auxiliary variables are quantified away while the BDD is built.
+    The sequential counter (the default encoding) keeps the intermediate BDDs small.
+    The cross-tree constraints are also encoded as in FmToPysat (see `tseitin`).
+    """
+
     @staticmethod
     def get_source_extension() -> str:
         return 'fm'
@@ -21,13 +50,29 @@ class FmToBDD(ModelToModel):
     def get_destination_extension() -> str:
         return 'bdd'
 
-    def __init__(self, source_model: VariabilityModel) -> None:
+    def __init__(self, source_model: VariabilityModel,
+                 ordering: VariableOrdering = VariableOrdering.DECLARATION,
+                 reorder: bool = False,
+                 cache_dir: Optional[str] = None,
+                 backend: Optional[str] = None,
+                 cardinality_threshold: Optional[int] = DEFAULT_CARDINALITY_THRESHOLD,
+                 cardinality_encoding: int = DEFAULT_CARDINALITY_ENCODING,
+                 tseitin: bool = True) -> None:
         self.source_model = source_model
+        self.tseitin = tseitin  # see FmToPysat
+        self.cardinality_threshold = cardinality_threshold  # see FmToPysat
+        self.cardinality_encoding = cardinality_encoding
+        self.backend = backend  # BDD manager (see BDDModel)
+        self.cache_dir = cache_dir  # directory of the cache of compiled BDDs (no cache by default)
+        self.ordering = ordering  # static ordering of the variables
+        self.reorder = reorder  # whether the variables are reordered by sifting after the construction
         self.counter = 1
-        self.destination_model = BDDModel()
+        self.vpool = None  # auxiliary variables, after the variables of the features
+        self.destination_model = BDDModel(backend)
         self.variables: dict[str, Any] = {}
         self.features: dict[str, Any] = {}
         self.clauses = []
+        self.stats: dict[str, float] = {}  # statistics of the construction of the BDD
 
     def add_feature(self, feature: Feature) -> None:
         if feature.name not in self.variables.keys():
@@ -38,7 +83,12 @@ class FmToBDD(ModelToModel):
     def add_root(self, feature: Feature) -> None:
         self.clauses.append([self.variables.get(feature.name)])
 
+    def _use_cardinality_encoding(self, relation: Relation) -> bool:
+        return self.cardinality_threshold is not None and len(relation.children) > self.cardinality_threshold
+
     def add_relation(self, relation: Relation) -> None:  # noqa: MC0001
+        if self.vpool is None:
+            self.vpool = IDPool(start_from=self.counter)
         if relation.is_mandatory():
             self.clauses.append([
                 -1 * self.variables.get(relation.parent.name),
@@ -81,9 +131,13 @@ class FmToBDD(ModelToModel):
                 alt_cnf.append(self.variables.get(child.name))
             self.clauses.append(alt_cnf)
 
+            # at most one child: pairwise, or with a cardinality encoding for large groups
+            pairwise = not self._use_cardinality_encoding(relation)
+            if not pairwise:
+                self.clauses.extend(at_most(alt_cnf[1:], 1, self.vpool, self.cardinality_encoding))
             for i in range(len(relation.children)):
                 for j in range(i + 1, len(relation.children)):
-                    if i != j:
+                    if i != j and pairwise:
                         self.clauses.append([
                             -1 * self.variables.get(relation.children[i].name),
                             -1 * self.variables.get(relation.children[j].name)
@@ -98,6 +152,14 @@ class FmToBDD(ModelToModel):
             _min = relation.card_min
             _max = relation.card_max
 
+            if self._use_cardinality_encoding(relation):
+                self.clauses.extend(group_cardinality(
+                    self.variables.get(relation.parent.name),
+                    [self.variables.get(child.name) for child in relation.children],
+                    _min, _max, self.vpool, self.cardinality_encoding
+                ))
+                return
+
             for val in range(len(relation.children) + 1):
                 if val < _min or val > _max:
                     # These sets are the combinations that shouldn't be in the res
@@ -127,12 +189,18 @@ class FmToBDD(ModelToModel):
                         self.clauses.append(cnf)
 
     def add_constraint(self, ctc: Constraint) -> None:
-        clauses = ctc.ast.get_clauses()
-        for clause in clauses:
-            c = list(map(lambda term: (-self.variables.get(term[1:]) 
-                                         if term.startswith('-') 
-                                         else self.variables.get(term)), clause))
-            self.clauses.append(c)
+        if self.vpool is None:
+            self.vpool = IDPool(start_from=self.counter)
+        try:
+            if self.tseitin:
+                clauses = ctc.ast.get_tseitin_clauses(self.variables, self.vpool.id)
+            else:
+                clauses = [[-self.variables[term[1:]] if term.startswith('-') else self.variables[term]
+                            for term in clause]
+                           for clause in ctc.ast.get_clauses()]
+        except KeyError as error:
+            raise ElementNotFound from error
+        self.clauses.extend(clauses)
 
     def transform(self) -> VariabilityModel:
         for feature in self.source_model.get_features():
@@ -146,17 +214,31 @@ class FmToBDD(ModelToModel):
         for constraint in self.source_model.get_constraints():
             self.add_constraint(constraint)
 
-        # Transform clauses to textual CNF notation required by the BDD
-        not_connective = BDDModel.NOT
-        or_connective = ' ' + BDDModel.OR + ' '
-        and_connective = ' ' + BDDModel.AND + ' '
-        cnf_list = []
-        for clause in self.clauses:
-            cnf_list.append('(' + or_connective.join(list(map(lambda l: 
-                not_connective + self.features[abs(l)] if l < 0 else 
-                self.features[abs(l)], clause))) + ')')
-                
-        cnf_formula = and_connective.join(cnf_list)
-        self.destination_model.from_textual_cnf(cnf_formula, list(self.variables.keys()))
+        variables = list(self.variables.keys())
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = os.path.join(self.cache_dir, self.cache_key() + '.dddmp')
+            if os.path.exists(cache_path):
+                start_time = time.time()
+                self.destination_model = BDDReader(cache_path, self.backend).transform()
+                self.stats = {'clauses': len(self.clauses),
+                              'time': time.time() - start_time,
+                              'nodes': len(self.destination_model.root),
+                              'cached': True}
+                return self.destination_model
+
+        order = variable_order(self.ordering, variables, self.clauses, self.source_model.root)
+        self.stats = self.destination_model.from_clauses(self.clauses, variables, order, self.reorder)
+        self.stats['cached'] = False
+
+        if cache_path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            BDDWriter(cache_path + '.tmp', self.destination_model).transform()
+            os.replace(cache_path + '.tmp', cache_path)  # other processes never read a partial file
 
         return self.destination_model
+
+    def cache_key(self) -> str:
+        """Hash of the clauses, the variables and the ordering options (once the clauses are added)."""
+        content = repr((list(self.variables.keys()), self.clauses, self.ordering.value, self.reorder))
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
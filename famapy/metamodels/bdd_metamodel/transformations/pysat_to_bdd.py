@@ -0,0 +1,47 @@
+from typing import Optional
+
+from famapy.core.transformations import ModelToModel
+
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.bdd_metamodel.models.bdd_model import BDDModel
+
+
+class PySATToBDD(ModelToModel):
+    """Build the BDD of a PySATModel directly from its integer clauses.
+
+    The variables are ordered by their identifiers in the PySATModel
+    (see `BDDModel.from_clauses`).
+    The auxiliary variables of the PySATModel are existentially quantified,
+    so the BDD is only over the other variables.
+    """
+
+    @staticmethod
+    def get_source_extension() -> str:
+        return 'pysat'
+
+    @staticmethod
+    def get_destination_extension() -> str:
+        return 'bdd'
+
+    def __init__(self, source_model: PySATModel, ctcs: bool = True, backend: Optional[str] = None) -> None:
+        self.source_model = source_model
+        self.ctcs = ctcs  # whether the cross-tree constraints are included or not
+        self.destination_model = BDDModel(backend)
+        self.stats: dict[str, float] = {}  # statistics of the construction of the BDD
+
+    def transform(self) -> BDDModel:
+        features = self.source_model.features
+        clauses = list(self.source_model.r_cnf.clauses)
+        if self.ctcs:
+            clauses.extend(self.source_model.ctc_cnf.clauses)
+        nof_vars = max([max(features, default=0)] + [abs(literal) for clause in clauses for literal in clause])
+        auxiliary = self.source_model.auxiliary_variables
+        if auxiliary:
+            # The auxiliary variables are numbered after the other ones (see `BDDModel.from_clauses`)
+            ids = {var: i for i, var in enumerate(sorted(range(1, nof_vars + 1), key=lambda var: var in auxiliary), 1)}
+            clauses = [[ids[literal] if literal > 0 else -ids[-literal] for literal in clause] for clause in clauses]
+        else:
+            ids = {var: var for var in range(1, nof_vars + 1)}
+        variables = [features.get(var, f'_{var}') for var in sorted(ids, key=ids.get) if var not in auxiliary]
+        self.stats = self.destination_model.from_clauses(clauses, variables)
+        return self.destination_model
@@ -0,0 +1,104 @@
+from enum import Enum
+from typing import Optional
+
+from famapy.metamodels.fm_metamodel.models.feature_model import Feature
+
+
+class VariableOrdering(Enum):
+    """Static orderings of the variables of a BDD.
+
+        - DECLARATION: the order of the features in the feature model (breadth-first).
+        - DFS: depth-first pre-order of the feature tree, so each subtree is contiguous.
+        - FORCE: FORCE heuristic from the declaration order.
+        - SPAN: FORCE heuristic from the DFS order, so the span of the clauses is minimised
+          starting from the locality of the tree.
+    """
+    DECLARATION = 'declaration'
+    DFS = 'dfs'
+    FORCE = 'force'
+    SPAN = 'span'
+
+
+def variable_order(ordering: VariableOrdering,
+                   variables: list[str],
+                   clauses: list[list[int]],
+                   root: Optional[Feature] = None) -> list[str]:
+    """Order of the variables, where the literal `i` of the clauses is the variable `variables[i-1]`.
+
+    The DFS and SPAN orderings need the root of the feature tree.
+    Literals greater than the number of variables (auxiliary variables) are ignored.
+    """
+    if ordering == VariableOrdering.DECLARATION:
+        return list(variables)
+    clauses = [[literal for literal in clause if abs(literal) <= len(variables)] for clause in clauses]
+    if ordering == VariableOrdering.FORCE:
+        ids = force_order(list(range(1, len(variables) + 1)), clauses)
+    else:
+        if root is None:
+            raise ValueError(f'The {ordering.value} ordering needs the feature tree.')
+        positions = {v: i for i, v in enumerate(variables, 1)}
+        ids = [positions[name] for name in dfs_order(root) if name in positions]
+        in_tree = set(ids)
+        ids.extend(i for i in range(1, len(variables) + 1) if i not in in_tree)
+        if ordering == VariableOrdering.SPAN:
+            ids = force_order(ids, clauses)
+    return [variables[i - 1] for i in ids]
+
+
+def dfs_order(root: Feature) -> list[str]:
+    """Names of the features in depth-first pre-order (non-recursive)."""
+    order = []
+    stack = [root]
+    while stack:
+        feature = stack.pop()
+        order.append(feature.name)
+        children = [child for relation in feature.get_relations() for child in relation.children]
+        stack.extend(reversed(children))
+    return order
+
+
+def total_span(order: list[int], clauses: list[list[int]]) -> int:
+    """Sum of the spans (distance between the first and the last variable) of the clauses.
+
+    The variables that are not in the order (e.g., auxiliary variables) are ignored.
+    """
+    position = {var: i for i, var in enumerate(order)}
+    span = 0
+    for clause in clauses:
+        positions = [position[abs(literal)] for literal in clause if abs(literal) in position]
+        if len(positions) > 1:
+            span += max(positions) - min(positions)
+    return span
+
+
+def force_order(order: list[int], clauses: list[list[int]], max_iterations: int = 100) -> list[int]:
+    """FORCE heuristic: move each variable to the average center of gravity of its clauses.
+
+    It iterates from the given order while the total span of the clauses decreases,
+    and returns the order with the minimum span.
+    The variables that are not in the order (e.g., auxiliary variables) are ignored.
+
+    Ref.: [Aloul et al. 2003. FORCE: A Fast and Easy-To-Implement Variable-Ordering Heuristic.
+    GLSVLSI. (https://doi.org/10.1145/764808.764839)]
+    """
+    best_order = list(order)
+    in_order = set(best_order)
+    clauses = [[abs(literal) for literal in clause if abs(literal) in in_order] for clause in clauses]
+    clauses = [clause for clause in clauses if len(clause) > 1]
+    best_span = total_span(best_order, clauses)
+    for _ in range(max_iterations):
+        position = {var: i for i, var in enumerate(best_order)}
+        total = dict.fromkeys(best_order, 0.0)
+        degree = dict.fromkeys(best_order, 0)
+        for clause in clauses:
+            center = sum(position[var] for var in clause) / len(clause)
+            for var in clause:
+                total[var] += center
+                degree[var] += 1
+        new_order = sorted(best_order, key=lambda var: (total[var] / degree[var] if degree[var] else position[var],
+                                                         position[var]))
+        span = total_span(new_order, clauses)
+        if span >= best_span:
+            break
+        best_order, best_span = new_order, span
+    return best_order
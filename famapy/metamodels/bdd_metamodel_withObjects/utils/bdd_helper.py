@@ -8,6 +8,7 @@ from famapy.metamodels.fm_metamodel.models.fm_configuration import FMConfigurati
 from famapy.metamodels.fm_metamodel.models.feature_model import FeatureModel
 
 from famapy.metamodels.bdd_metamodel.models.bdd_model import BDDModel
+from famapy.metamodels.bdd_metamodel.operations.bdd_sampling import node_counts, unrank, distinct_ranks
 
 
 class BDDHelper:
@@ -43,7 +44,7 @@ class BDDHelper:
             u = self.bdd_model.bdd.let(values, self.bdd_model.root)
             n_vars = len(self.bdd_model.variables) - len(values)
         
-        return self.bdd_model.bdd.count(u, nvars=n_vars)
+        return self.bdd_model.count(u, nvars=n_vars)
 
     def get_random_sample(self, size: int, with_replacement: bool=False, partial_configuration: FMConfiguration=None) -> set[FMConfiguration]:
         """Return a uniforn random sample by enumerating all configurations."""
@@ -79,10 +80,10 @@ class BDDHelper:
 
                 # Number of configurations with the feature selected
                 v_sel = self.bdd_model.bdd.let({feature: True}, u)
-                nof_configs_var_selected = self.bdd_model.bdd.count(v_sel, nvars=n_vars-1)
+                nof_configs_var_selected = self.bdd_model.count(v_sel, nvars=n_vars-1)
                 # Number of configurations with the feature unselected
                 v_unsel = self.bdd_model.bdd.let({feature: False}, u)
-                nof_configs_var_unselected = self.bdd_model.bdd.count(v_unsel, nvars=n_vars-1)
+                nof_configs_var_unselected = self.bdd_model.count(v_unsel, nvars=n_vars-1)
 
                 # Randomly select or not the feature
                 selected = random.choices([True, False], [nof_configs_var_selected, nof_configs_var_unselected], k=1)[0]
@@ -101,15 +102,41 @@ class BDDHelper:
         if size < 0 or (size > nof_configs and not with_replacement):
             raise ValueError('Sample larger than population or is negative.')
 
+        if not with_replacement:
+            return self.get_random_sample_unranking(size, partial_configuration)
+
         configurations = []
         for _ in range(size):
             config = self.get_random_configuration(partial_configuration)
             configurations.append(config)
-        if not with_replacement:
-            configurations = list(set(configurations))
-            while len(configurations) < size:
-                config = self.get_random_configuration(partial_configuration)
-                configurations.append(config)
+        return configurations
+
+    def get_random_sample_unranking(self, size: int, partial_configuration: FMConfiguration=None) -> list[FMConfiguration]:
+        """Return a uniform random sample without replacement by unranking distinct ranks.
+
+        It draws `size` distinct ranks in [0, N), being N the number of configurations,
+        and builds the configuration of each rank following the solution counts of the BDD nodes,
+        so the configurations are distinct without retrying.
+        """
+        nof_configs = self.get_number_of_configurations(partial_configuration)
+        if size < 0 or size > nof_configs:
+            raise ValueError('Sample larger than population or is negative.')
+
+        elements = {} if partial_configuration is None else partial_configuration.elements
+        values = {f.name : selected for f, selected in elements.items()}
+        u = self.bdd_model.bdd.let(values, self.bdd_model.root)
+
+        fixed_levels = {self.bdd_model.bdd.level_of_var(f) for f in values}
+        free_levels = [level for level in range(self.bdd_model.nof_levels()) if level not in fixed_levels]
+        table = node_counts(self.bdd_model, u, fixed_levels)
+        level_features = [self.feature_model.get_feature_by_name(self.bdd_model.bdd.var_at_level(level))
+                          for level in range(self.bdd_model.nof_levels())]
+
+        configurations = []
+        for rank in distinct_ranks(nof_configs, size, random):
+            bits = unrank(table, self.bdd_model.reference(u), rank, free_levels)
+            features = {level_features[level]: bits[level] for level in free_levels}
+            configurations.append(FMConfiguration(features | elements))
         return configurations
 
 
@@ -127,10 +154,10 @@ class BDDHelper:
         for feature in care_vars:
             # Number of configurations with the feature selected
             v_sel = self.bdd_model.bdd.let({feature: True}, u)
-            nof_configs_var_selected = self.bdd_model.bdd.count(v_sel, nvars=n_vars-1)
+            nof_configs_var_selected = self.bdd_model.count(v_sel, nvars=n_vars-1)
             # Number of configurations with the feature unselected
             v_unsel = self.bdd_model.bdd.let({feature: False}, u)
-            nof_configs_var_unselected = self.bdd_model.bdd.count(v_unsel, nvars=n_vars-1)
+            nof_configs_var_unselected = self.bdd_model.count(v_unsel, nvars=n_vars-1)
 
             # Randomly select or not the feature
             selected = random.choices([True, False], [nof_configs_var_selected, nof_configs_var_unselected], k=1)[0]
@@ -161,7 +188,7 @@ class BDDHelper:
         #self.bdd_model.bdd.collect_garbage()
         #self.bdd_model.serialize('bdd.png', 'png')
         root = self.bdd_model.reference
-        solutions = self.bdd_model.bdd.count(root, nvars=len(self.bdd_model.variables))
+        solutions = self.bdd_model.count(root, nvars=len(self.bdd_model.variables))
         print(f'Solutions: {solutions}')
         print(f'exp: {self.bdd_model.reference.to_expr()}')
         self.get_prod_dist(root, mark, dist)
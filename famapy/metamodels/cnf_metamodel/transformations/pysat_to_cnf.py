@@ -4,6 +4,13 @@ from famapy.metamodels.cnf_metamodel.models.cnf_model import CNFModel, CNFNotati
 
 
 class PysatToCNF(ModelToModel):
+    """Transform the clauses of a PySATModel into the formula of a CNFModel, naming the variables by their features.
+
+    A CNFModel has no auxiliary variables (see `PySATModel.auxiliary_variables`), so the models
+    whose clauses have them (e.g., of FmToPysat with cardinality encodings or the Tseitin
+    transformation) are rejected with a ValueError: they must be transformed with
+    `FmToPysat(fm, cardinality_threshold=None, tseitin=False)`.
+    """
 
     @staticmethod
     def get_source_extension():
@@ -23,6 +30,7 @@ class PysatToCNF(ModelToModel):
         not_connective = self.cnf_notation.value[CNFLogicConnective.NOT]
         or_connective = ' ' + self.cnf_notation.value[CNFLogicConnective.OR] + ' '
         and_connective = ' ' + self.cnf_notation.value[CNFLogicConnective.AND] + ' '
+        self._check_variables()
         cnf_list = []
         for clause in self.source_model.get_all_clauses():
             cnf_list.append('(' + or_connective.join(list(map(lambda l: 
@@ -32,3 +40,13 @@ class PysatToCNF(ModelToModel):
         cnf_formula = and_connective.join(cnf_list)
         self.destination_model.from_cnf(cnf_formula)
         return self.destination_model
+
+    def _check_variables(self) -> None:
+        features = self.source_model.features
+        clauses = self.source_model.get_all_clauses()
+        unnamed = sorted({abs(literal) for literal in clauses.literals.tolist()} - features.keys())
+        if unnamed:
+            raise ValueError(f'The clauses have {len(unnamed)} auxiliary variables (e.g., {unnamed[0]}), '
+                             'which are not features and cannot be represented in a CNFModel. '
+                             'Transform the feature model with '
+                             'FmToPysat(fm, cardinality_threshold=None, tseitin=False).')
@@ -6,5 +6,7 @@ from .feature_model import (
 )
 
 from .fm_configuration import FMConfiguration
+from .compact_feature_model import CompactFeatureModel, CompactFeature, CompactRelation
 
-__all__ = ["FeatureModel", "Feature", "Relation", "Constraint", "FMConfiguration"]
+__all__ = ["FeatureModel", "Feature", "Relation", "Constraint", "FMConfiguration",
+           "CompactFeatureModel", "CompactFeature", "CompactRelation"]
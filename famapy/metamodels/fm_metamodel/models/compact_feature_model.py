@@ -0,0 +1,288 @@
+from array import array
+from typing import Optional
+
+from famapy.core.models import VariabilityModel
+
+from famapy.metamodels.fm_metamodel.models.feature_model import Constraint, FeatureModel
+
+
+class CompactFeatureModel(VariabilityModel):
+    """Array-backed representation of a feature model for large models.
+
+    Features and relations are identified by integers and stored in flat arrays
+    instead of one Python object per feature and relation.
+    Identifiers are assigned in breadth-first order, so that:
+      - the root is the feature 0,
+      - the relations of a feature have consecutive ids,
+      - the children of a relation have consecutive ids,
+      - every feature has a greater id than its parent.
+    The last property allows bottom-up computations (e.g., counting configurations)
+    by simply iterating the ids in reverse order.
+
+    Features and relations can also be accessed through the lightweight facades
+    `CompactFeature` and `CompactRelation`, which provide the same interface as
+    `Feature` and `Relation`, so the operations over `FeatureModel` can also be used.
+    """
+
+    NONE = -1  # Id used for a missing feature or relation (e.g., the parent of the root)
+
+    @staticmethod
+    def get_extension() -> str:
+        return 'fm'
+
+    def __init__(self) -> None:
+        # Features
+        self.names: list[str] = []
+        self.ids: dict[str, int] = {}
+        self.abstract = bytearray()
+        self.parent = array('i')
+        self.first_child = array('i')
+        self.next_sibling = array('i')
+        self.first_relation = array('i')
+        self.nof_relations = array('i')
+        self.parent_relation = array('i')  # relation in which the feature is a child
+        # Relations
+        self.relation_parent = array('i')
+        self.relation_first_child = array('i')
+        self.relation_nof_children = array('i')
+        self.card_min = array('i')
+        self.card_max = array('i')
+        # Cross-tree constraints
+        self.ctcs: list[Constraint] = []
+
+    @classmethod
+    def from_feature_model(cls, feature_model: FeatureModel) -> 'CompactFeatureModel':
+        model = cls()
+        model.ctcs = list(feature_model.get_constraints())
+        if feature_model.root.is_empty():
+            return model
+
+        model._add_feature(feature_model.root.name, feature_model.root.is_abstract,
+                           CompactFeatureModel.NONE, CompactFeatureModel.NONE)
+        queue = [feature_model.root]
+        for feature_id, feature in enumerate(queue):  # the queue grows while iterating
+            model.first_relation[feature_id] = len(model.card_min)
+            model.nof_relations[feature_id] = len(feature.relations)
+            previous_child = CompactFeatureModel.NONE
+            for relation in feature.relations:
+                relation_id = len(model.card_min)
+                model.relation_parent.append(feature_id)
+                model.relation_first_child.append(len(model.names))
+                model.relation_nof_children.append(len(relation.children))
+                model.card_min.append(relation.card_min)
+                model.card_max.append(relation.card_max)
+                for child in relation.children:
+                    child_id = model._add_feature(child.name, child.is_abstract,
+                                                  feature_id, relation_id)
+                    if previous_child == CompactFeatureModel.NONE:
+                        model.first_child[feature_id] = child_id
+                    else:
+                        model.next_sibling[previous_child] = child_id
+                    previous_child = child_id
+                    queue.append(child)
+        return model
+
+    def _add_feature(self, name: str, is_abstract: bool, parent: int, relation: int) -> int:
+        feature_id = len(self.names)
+        self.names.append(name)
+        self.ids.setdefault(name, feature_id)
+        self.abstract.append(is_abstract)
+        self.parent.append(parent)
+        self.first_child.append(CompactFeatureModel.NONE)
+        self.next_sibling.append(CompactFeatureModel.NONE)
+        self.first_relation.append(0)
+        self.nof_relations.append(0)
+        self.parent_relation.append(relation)
+        return feature_id
+
+    def nof_features(self) -> int:
+        return len(self.names)
+
+    def children_ids(self, feature_id: int) -> range:
+        """Ids of the children of the feature (in all its relations)."""
+        start = self.first_child[feature_id]
+        if start == CompactFeatureModel.NONE:
+            return range(0)
+        last_relation = self.first_relation[feature_id] + self.nof_relations[feature_id] - 1
+        end = self.relation_first_child[last_relation] + self.relation_nof_children[last_relation]
+        return range(start, end)
+
+    def relation_ids(self, feature_id: int) -> range:
+        start = self.first_relation[feature_id]
+        return range(start, start + self.nof_relations[feature_id])
+
+    def relation_children_ids(self, relation_id: int) -> range:
+        start = self.relation_first_child[relation_id]
+        return range(start, start + self.relation_nof_children[relation_id])
+
+    def is_mandatory_relation(self, relation_id: int) -> bool:
+        return (self.card_min[relation_id] == 1 and self.card_max[relation_id] == 1
+                and self.relation_nof_children[relation_id] == 1)
+
+    def is_optional_relation(self, relation_id: int) -> bool:
+        return (self.card_min[relation_id] == 0 and self.card_max[relation_id] == 1
+                and self.relation_nof_children[relation_id] == 1)
+
+    def is_or_relation(self, relation_id: int) -> bool:
+        nof_children = self.relation_nof_children[relation_id]
+        return (self.card_min[relation_id] == 1 and self.card_max[relation_id] == nof_children
+                and nof_children > 1)
+
+    def is_alternative_relation(self, relation_id: int) -> bool:
+        return (self.card_min[relation_id] == 1 and self.card_max[relation_id] == 1
+                and self.relation_nof_children[relation_id] > 1)
+
+    def depth(self, feature_id: int) -> int:
+        depth = 0
+        parent = self.parent[feature_id]
+        while parent != CompactFeatureModel.NONE:
+            depth += 1
+            parent = self.parent[parent]
+        return depth
+
+    # Facade with the same interface as FeatureModel
+
+    @property
+    def root(self) -> Optional['CompactFeature']:
+        return CompactFeature(self, 0) if self.names else None
+
+    def get_features(self) -> list['CompactFeature']:
+        return [CompactFeature(self, i) for i in range(len(self.names))]
+
+    def get_relations(self) -> list['CompactRelation']:
+        return [CompactRelation(self, i) for i in range(len(self.card_min))]
+
+    def get_constraints(self) -> list[Constraint]:
+        return self.ctcs
+
+    def get_feature_by_name(self, feature_name: str) -> 'CompactFeature':
+        return CompactFeature(self, self.ids[feature_name])
+
+    def __str__(self) -> str:
+        if not self.names:
+            return '(empty feature model)'
+        res = 'root: ' + self.names[0] + '\r\n'
+        for i, relation in enumerate(self.get_relations()):
+            res += f'relation {i}: {relation}\r\n'
+        for ctc in self.ctcs:
+            res += f'{ctc.ast}' + '\r\n'
+        return res
+
+
+class CompactRelation:
+    """Read-only view of a relation of a CompactFeatureModel."""
+
+    __slots__ = ('model', 'id')
+
+    def __init__(self, model: CompactFeatureModel, relation_id: int) -> None:
+        self.model = model
+        self.id = relation_id
+
+    @property
+    def parent(self) -> 'CompactFeature':
+        return CompactFeature(self.model, self.model.relation_parent[self.id])
+
+    @property
+    def children(self) -> list['CompactFeature']:
+        return [CompactFeature(self.model, i) for i in self.model.relation_children_ids(self.id)]
+
+    @property
+    def card_min(self) -> int:
+        return self.model.card_min[self.id]
+
+    @property
+    def card_max(self) -> int:
+        return self.model.card_max[self.id]
+
+    def is_mandatory(self) -> bool:
+        return self.model.is_mandatory_relation(self.id)
+
+    def is_optional(self) -> bool:
+        return self.model.is_optional_relation(self.id)
+
+    def is_or(self) -> bool:
+        return self.model.is_or_relation(self.id)
+
+    def is_alternative(self) -> bool:
+        return self.model.is_alternative_relation(self.id)
+
+    def __str__(self) -> str:
+        res = f'{self.parent.name}[{self.card_min},{self.card_max}]'
+        for _child in self.children:
+            res += _child.name + ' '
+        return res
+
+    def __hash__(self) -> int:
+        return hash((id(self.model), self.id))
+
+    def __eq__(self, other: object) -> bool:
+        return (isinstance(other, CompactRelation)
+                and self.model is other.model and self.id == other.id)
+
+
+class CompactFeature:
+    """Read-only view of a feature of a CompactFeatureModel."""
+
+    __slots__ = ('model', 'id')
+
+    def __init__(self, model: CompactFeatureModel, feature_id: int) -> None:
+        self.model = model
+        self.id = feature_id
+
+    @property
+    def name(self) -> str:
+        return self.model.names[self.id]
+
+    @property
+    def is_abstract(self) -> bool:
+        return bool(self.model.abstract[self.id])
+
+    @property
+    def parent(self) -> Optional['CompactFeature']:
+        return self.get_parent()
+
+    @property
+    def relations(self) -> list[CompactRelation]:
+        return self.get_relations()
+
+    def is_empty(self) -> bool:
+        return self.model.parent[self.id] == CompactFeatureModel.NONE and self.is_leaf()
+
+    def get_relations(self) -> list[CompactRelation]:
+        return [CompactRelation(self.model, i) for i in self.model.relation_ids(self.id)]
+
+    def get_parent(self) -> Optional['CompactFeature']:
+        parent = self.model.parent[self.id]
+        return None if parent == CompactFeatureModel.NONE else CompactFeature(self.model, parent)
+
+    def is_root(self) -> bool:
+        return self.model.parent[self.id] == CompactFeatureModel.NONE
+
+    def is_mandatory(self) -> bool:
+        relation = self.model.parent_relation[self.id]
+        return relation == CompactFeatureModel.NONE or self.model.is_mandatory_relation(relation)
+
+    def is_optional(self) -> bool:
+        relation = self.model.parent_relation[self.id]
+        return relation != CompactFeatureModel.NONE and self.model.is_optional_relation(relation)
+
+    def is_or_group(self) -> bool:
+        return any(self.model.is_or_relation(r) for r in self.model.relation_ids(self.id))
+
+    def is_alternative_group(self) -> bool:
+        return any(self.model.is_alternative_relation(r) for r in self.model.relation_ids(self.id))
+
+    def is_group(self) -> bool:
+        return self.is_or_group() or self.is_alternative_group()
+
+    def is_leaf(self) -> bool:
+        return self.model.nof_relations[self.id] == 0
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CompactFeature) and self.name == other.name
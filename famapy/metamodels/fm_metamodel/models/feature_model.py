@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Union
 
 from famapy.core.models import AST
 from famapy.core.models import VariabilityModel
@@ -6,6 +6,8 @@ from famapy.core.models import VariabilityModel
 
 class Relation:
 
+    __slots__ = ('parent', 'children', 'card_min', 'card_max', '_roots')
+
     def __init__(
         self,
         parent: 'Feature',
@@ -18,9 +20,13 @@ class Relation:
         self.children = children
         self.card_min = card_min
         self.card_max = card_max
+        self._roots: dict[int, 'Feature'] = {}  # roots of the indexed trees with the relation
 
     def add_child(self, feature: 'Feature') -> None:
         self.children.append(feature)
+        _outdate_indexes(self._roots)
+        if self.parent is not None:
+            self.parent._notify_structural_change()
 
     def is_mandatory(self) -> bool:
         return self.card_min == 1 and self.card_max == 1 and len(self.children) == 1
@@ -58,6 +64,8 @@ class Relation:
 
 class Feature:
 
+    __slots__ = ('name', 'relations', 'parent', 'is_abstract', '_roots', '_structure_version')
+
     def __init__(
         self,
         name: str,
@@ -70,12 +78,20 @@ class Feature:
         self.relations = [] if relations is None else relations
         self.parent = self._get_parent() if parent is None else parent
         self.is_abstract = is_abstract
+        self._roots: dict[int, 'Feature'] = {}  # roots of the indexed trees with the feature
+        self._structure_version = 0  # structural changes of the tree of which the feature is the root
 
     def is_empty(self) -> bool:
         return self.parent is None and self.relations == []
 
     def add_relation(self, relation: 'Relation') -> None:
         self.relations.append(relation)
+        self._notify_structural_change()
+
+    def _notify_structural_change(self) -> None:
+        """Mark the indexes of the feature models with a tree of this feature as outdated."""
+        self._structure_version += 1
+        _outdate_indexes(self._roots)
 
     def get_relations(self) -> list['Relation']:
         return self.relations
@@ -122,6 +138,9 @@ class Feature:
 
 
 class Constraint:
+
+    __slots__ = ('name', 'ast')
+
     def __init__(self, name: str, ast: AST):
         self.name = name
         self.ast = ast
@@ -134,6 +153,18 @@ class Constraint:
 
 
 class FeatureModel(VariabilityModel):
+    """Feature model with a lazily built index over its tree.
+
+    The lists of features and relations, the name -> feature index,
+    and the parent and depth of each feature are computed with a single traversal
+    the first time they are needed and reused afterwards.
+    The index is rebuilt whenever the structure of its feature tree changes
+    (`Feature.add_relation`, `Relation.add_child`) or the root is replaced.
+    The changes are counted by the root feature. The features and relations of the tree know
+    the roots of all the indexes they are in (e.g., of the model of a subtree too),
+    so a change outdates those indexes only and not the ones of the other trees.
+    Code that modifies the `relations` or `children` lists directly must call `invalidate()`.
+    """
 
     @staticmethod
     def get_extension() -> str:
@@ -146,31 +177,84 @@ class FeatureModel(VariabilityModel):
     ) -> None:
         self.root = root
         self.ctcs = [] if constraints is None else constraints
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Discard the cached features, relations, and maps."""
+        self._indexed_version = -1
+        self._indexed_root: Optional['Feature'] = None
+        self._features: list['Feature'] = []
+        self._relations: list['Relation'] = []
+        self._features_by_name: dict[str, 'Feature'] = {}
+        self._parents: dict['Feature', Optional['Feature']] = {}
+        self._depths: dict['Feature', int] = {}
+        self._tree_hash: Optional[int] = None
+
+    def _build_index(self) -> None:
+        if self._indexed_root is self.root and self._indexed_version == self.root._structure_version:
+            return
+        self.invalidate()
+        self._indexed_version = self.root._structure_version
+        self._indexed_root = self.root
+        if self.root.is_empty():
+            return
+
+        self._relations = collect_relations(self.root)
+        self._features = [self.root]
+        for relation in self._relations:
+            self._features.extend(relation.children)
+
+        self._features_by_name[self.root.name] = self.root
+        self._parents[self.root] = None
+        self._depths[self.root] = 0
+        root_key = id(self.root)
+        for relation in self._relations:
+            relation._roots[root_key] = self.root
+        for feature in self._features:  # parents always appear before their children
+            feature._roots[root_key] = self.root
+            depth = self._depths[feature] + 1
+            for relation in feature.relations:
+                for child in relation.children:
+                    self._features_by_name.setdefault(child.name, child)
+                    self._parents[child] = feature
+                    self._depths[child] = depth
 
     def get_relations(self, feature: Optional['Feature'] = None) -> list['Relation']:
         if self.root.is_empty():
             return []
-        if feature is None:
-            feature = self.root
-        relations = []
-        for relation in feature.relations:
-            relations.append(relation)
-            for _feature in relation.children:
-                relations.extend(self.get_relations(_feature))
-        return relations
+        if feature is None or feature is self.root:
+            self._build_index()
+            return list(self._relations)
+        return collect_relations(feature)
 
     def get_features(self) -> list['Feature']:
-        features: list['Feature'] = []
-        features.append(self.root)
-        for relation in self.get_relations():
-            features.extend(relation.children)
-        return features
+        if self.root.is_empty():
+            return [self.root]
+        self._build_index()
+        return list(self._features)
 
     def get_constraints(self) -> list['Constraint']:
         return self.ctcs
 
     def get_feature_by_name(self, feature_name: str) -> 'Feature':
-        return next(f for f in self.get_features() if f.name == feature_name)
+        self._build_index()
+        if self.root.name == feature_name:
+            return self.root
+        try:
+            return self._features_by_name[feature_name]
+        except KeyError:
+            # Same exception raised by the former linear search with `next`.
+            raise StopIteration(feature_name) from None
+
+    def get_parent(self, feature: 'Feature') -> Optional['Feature']:
+        """Return the parent of the feature in the tree (None for the root)."""
+        self._build_index()
+        return self._parents.get(feature)
+
+    def get_depth(self, feature: 'Feature') -> int:
+        """Return the number of ancestors of the feature (0 for the root)."""
+        self._build_index()
+        return self._depths[feature]
 
     def __str__(self) -> str:
         if self.root.is_empty():
@@ -183,12 +267,14 @@ class FeatureModel(VariabilityModel):
         return res
 
     def __hash__(self) -> int:
-        return hash((
-            self.root,
-            frozenset(self.get_features()),
-            frozenset(self.get_relations()),
-            frozenset(self.ctcs)
-        ))
+        self._build_index()
+        if self._tree_hash is None:
+            self._tree_hash = hash((
+                self.root,
+                frozenset(self.get_features()),
+                frozenset(self.get_relations())
+            ))
+        return hash((self._tree_hash, frozenset(self.ctcs)))
 
     def __eq__(self, other: object) -> bool:
         return (
@@ -198,3 +284,25 @@ class FeatureModel(VariabilityModel):
             self.get_relations() == other.get_relations() and
             self.ctcs == other.ctcs
         )
+
+
+def _outdate_indexes(roots: dict[int, 'Feature']) -> None:
+    for root in roots.values():
+        root._structure_version += 1
+
+
+def collect_relations(feature: 'Feature') -> list['Relation']:
+    """Return the relations of the subtree rooted at the feature in depth-first order.
+
+    The traversal is iterative so it does not hit the recursion limit on deep trees.
+    """
+    relations = []
+    pending: list[Union['Feature', 'Relation']] = list(reversed(feature.relations))
+    while pending:
+        item = pending.pop()
+        if isinstance(item, Relation):
+            relations.append(item)
+            pending.extend(reversed(item.children))
+        else:
+            pending.extend(reversed(item.relations))
+    return relations
@@ -1,7 +1,7 @@
 from famapy.core.operations import Operation
 
 from famapy.metamodels.fm_metamodel.models import FeatureModel
-from famapy.metamodels.fm_metamodel.operations import get_feature_ancestors, get_leaf_features
+from famapy.metamodels.fm_metamodel.operations import get_leaf_features
 
 
 class FMMaxDepthTree(Operation):
@@ -19,4 +19,4 @@ class FMMaxDepthTree(Operation):
 
 
 def max_depth_tree(feature_model: FeatureModel) -> int:
-    return max(len(get_feature_ancestors(f)) for f in get_leaf_features(feature_model))
+    return max(feature_model.get_depth(f) for f in get_leaf_features(feature_model))
@@ -1,9 +1,11 @@
-from typing import Optional
+from typing import Optional, Union
 import math
 
 from famapy.core.operations import ProductsNumber
 
-from famapy.metamodels.fm_metamodel.models import FeatureModel, Feature, FMConfiguration
+from famapy.metamodels.fm_metamodel.models import (
+    FeatureModel, Feature, FMConfiguration, CompactFeatureModel
+)
 
 
 class FMNumberOfConfigurations(ProductsNumber):
@@ -34,20 +36,65 @@ class FMNumberOfConfigurations(ProductsNumber):
         return self.get_number_of_configurations()
         
 
-def count_configurations(feature_model: FeatureModel, partial_configuration: Optional[FMConfiguration] = None) -> int:
+def count_configurations(feature_model: Union[FeatureModel, CompactFeatureModel], partial_configuration: Optional[FMConfiguration] = None) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return count_configurations_compact(feature_model)
     return count_configurations_rec(feature_model.root)
 
-def count_configurations_rec(feature: Feature) -> int:
-    if feature.is_leaf():
+def count_configurations_compact(feature_model: CompactFeatureModel) -> int:
+    """Non-recursive version of `count_configurations_rec` over the array representation.
+
+    Children always have greater ids than their parents, 
+    so iterating the ids in reverse order computes the children first.
+    """
+    nof_features = feature_model.nof_features()
+    if nof_features == 0:
         return 1
-    counts = []
-    for relation in feature.get_relations():
-        if relation.is_mandatory():
-            counts.append(count_configurations_rec(relation.children[0]))
-        elif relation.is_optional():
-            counts.append(count_configurations_rec(relation.children[0]) + 1)
-        elif relation.is_alternative():
-            counts.append(sum((count_configurations_rec(f) for f in relation.children)))
-        elif relation.is_or():
-            counts.append(math.prod([count_configurations_rec(f) + 1 for f in relation.children]) - 1)
-    return math.prod(counts)
\ No newline at end of file
+    first_relation = feature_model.first_relation
+    nof_relations = feature_model.nof_relations
+    first_child = feature_model.relation_first_child
+    nof_children = feature_model.relation_nof_children
+    card_min = feature_model.card_min
+    card_max = feature_model.card_max
+    counts = [1] * nof_features
+    for feature_id in range(nof_features - 1, -1, -1):
+        if nof_relations[feature_id] == 0:
+            continue
+        count = 1
+        for relation in range(first_relation[feature_id],
+                              first_relation[feature_id] + nof_relations[feature_id]):
+            start = first_child[relation]
+            n_children = nof_children[relation]
+            _min, _max = card_min[relation], card_max[relation]
+            if n_children == 1 and _max == 1:  # mandatory (1..1) or optional (0..1)
+                count *= counts[start] + (1 - _min)
+            elif _min == 1 and _max == 1:  # alternative
+                count *= sum(counts[start:start + n_children])
+            elif _min == 1 and _max == n_children:  # or
+                count *= math.prod([c + 1 for c in counts[start:start + n_children]]) - 1
+        counts[feature_id] = count
+    return counts[0]
+
+def count_configurations_rec(feature: Feature, counts: Optional[dict[str, int]] = None) -> int:
+    """Number of configurations of the subtree of the feature.
+
+    If `counts` is given, the number of configurations of every feature of the subtree
+    is stored in it (by name).
+    """
+    if feature.is_leaf():
+        count = 1
+    else:
+        factors = []
+        for relation in feature.get_relations():
+            if relation.is_mandatory():
+                factors.append(count_configurations_rec(relation.children[0], counts))
+            elif relation.is_optional():
+                factors.append(count_configurations_rec(relation.children[0], counts) + 1)
+            elif relation.is_alternative():
+                factors.append(sum((count_configurations_rec(f, counts) for f in relation.children)))
+            elif relation.is_or():
+                factors.append(math.prod([count_configurations_rec(f, counts) + 1 for f in relation.children]) - 1)
+        count = math.prod(factors)
+    if counts is not None:
+        counts[feature.name] = count
+    return count
@@ -1,9 +1,10 @@
+from typing import Union
 
-from famapy.metamodels.fm_metamodel.models import FeatureModel
+from famapy.metamodels.fm_metamodel.models import FeatureModel, CompactFeatureModel
 
 class Metrics():
 
-    def __init__(self, model: FeatureModel):
+    def __init__(self, model: Union[FeatureModel, CompactFeatureModel]):
         self.feature_model = model
 
     def nof_features(self) -> int:
@@ -28,24 +29,38 @@ class Metrics():
         return nof_cross_tree_constraints(self.feature_model)
 
 
-def nof_features(feature_model: FeatureModel) -> int:
+def nof_features(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return feature_model.nof_features()
     return len(feature_model.get_features())
 
-def nof_group_features(feature_model: FeatureModel) -> int:
+def nof_group_features(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return len({feature_model.relation_parent[r] for r in range(len(feature_model.card_min))
+                    if feature_model.is_or_relation(r) or feature_model.is_alternative_relation(r)})
     return sum(f.is_group() for f in feature_model.get_features())
 
-def nof_alternative_groups(feature_model: FeatureModel) -> int:
+def nof_alternative_groups(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return len({feature_model.relation_parent[r] for r in range(len(feature_model.card_min))
+                    if feature_model.is_alternative_relation(r)})
     return sum(f.is_alternative_group() for f in feature_model.get_features())
 
-def nof_or_groups(feature_model: FeatureModel) -> int:
+def nof_or_groups(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return len({feature_model.relation_parent[r] for r in range(len(feature_model.card_min))
+                    if feature_model.is_or_relation(r)})
     return sum(f.is_or_group() for f in feature_model.get_features())
 
-def nof_abstract_features(feature_model: FeatureModel) -> int:
+def nof_abstract_features(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return feature_model.abstract.count(1)
     return sum(f.is_abstract for f in feature_model.get_features())
 
-def nof_leaf_features(feature_model: FeatureModel) -> int:
+def nof_leaf_features(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return feature_model.nof_relations.count(0)
     return sum(len(f.get_relations()) == 0 for f in feature_model.get_features())
 
-def nof_cross_tree_constraints(feature_model: FeatureModel) -> int:
+def nof_cross_tree_constraints(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
     return len(feature_model.get_constraints())
-
@@ -0,0 +1,4 @@
+from .featureide_parser import FeatureIDEParser
+
+
+__all__ = ["FeatureIDEParser"]
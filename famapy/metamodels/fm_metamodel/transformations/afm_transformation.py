@@ -102,7 +102,7 @@ class AFMTransformation(TextToModel):
         feature = Feature(word, [])
         model.features.append(feature)
         self.name_feature[word] = feature
-        relation.children.append(feature)
+        relation.add_child(feature)
 
     @classmethod
     def parse_relation(
@@ -117,5 +117,5 @@ class AFMTransformation(TextToModel):
             relation = Relation(parent=feature_parent, children=[], card_min=0, card_max=1)
         elif relation_type == "Or":
             relation = Relation(parent=feature_parent, children=[], card_min=1, card_max=c_max)
-        feature_parent.relations.append(relation)
+        feature_parent.add_relation(relation)
         return relation
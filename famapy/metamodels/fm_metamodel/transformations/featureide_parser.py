@@ -1,7 +1,7 @@
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
-from famapy.core.models.ast import AST, Node, ASTOperation
+from famapy.core.models.ast import AST, Node, ASTOperation, make_node
 from famapy.core.transformations import TextToModel
 from famapy.metamodels.fm_metamodel.models.feature_model import (
     Constraint,
@@ -12,7 +12,15 @@ from famapy.metamodels.fm_metamodel.models.feature_model import (
 
 
 class FeatureIDEParser(TextToModel):
-    """Parser for FeatureIDE models (.xml)."""
+    """Parser for FeatureIDE models (.xml).
+
+    By default the whole XML document is loaded in memory before building the feature model.
+    With `streaming=True` the document is read incrementally (`ElementTree.iterparse`):
+    features, relations, and constraints are built as their elements are read,
+    processed elements are released, and `<graphics>` subtrees are discarded.
+    This mode reduces the peak memory and does not use recursion for the feature tree,
+    so it is recommended for large models (e.g., Linux).
+    """
 
     # Main tags
     TAG_STRUCT = 'struct'
@@ -23,6 +31,8 @@ class FeatureIDEParser(TextToModel):
     TAG_AND = 'and'
     TAG_OR = 'or'
     TAG_ALT = 'alt'
+    TAG_FEATURE = 'feature'
+    FEATURE_TAGS = (TAG_AND, TAG_OR, TAG_ALT, TAG_FEATURE)
 
     # Constraints tags
     TAG_VAR = 'var'
@@ -41,10 +51,13 @@ class FeatureIDEParser(TextToModel):
     def get_source_extension() -> str:
         return 'fide'
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, streaming: bool = False) -> None:
         self._path = path
+        self._streaming = streaming
 
     def transform(self) -> FeatureModel:
+        if self._streaming:
+            return self._read_feature_model_streaming(self._path)
         return self._read_feature_model(self._path)
 
     def _read_feature_model(self, filepath: str) -> FeatureModel:
@@ -59,6 +72,98 @@ class FeatureIDEParser(TextToModel):
                 model.ctcs.extend(constraints)
         return model
 
+    def _read_feature_model_streaming(self, filepath: str) -> FeatureModel:  # noqa: MC0001
+        root_feature = None
+        constraints = []
+        # Open elements, and open feature elements with the children of their group (if any).
+        elements: list[Element] = []
+        features: list[tuple[Feature, list[Feature]]] = []
+        in_struct = False
+        skipped_depth = 0  # > 0 while inside a <graphics> subtree
+        for event, element in ElementTree.iterparse(filepath, events=('start', 'end')):
+            if event == 'start':
+                parent_element = elements[-1] if elements else None
+                elements.append(element)
+                if skipped_depth > 0 or element.tag == FeatureIDEParser.TAG_GRAPHICS:
+                    skipped_depth += 1
+                elif element.tag == FeatureIDEParser.TAG_STRUCT:
+                    in_struct = True
+                elif in_struct and element.tag in FeatureIDEParser.FEATURE_TAGS:
+                    feature = self._start_feature(element, parent_element, features)
+                    if root_feature is None:
+                        root_feature = feature
+                continue
+
+            elements.pop()
+            parent_element = elements[-1] if elements else None
+            if skipped_depth > 0:
+                skipped_depth -= 1
+                if skipped_depth > 0:
+                    continue
+            elif element.tag == FeatureIDEParser.TAG_STRUCT:
+                in_struct = False
+            elif in_struct and element.tag in FeatureIDEParser.FEATURE_TAGS:
+                self._end_feature(element, features)
+            elif (parent_element is not None and
+                  parent_element.tag == FeatureIDEParser.TAG_CONSTRAINTS):
+                constraints.append(self._read_constraint(element, len(constraints) + 1))
+            elif not (parent_element is None or parent_element is elements[0] or
+                      (in_struct and parent_element.tag in FeatureIDEParser.FEATURE_TAGS)):
+                continue  # part of a constraint still being read
+
+            # Release the processed element
+            element.clear()
+            if parent_element is not None:
+                parent_element.remove(element)
+        return FeatureModel(root_feature, constraints)
+
+    def _start_feature(
+        self,
+        element: Element,
+        parent_element: Element,
+        features: list[tuple[Feature, list[Feature]]]
+    ) -> Feature:
+        parent = features[-1][0] if features else None
+        is_abstract = (
+            FeatureIDEParser.ATTRIB_ABSTRACT in element.attrib and
+            element.attrib[FeatureIDEParser.ATTRIB_ABSTRACT] == "true"
+        )
+        feature = Feature(
+            name=element.attrib[FeatureIDEParser.ATTRIB_NAME],
+            relations=[],
+            parent=parent,
+            is_abstract=is_abstract
+        )
+        if parent is not None:
+            if parent_element.tag == FeatureIDEParser.TAG_AND:
+                if FeatureIDEParser.ATTRIB_MANDATORY in element.attrib:  # Mandatory feature
+                    rel = Relation(parent=parent, children=[feature], card_min=1, card_max=1)
+                else:  # Optional feature
+                    rel = Relation(parent=parent, children=[feature], card_min=0, card_max=1)
+                parent.add_relation(rel)
+            else:  # Child of an alternative or or-group
+                features[-1][1].append(feature)
+        features.append((feature, []))
+        return feature
+
+    def _end_feature(
+        self,
+        element: Element,
+        features: list[tuple[Feature, list[Feature]]]
+    ) -> None:
+        feature, children = features.pop()
+        if element.tag == FeatureIDEParser.TAG_ALT:
+            rel = Relation(parent=feature, children=children, card_min=1, card_max=1)
+            feature.add_relation(rel)
+        elif element.tag == FeatureIDEParser.TAG_OR:
+            rel = Relation(parent=feature, children=children, card_min=1,
+                           card_max=len(children))
+            feature.add_relation(rel)
+
+    def _read_constraint(self, ctc: Element, number: int) -> Constraint:
+        rule = next(r for r in ctc if r.tag != FeatureIDEParser.TAG_GRAPHICS)
+        return Constraint(str(number), AST(self._parse_rule(rule)))
+
     def _read_features(
         self,
         root_tree: Element,
@@ -120,40 +225,21 @@ class FeatureIDEParser(TextToModel):
             number += 1
         return constraints
 
-    def _parse_rule(self, rule: Element) -> AST:
-        """Return the representation of the constraint (rule) in the AST syntax."""
+    def _parse_rule(self, rule: Element) -> Node:
+        """Return the representation of the constraint (rule) in the AST syntax.
+
+        The nodes are hash-consed (see `make_node`), so the repeated subformulas are shared.
+        """
         if rule.tag == FeatureIDEParser.TAG_VAR:
-            node = Node(rule.text)
+            node = make_node(rule.text)
         elif rule.tag == FeatureIDEParser.TAG_NOT:
-            node = Node(ASTOperation.NOT)
-            node.left = self._parse_rule(rule[0])
+            node = make_node(ASTOperation.NOT, [self._parse_rule(rule[0])])
         elif rule.tag == FeatureIDEParser.TAG_IMP:
-            node = Node(ASTOperation.IMPLIES)
-            node.left = self._parse_rule(rule[0])
-            node.right = self._parse_rule(rule[1])
+            node = make_node(ASTOperation.IMPLIES, [self._parse_rule(rule[0]), self._parse_rule(rule[1])])
         elif rule.tag == FeatureIDEParser.TAG_EQ:
-            node = Node(ASTOperation.AND)
-            node.left = Node(ASTOperation.IMPLIES)
-            node.left.left = self._parse_rule(rule[0])
-            node.left.right = self._parse_rule(rule[1])
-            node.right = Node(ASTOperation.IMPLIES)
-            node.right.left = self._parse_rule(rule[1])
-            node.right.right = self._parse_rule(rule[0])
-
+            node = make_node(ASTOperation.EQUIVALENCE, [self._parse_rule(rule[0]), self._parse_rule(rule[1])])
         elif rule.tag == FeatureIDEParser.TAG_DISJ:
-            if len(rule) > 1:
-                node = Node(ASTOperation.OR)
-                node.left = self._parse_rule(rule[0])
-                node.right = self._parse_rule(rule[1])
-
-            else:
-                node = self._parse_rule(rule[0])
-
+            node = make_node(ASTOperation.OR, [self._parse_rule(child) for child in rule])
         elif rule.tag == FeatureIDEParser.TAG_CONJ:
-            if len(rule) > 1:
-                node = Node(ASTOperation.AND)
-                node.left = self._parse_rule(rule[0])
-                node.right = self._parse_rule(rule[1])
-            else:
-                node = self._parse_rule(rule[0])
+            node = make_node(ASTOperation.AND, [self._parse_rule(child) for child in rule])
         return node
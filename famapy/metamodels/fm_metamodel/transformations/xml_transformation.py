@@ -85,7 +85,7 @@ class XMLTransformation(TextToModel):
             if child.tag.casefold() == 'setrelation' or child.tag.casefold() == 'binaryrelation':
                 relation = self.parse_relation(child)
                 relation.parent = feature
-                feature.relations.append(relation)
+                feature.add_relation(relation)
         return feature
 
     def parse_relation(self, element: ElementTree.Element) -> Relation:
@@ -98,7 +98,7 @@ class XMLTransformation(TextToModel):
                 if child.tag.casefold() == 'solitaryfeature':
                     num_solitary_features += 1
                     feature = self.parse_feature(child)
-                    relation.children.append(feature)
+                    relation.add_child(feature)
                 elif child.tag.casefold() == 'cardinality':
                     relation.card_min = int(str(child.attrib.get('min')))
                     relation.card_max = int(str(child.attrib.get('max')))
@@ -109,7 +109,7 @@ class XMLTransformation(TextToModel):
             for child in element:
                 if child.tag.casefold() == 'groupedfeature':
                     feature = self.parse_feature(child)
-                    relation.children.append(feature)
+                    relation.add_child(feature)
                 elif child.tag.casefold() == 'cardinality':
                     relation.card_min = int(str(child.attrib.get('min')))
                     relation.card_max = int(str(child.attrib.get('max')))
@@ -0,0 +1,4 @@
+from .fm_godelization import FMGodelization
+
+
+__all__ = ["FMGodelization"]
@@ -0,0 +1,175 @@
+import math
+from typing import TYPE_CHECKING, Optional
+
+from famapy.metamodels.fm_metamodel.models import FeatureModel, Feature, Relation, FMConfiguration
+
+if TYPE_CHECKING:
+    from famapy.metamodels.bdd_metamodel.models import BDDModel
+
+
+class FMGodelization:
+    """Bijection between the configurations of a feature model and the integers in [0, N),
+    being N the number of configurations.
+
+    With a BDD of the feature model, the configurations are ranked in lexicographic order of
+    the variables of the BDD (following the ordering of the BDD) using the solution counts of
+    its nodes, so the cross-tree constraints are taken into account.
+
+    Without a BDD, only the tree of the feature model is considered (as in `count_configurations`):
+    the number of a configuration is a mixed-radix number whose digits are the choices made in
+    every relation, with the number of configurations of each subtree as radixes
+    (computed once, bottom-up).
+    The tree is traversed without recursion, so the depth of the tree is not limited.
+
+    Neither way enumerates the configurations, so configurations of large models can be stored
+    as (big) integers and accessed randomly by their number.
+    """
+
+    def __init__(self, feature_model: FeatureModel, bdd_model: Optional['BDDModel'] = None) -> None:
+        self.feature_model = feature_model
+        self.bdd_model = bdd_model
+        self._names = {feature.name for feature in feature_model.get_features()}
+        if bdd_model is None:
+            self._counts: dict[str, int] = {}
+            for feature in reversed(feature_model.get_features()):  # children before their parents
+                self._counts[feature.name] = math.prod(self._relation_count(relation)
+                                                       for relation in feature.get_relations())
+            self._nof_configurations = self._counts[feature_model.root.name]
+            # Radixes of the relations of each feature
+            self._radixes = {feature.name: [self._relation_count(relation) for relation in feature.get_relations()]
+                             for feature in feature_model.get_features()}
+        else:
+            from famapy.metamodels.bdd_metamodel.operations.bdd_sampling import node_counts
+
+            self._table = node_counts(bdd_model, bdd_model.root)
+            self._levels = list(range(bdd_model.nof_levels()))
+            self._level_features = [feature_model.get_feature_by_name(bdd_model.bdd.var_at_level(level))
+                                    for level in self._levels]
+            level, _, _, count = self._table[bdd_model.reference(bdd_model.root)]
+            self._nof_configurations = count << level
+
+    def get_number_of_configurations(self) -> int:
+        return self._nof_configurations
+
+    def godelization(self, configuration: FMConfiguration) -> int:
+        """Number of the configuration, in [0, N).
+
+        It raises ValueError if the configuration is not valid or has features not in the model.
+        """
+        selected = {feature.name for feature in configuration.get_selected_features()}
+        unknown = selected - self._names
+        if unknown:
+            raise ValueError(f'Features not in the feature model: {", ".join(sorted(unknown))}.')
+        if self.bdd_model is not None:
+            from famapy.metamodels.bdd_metamodel.operations.bdd_sampling import rank
+
+            bits = [feature.name in selected for feature in self._level_features]
+            return rank(self._table, self.bdd_model.reference(self.bdd_model.root), bits, self._levels)
+
+        for name in selected:
+            parent = self.feature_model.get_parent(self.feature_model.get_feature_by_name(name))
+            if parent is not None and parent.name not in selected:
+                raise ValueError(f'Feature {name} is selected without its parent.')
+        if self.feature_model.root.name not in selected:
+            raise ValueError('The root feature is not selected.')
+        # Number of the subtree of each selected feature, children before their parents
+        ranks: dict[str, int] = {}
+        for feature in reversed(self.feature_model.get_features()):
+            if feature.name in selected:
+                result = 0
+                for relation, radix in zip(feature.get_relations(), self._radixes[feature.name]):
+                    result = result * radix + self._rank_relation(relation, selected, ranks)
+                ranks[feature.name] = result
+        return ranks[self.feature_model.root.name]
+
+    def degodelization(self, number: int) -> FMConfiguration:
+        """Configuration with the given number, with the selected features."""
+        if not 0 <= number < self._nof_configurations:
+            raise ValueError(f'Number {number} out of range [0, {self._nof_configurations}).')
+        if self.bdd_model is not None:
+            from famapy.metamodels.bdd_metamodel.operations.bdd_sampling import unrank
+
+            bits = unrank(self._table, self.bdd_model.reference(self.bdd_model.root), number, self._levels)
+            return FMConfiguration({f: True for f, bit in zip(self._level_features, bits) if bit})
+
+        # Selected features with the number of their subtree, in depth-first order
+        selected = []
+        stack = [(self.feature_model.root, number)]
+        while stack:
+            feature, number = stack.pop()
+            selected.append(feature)
+            digits = []
+            for radix in reversed(self._radixes[feature.name]):
+                number, digit = divmod(number, radix)
+                digits.append(digit)
+            children = []
+            for relation, digit in zip(feature.get_relations(), reversed(digits)):
+                children.extend(self._unrank_relation(relation, digit))
+            stack.extend(reversed(children))
+        return FMConfiguration({f: True for f in selected})
+
+    def _relation_count(self, relation: Relation) -> int:
+        counts = [self._counts[child.name] for child in relation.children]
+        if relation.is_mandatory():
+            return counts[0]
+        if relation.is_optional():
+            return counts[0] + 1
+        if relation.is_alternative():
+            return sum(counts)
+        if relation.is_or():
+            result = 1
+            for count in counts:
+                result *= count + 1
+            return result - 1
+        return 1  # other cardinalities are not counted (as in count_configurations)
+
+    def _rank_relation(self, relation: Relation, selected: set[str], ranks: dict[str, int]) -> int:
+        """Number of the choice made in the relation, given the numbers of the selected children."""
+        children = relation.children
+        if relation.is_mandatory():
+            if children[0].name not in selected:
+                raise ValueError(f'Mandatory feature {children[0].name} is not selected.')
+            return ranks[children[0].name]
+        if relation.is_optional():
+            if children[0].name not in selected:
+                return 0
+            return 1 + ranks[children[0].name]
+        if relation.is_alternative():
+            chosen = [child for child in children if child.name in selected]
+            if len(chosen) != 1:
+                raise ValueError(f'Alternative group of {relation.parent.name} has {len(chosen)} features selected.')
+            offset = 0
+            for child in children:
+                if child.name == chosen[0].name:
+                    return offset + ranks[child.name]
+                offset += self._counts[child.name]
+        if relation.is_or():
+            index = 0
+            for child in children:
+                digit = 1 + ranks[child.name] if child.name in selected else 0
+                index = index * (self._counts[child.name] + 1) + digit
+            if index == 0:
+                raise ValueError(f'Or group of {relation.parent.name} has no features selected.')
+            return index - 1
+        return 0
+
+    def _unrank_relation(self, relation: Relation, number: int) -> list[tuple[Feature, int]]:
+        """Children selected by the choice `number` of the relation, with the numbers of their subtrees."""
+        children = relation.children
+        if relation.is_mandatory():
+            return [(children[0], number)]
+        if relation.is_optional():
+            return [(children[0], number - 1)] if number > 0 else []
+        if relation.is_alternative():
+            for child in children:
+                if number < self._counts[child.name]:
+                    return [(child, number)]
+                number -= self._counts[child.name]
+        if relation.is_or():
+            digits = []
+            index = number + 1
+            for child in reversed(children):
+                index, digit = divmod(index, self._counts[child.name] + 1)
+                digits.append(digit)
+            return [(child, digit - 1) for child, digit in zip(children, reversed(digits)) if digit > 0]
+        return []
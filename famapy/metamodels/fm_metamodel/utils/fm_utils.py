@@ -1,4 +1,6 @@
-from famapy.metamodels.fm_metamodel.models import FeatureModel, Feature
+from typing import Union
+
+from famapy.metamodels.fm_metamodel.models import FeatureModel, Feature, CompactFeatureModel, CompactFeature
 
 
 def is_mandatory(feature: Feature) -> bool:
@@ -26,7 +28,11 @@ def select_parent_features(feature: Feature) -> list[Feature]:
         parent = parent.get_parent()
     return features
 
-def average_branching_factor(feature_model: FeatureModel, precision: int=2) -> float:
+def average_branching_factor(feature_model: Union[FeatureModel, CompactFeatureModel], precision: int=2) -> float:
+    if isinstance(feature_model, CompactFeatureModel):
+        nof_branches = feature_model.nof_features() - feature_model.nof_relations.count(0)
+        nof_children = sum(feature_model.relation_nof_children)
+        return round(nof_children / nof_branches, precision)
     nof_branches = 0
     nof_children = 0
     for feature in feature_model.get_features():
@@ -38,13 +44,26 @@ def average_branching_factor(feature_model: FeatureModel, precision: int=2) -> f
     # nof_childrens = sum(sum(len(r.children) for r in f.get_relations()) for f in feature_model.get_features())
     # return round(nof_childrens / len(feature_model.get_features()), precision)
 
-def max_depth_tree(feature_model: FeatureModel) -> int:
-    return max(len(select_parent_features(f)) for f in leaf_features(feature_model))
+def max_depth_tree(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        depths = [0] * feature_model.nof_features()
+        for feature_id in range(1, feature_model.nof_features()):  # parents come first
+            depths[feature_id] = depths[feature_model.parent[feature_id]] + 1
+        return max(depths)
+    return max(feature_model.get_depth(f) for f in leaf_features(feature_model))
 
-def core_features(feature_model: FeatureModel) -> list[Feature]:
+def core_features(feature_model: Union[FeatureModel, CompactFeatureModel]) -> list[Union[Feature, CompactFeature]]:
     if not feature_model.root:
         return []
 
+    if isinstance(feature_model, CompactFeatureModel):
+        core_ids = [0]
+        for feature_id in core_ids:  # the list grows while iterating
+            for relation in feature_model.relation_ids(feature_id):
+                if feature_model.is_mandatory_relation(relation):
+                    core_ids.extend(feature_model.relation_children_ids(relation))
+        return [CompactFeature(feature_model, i) for i in core_ids]
+
     core_features = [feature_model.root]
     features = [feature_model.root]
     while features:
@@ -55,9 +74,13 @@ def core_features(feature_model: FeatureModel) -> list[Feature]:
                 features.extend(relation.children)
     return core_features
 
-def leaf_features(feature_model: FeatureModel) -> list[Feature]:
+def leaf_features(feature_model: Union[FeatureModel, CompactFeatureModel]) -> list[Union[Feature, CompactFeature]]:
+    if isinstance(feature_model, CompactFeatureModel):
+        return [CompactFeature(feature_model, i) for i, n in enumerate(feature_model.nof_relations) if n == 0]
     return [f for f in feature_model.get_features() if len(f.get_relations()) == 0]
 
-def count_leaf_features(feature_model: FeatureModel) -> int:
+def count_leaf_features(feature_model: Union[FeatureModel, CompactFeatureModel]) -> int:
+    if isinstance(feature_model, CompactFeatureModel):
+        return feature_model.nof_relations.count(0)
     return sum(len(f.get_relations()) == 0 for f in feature_model.get_features())
 
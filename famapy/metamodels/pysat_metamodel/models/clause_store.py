@@ -0,0 +1,203 @@
+import itertools
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+
+INITIAL_CAPACITY = 1024  # literals and clauses
+EVALUATION_BLOCK_SIZE = 1 << 21  # words evaluated at once (literals of the clauses x words of assignments)
+
+
+def _pack(assignments: np.ndarray) -> np.ndarray:
+    """Boolean matrix (assignments x variables) packed into 64-bit words (variables x words)."""
+    padding = -len(assignments) % 64
+    if padding:
+        assignments = np.vstack([assignments, np.zeros((padding, assignments.shape[1]), dtype=bool)])
+    bits = np.packbits(assignments.T, axis=1, bitorder='little')
+    return np.ascontiguousarray(bits).view(np.uint64)
+
+
+class ClauseStore:
+    """Clauses stored as a flat int32 buffer of literals plus the offsets of the clauses.
+
+    The clause i is `literals[offsets[i]:offsets[i + 1]]`. Each clause costs 4 bytes per literal
+    and 8 bytes for its offset, instead of a Python list of int objects.
+    The clauses are only appended (the buffers grow by doubling their capacity), so the
+    clauses already stored never change: the slices of a store (`store[start:stop]`) are views
+    that share its buffers, without copying the clauses.
+    The clauses appended one by one are kept in a list until the store is read, and then
+    copied into the buffers at once.
+
+    It implements the part of the interface of pysat's CNF used by the models:
+    `append`, `extend`, iteration over the clauses (as lists), `clauses`, and `nv`.
+    """
+
+    def __init__(self, clauses: Iterable[Iterable[int]] = ()) -> None:
+        self._literals = np.empty(INITIAL_CAPACITY, dtype=np.int32)
+        self._offsets = np.zeros(INITIAL_CAPACITY + 1, dtype=np.int64)
+        self._nof_clauses = 0
+        self._pending: list[list[int]] = []  # clauses appended but not copied into the buffers yet
+        self._view = False  # views cannot be modified, since they share the buffers
+        self._nv = 0
+        self.extend(clauses)
+
+    @classmethod
+    def from_arrays(cls, literals: np.ndarray, lengths: np.ndarray) -> 'ClauseStore':
+        """Store of the clauses with the given literals and number of literals of each clause."""
+        store = cls()
+        store.extend_arrays(literals, lengths)
+        return store
+
+    @property
+    def nv(self) -> int:
+        """Greatest variable of the clauses (it can be raised, as in pysat's CNF)."""
+        self._flush()
+        return self._nv
+
+    @nv.setter
+    def nv(self, value: int) -> None:
+        self._nv = value
+
+    @property
+    def literals(self) -> np.ndarray:
+        """Literals of all the clauses (a view of the buffer)."""
+        self._flush()
+        return self._literals[self._offsets[0]:self._offsets[self._nof_clauses]]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Start of each clause in `literals`, and the number of literals at the end."""
+        self._flush()
+        offsets = self._offsets[:self._nof_clauses + 1]
+        return offsets - offsets[0] if offsets[0] else offsets
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of literals of each clause."""
+        self._flush()
+        return np.diff(self._offsets[:self._nof_clauses + 1])
+
+    @property
+    def clauses(self) -> list[list[int]]:
+        """Copy of the clauses as lists (as in pysat's CNF)."""
+        return list(self)
+
+    def _reserve(self, nof_literals: int, nof_clauses: int) -> None:
+        if self._view:
+            raise ValueError('The views of a clause store cannot be modified.')
+        end = self._offsets[self._nof_clauses]
+        if end + nof_literals > len(self._literals):
+            literals = np.empty(max(2 * len(self._literals), end + nof_literals), dtype=np.int32)
+            literals[:end] = self._literals[:end]
+            self._literals = literals
+        if self._nof_clauses + nof_clauses + 1 > len(self._offsets):
+            offsets = np.empty(max(2 * len(self._offsets), self._nof_clauses + nof_clauses + 1), dtype=np.int64)
+            offsets[:self._nof_clauses + 1] = self._offsets[:self._nof_clauses + 1]
+            self._offsets = offsets
+
+    def _flush(self) -> None:
+        if self._pending:
+            clauses, self._pending = self._pending, []
+            self._extend_lists(clauses)
+
+    def append(self, clause: Iterable[int]) -> None:
+        if self._view:
+            raise ValueError('The views of a clause store cannot be modified.')
+        self._pending.append(list(clause))
+
+    def extend(self, clauses: Union['ClauseStore', Iterable[Iterable[int]]]) -> None:
+        if isinstance(clauses, ClauseStore):
+            self.extend_arrays(clauses.literals, clauses.lengths)
+        else:
+            self._flush()
+            self._extend_lists([clause if isinstance(clause, list) else list(clause) for clause in clauses])
+
+    def _extend_lists(self, clauses: list[list[int]]) -> None:
+        lengths = np.fromiter(map(len, clauses), dtype=np.int64, count=len(clauses))
+        literals = np.fromiter(itertools.chain.from_iterable(clauses), dtype=np.int32, count=int(lengths.sum()))
+        self.extend_arrays(literals, lengths)
+
+    def extend_arrays(self, literals: np.ndarray, lengths: np.ndarray) -> None:
+        """Append the clauses with the given literals and number of literals of each clause."""
+        self._flush()
+        if len(lengths) == 0:
+            return
+        self._reserve(len(literals), len(lengths))
+        end = self._offsets[self._nof_clauses]
+        self._literals[end:end + len(literals)] = literals
+        self._offsets[self._nof_clauses + 1:self._nof_clauses + 1 + len(lengths)] = end + np.cumsum(lengths)
+        self._nof_clauses += len(lengths)
+        if len(literals) > 0:
+            self._nv = max(self._nv, int(np.abs(literals).max()))
+
+    def first_violated(self, assignments: np.ndarray, ignored: Optional[np.ndarray] = None) -> np.ndarray:
+        """Index of the first clause falsified by each row of the assignments, or -1 if it satisfies them all.
+
+        `assignments` is a boolean matrix with a row per assignment and a column per variable
+        (the column i is the variable i + 1), with at least `nv` columns.
+        The clauses in the boolean mask `ignored` are not evaluated.
+        The assignments are packed in 64-bit words (a bit per assignment), so each literal of
+        the clauses is evaluated for 64 assignments at once; all the clauses are evaluated
+        with NumPy, for blocks of words.
+        """
+        assignments = np.asarray(assignments, dtype=bool)
+        if assignments.ndim != 2 or assignments.shape[1] < self.nv:
+            raise ValueError(f'The assignments must be a matrix with at least {self.nv} columns.')
+        literals = self.literals
+        offsets = self.offsets
+        nonempty = np.diff(offsets) > 0  # the empty clauses are always falsified
+        starts = offsets[:-1][nonempty]
+        columns = np.abs(literals) - 1
+        negative = np.where(literals < 0, ~np.uint64(0), np.uint64(0))[:, np.newaxis]
+
+        result = np.full(len(assignments), -1, dtype=np.int64)
+        block = 64 * max(1, EVALUATION_BLOCK_SIZE // max(1, len(literals)))  # assignments
+        for start in range(0, len(assignments), block):
+            rows = assignments[start:start + block]
+            words = _pack(rows)  # a row per variable, a bit per assignment
+            falsified = np.full((self._nof_clauses, words.shape[1]), ~np.uint64(0))
+            if len(starts) > 0:
+                falsified[nonempty] = ~np.bitwise_or.reduceat(words[columns] ^ negative, starts, axis=0)
+            if ignored is not None:
+                falsified[ignored] = 0
+            # The first falsified clause of each assignment, among the clauses falsified by any
+            candidates = np.flatnonzero(falsified.any(axis=1))
+            if len(candidates) == 0:
+                continue
+            bits = np.unpackbits(falsified[candidates].view(np.uint8), axis=1, bitorder='little')[:, :len(rows)]
+            any_falsified = bits.any(axis=0)
+            result[start:start + len(rows)][any_falsified] = candidates[bits[:, any_falsified].argmax(axis=0)]
+        return result
+
+    def __len__(self) -> int:
+        return self._nof_clauses + len(self._pending)
+
+    def __iter__(self) -> Iterator[list[int]]:
+        self._flush()
+        literals = self.literals.tolist()
+        offsets = self.offsets.tolist()
+        for i in range(self._nof_clauses):
+            yield literals[offsets[i]:offsets[i + 1]]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[list[int], 'ClauseStore']:
+        self._flush()
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._nof_clauses)
+            if step != 1:
+                raise ValueError('Only contiguous slices of a clause store are supported.')
+            view = ClauseStore.__new__(ClauseStore)
+            view._literals = self._literals
+            view._offsets = self._offsets[start:max(start, stop) + 1]
+            view._nof_clauses = max(0, stop - start)
+            view._pending = []
+            view._view = True
+            view._nv = self._nv
+            return view
+        if index < 0:
+            index += self._nof_clauses
+        if not 0 <= index < self._nof_clauses:
+            raise IndexError('clause index out of range')
+        return self._literals[self._offsets[index]:self._offsets[index + 1]].tolist()
+
+    def __repr__(self) -> str:
+        return f'ClauseStore({self.clauses})'
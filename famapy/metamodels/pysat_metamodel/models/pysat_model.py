@@ -1,9 +1,11 @@
-from typing import Any
-
-from pysat.formula import CNF
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 from famapy.core.models import VariabilityModel
 
+from famapy.metamodels.pysat_metamodel.models.clause_store import ClauseStore
+from famapy.metamodels.pysat_metamodel.models.solver_session import SolverSession
+
 
 class PySATModel(VariabilityModel):
 
@@ -12,16 +14,67 @@ class PySATModel(VariabilityModel):
         return 'pysat'
 
     def __init__(self) -> None:
-        self.r_cnf = CNF()
-        self.ctc_cnf = CNF()
+        # Clauses of the relations and of the cross-tree constraints
+        self.r_cnf = ClauseStore()
+        self.ctc_cnf = ClauseStore()
         self.variables: dict[str, Any] = {}
         self.features: dict[str, Any] = {}
+        # Variables of the clauses that are not features (e.g., of cardinality encodings):
+        # the solutions are projected onto the other variables
+        self.auxiliary_variables: set[int] = set()
+        self._solver_pool: dict[bool, list[SolverSession]] = {True: [], False: []}
+        self._cache: dict[str, tuple[tuple[int, int], Any]] = {}
 
     def add_clause(self, clause: list[int]) -> None:
         self.ctc_cnf.append(clause)
 
-    def get_all_clauses(self) -> CNF:
-        clauses = CNF()
-        clauses.extend(self.r_cnf.clauses)
-        clauses.extend(self.ctc_cnf.clauses)
+    def get_all_clauses(self) -> ClauseStore:
+        """Clauses of the relations followed by the cross-tree constraints.
+
+        The combined store is cached until clauses are added to the model, so it must not be modified.
+        """
+        clauses = self.get_cached('all_clauses')
+        if clauses is None:
+            clauses = ClauseStore()
+            clauses.extend(self.r_cnf)
+            clauses.extend(self.ctc_cnf)
+            self.set_cached('all_clauses', clauses)
         return clauses
+
+    def _clauses_version(self) -> tuple[int, int]:
+        # Clauses are only appended to the model
+        return (len(self.r_cnf), len(self.ctc_cnf))
+
+    def get_cached(self, key: str) -> Any:
+        """Result cached with set_cached, or None if the clauses have changed since then."""
+        version, value = self._cache.get(key, (None, None))
+        return value if version == self._clauses_version() else None
+
+    def set_cached(self, key: str, value: Any) -> None:
+        self._cache[key] = (self._clauses_version(), value)
+
+    @contextmanager
+    def solver(self, ctcs: bool = True) -> Iterator[SolverSession]:
+        """Solver session with the clauses of the model.
+
+        If ctcs is False, only the clauses of the relations (r_cnf) are loaded.
+        Idle sessions are kept in a pool and reused, so the clauses are loaded only once
+        (and the new clauses of the model incrementally).
+        Each session is used by only one caller at a time.
+        """
+        pool = self._solver_pool[ctcs]
+        try:
+            session = pool.pop()
+        except IndexError:
+            session = SolverSession(self, ctcs)
+        try:
+            yield session.sync()
+        finally:
+            pool.append(session)
+
+    def delete_solvers(self) -> None:
+        """Release the pooled solver sessions."""
+        for pool in self._solver_pool.values():
+            for session in pool:
+                session.delete()
+            pool.clear()
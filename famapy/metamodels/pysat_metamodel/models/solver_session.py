@@ -0,0 +1,141 @@
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+import numpy as np
+from pysat.solvers import Glucose3
+
+if TYPE_CHECKING:
+    from famapy.metamodels.pysat_metamodel.models.clause_store import ClauseStore
+    from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+
+
+class SolverSession:
+    """Incremental Glucose3 solver loaded with the clauses of a PySATModel.
+
+    The clauses are loaded once; the clauses added to the model afterwards are loaded
+    incrementally the next time the session is synchronized.
+    Queries are answered through assumptions, so the session can be reused by any
+    number of operations.
+    Model enumeration blocks the models found with clauses guarded by a fresh
+    activation literal, which is disabled when the enumeration finishes,
+    so the enumeration does not change the formula for the next queries.
+    The models are projected onto the variables that are not auxiliary
+    (see `PySATModel.auxiliary_variables`), so each one is enumerated once.
+
+    Sessions are obtained from the model with `PySATModel.solver()`, that pools and
+    recycles them.
+    """
+
+    def __init__(self, model: 'PySATModel', ctcs: bool = True) -> None:
+        self.model = model
+        self.ctcs = ctcs  # whether the cross-tree constraints are loaded or not
+        self.solver: Optional[Glucose3] = None
+        self._nof_r_clauses = 0
+        self._nof_ctc_clauses = 0
+        self._nof_vars = 0  # greatest variable of the loaded clauses
+        self._last_var = 0  # greatest variable used, including the activation literals
+        self._activation_vars: set[int] = set()
+        self._reset()
+
+    def _reset(self) -> None:
+        if self.solver is not None:
+            self.solver.delete()
+        self.solver = Glucose3()
+        self._nof_r_clauses = 0
+        self._nof_ctc_clauses = 0
+        self._nof_vars = 0
+        self._last_var = 0
+        self._activation_vars = set()
+
+    def _load(self, clauses: 'ClauseStore') -> bool:
+        """Add the clauses to the solver at once.
+
+        Return False if a clause uses a variable already used as an activation literal,
+        in which case the solver must be rebuilt.
+        """
+        if len(clauses) == 0:
+            return True
+        variables = np.abs(clauses.literals)
+        if self._activation_vars and np.isin(variables, list(self._activation_vars)).any():
+            return False
+        if len(variables) > 0:
+            self._nof_vars = max(self._nof_vars, int(variables.max()))
+        self.solver.append_formula(clauses)
+        return True
+
+    def _load_features(self) -> bool:
+        """Make the solver aware of the features that are not in any clause, so they are free.
+
+        Return False if a feature is already used as an activation literal.
+        """
+        nof_features = max(self.model.features, default=0)
+        if nof_features > self._nof_vars:
+            if nof_features in self._activation_vars:
+                return False
+            self.solver.add_clause([nof_features, -nof_features])
+            self._nof_vars = nof_features
+        return True
+
+    def sync(self) -> 'SolverSession':
+        """Load the clauses added to the model since the last synchronization."""
+        r_clauses = self.model.r_cnf
+        ctc_clauses = self.model.ctc_cnf if self.ctcs else self.model.ctc_cnf[:0]
+        if len(r_clauses) < self._nof_r_clauses or len(ctc_clauses) < self._nof_ctc_clauses:
+            self._reset()  # clauses were removed from the model
+        loaded = (self._load(r_clauses[self._nof_r_clauses:])
+                  and self._load(ctc_clauses[self._nof_ctc_clauses:])
+                  and self._load_features())
+        if not loaded:
+            self._reset()
+            self._load(r_clauses)
+            self._load(ctc_clauses)
+            self._load_features()
+        self._nof_r_clauses = len(r_clauses)
+        self._nof_ctc_clauses = len(ctc_clauses)
+        self._last_var = max(self._last_var, self._nof_vars)
+        return self
+
+    def solve(self, assumptions: Iterable[int] = ()) -> bool:
+        return self.solver.solve(assumptions=list(assumptions))
+
+    def propagate(self, assumptions: Iterable[int] = ()) -> bool:
+        """Unit propagation of the assumptions; False if it finds a conflict."""
+        status, _ = self.solver.propagate(assumptions=list(assumptions))
+        return status
+
+    def set_phases(self, literals: Iterable[int]) -> None:
+        """Preferred polarity of the variables in the next models (only a heuristic)."""
+        self.solver.set_phases(literals=list(literals))
+
+    def reset_phases(self) -> None:
+        """Restore the default polarity of the solver (negative) for all the variables,
+        so the phases set by an operation do not bias the next users of the session."""
+        self.solver.set_phases(literals=range(-self._last_var, 0))
+
+    def get_model(self) -> Optional[list[int]]:
+        """Model of the last satisfiable call, restricted to the (not auxiliary) variables of the model."""
+        model = self.solver.get_model()
+        if model is None:
+            return None
+        auxiliary = self.model.auxiliary_variables
+        return [literal for literal in model
+                if abs(literal) <= self._nof_vars and abs(literal) not in self._activation_vars
+                and abs(literal) not in auxiliary]
+
+    def enum_models(self, assumptions: Iterable[int] = ()) -> Iterator[list[int]]:
+        """Enumerate the models satisfying the assumptions without modifying the formula."""
+        self._last_var += 1
+        activation = self._last_var
+        self._activation_vars.add(activation)
+        assumptions = list(assumptions) + [activation]
+        try:
+            while self.solver.solve(assumptions=assumptions):
+                model = self.get_model()
+                self.solver.add_clause([-activation] + [-literal for literal in model])
+                yield model
+        finally:
+            self.solver.add_clause([-activation])  # disable the blocking clauses
+
+    def delete(self) -> None:
+        if self.solver is not None:
+            self.solver.delete()
+            self.solver = None
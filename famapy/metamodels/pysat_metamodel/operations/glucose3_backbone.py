@@ -0,0 +1,116 @@
+from typing import Optional
+
+from famapy.core.operations import Operation
+from famapy.metamodels.fm_metamodel.models.feature_model import FeatureModel
+from famapy.metamodels.fm_metamodel.utils import fm_utils
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.models.solver_session import SolverSession
+
+
+class Glucose3Backbone(Operation):
+    """Backbone of the model: literals of the features with the same value in all products.
+
+    The positive literals are the core features and the negative literals are the dead features.
+    Each model found by the solver discards the candidates it falsifies, so most features
+    are discarded without a specific SAT call.
+    The backbone is cached in the PySATModel and shared by the core and dead features operations.
+
+    Ref.: [Janota et al. 2015. Algorithms for computing backbones of propositional formulae]
+    """
+
+    CACHE_KEY = 'backbone'
+    RELATIONS_CACHE_KEY = 'backbone_relations'
+
+    def __init__(self) -> None:
+        self.satisfiable = False
+        self.backbone: frozenset[int] = frozenset()
+        self.feature_model: Optional[FeatureModel] = None
+        self.unit_propagation = True
+        self.ctcs = True
+        self.nof_sat_calls = 0
+
+    def set_feature_model(self, feature_model: FeatureModel) -> None:
+        """Feature model from which the PySATModel was built.
+
+        Its core features by the tree structure are added to the backbone without SAT calls.
+        """
+        self.feature_model = feature_model
+
+    def set_unit_propagation(self, unit_propagation: bool) -> None:
+        """Check by unit propagation if a candidate is in the backbone before solving."""
+        self.unit_propagation = unit_propagation
+
+    def set_ctcs(self, ctcs: bool) -> None:
+        """If ctcs is False, compute the backbone of the relations only (r_cnf)."""
+        self.ctcs = ctcs
+
+    def get_backbone(self) -> frozenset[int]:
+        return self.backbone
+
+    def get_result(self) -> frozenset[int]:
+        return self.get_backbone()
+
+    def is_satisfiable(self) -> bool:
+        return self.satisfiable
+
+    def execute(self, model: PySATModel) -> 'Glucose3Backbone':
+        if self.ctcs:
+            cache_key = Glucose3Backbone.CACHE_KEY
+        else:
+            cache_key = Glucose3Backbone.RELATIONS_CACHE_KEY
+        cached = model.get_cached(cache_key)
+        if cached is not None:
+            self.satisfiable, self.backbone = cached
+            return self
+
+        with model.solver(self.ctcs) as solver:
+            self.nof_sat_calls = 1
+            self.satisfiable = solver.solve()
+            if self.satisfiable:
+                try:
+                    self.backbone = frozenset(self._compute_backbone(model, solver))
+                finally:
+                    solver.reset_phases()  # the session goes back to the pool of the model
+            else:
+                self.backbone = frozenset()
+        model.set_cached(cache_key, (self.satisfiable, self.backbone))
+        return self
+
+    def _compute_backbone(self, model: PySATModel, solver: SolverSession) -> set[int]:
+        variables = set(model.variables.values())
+        # Candidates are the literals of the first model
+        candidates = {literal for literal in solver.get_model() if abs(literal) in variables}
+        backbone = set()
+
+        if self.feature_model is not None:
+            for feature in fm_utils.core_features(self.feature_model):
+                literal = model.variables.get(feature.name)
+                if literal in candidates:
+                    candidates.remove(literal)
+                    backbone.add(literal)
+
+        # Preferred phases: the negated candidates, so each model falsifies as many as possible.
+        # They are set before each call, since the solver saves the phases of the last model,
+        # but only rebuilt when the candidates are discarded by a new model.
+        phases = [-candidate for candidate in candidates]
+        while candidates:
+            literal = candidates.pop()
+            if self.unit_propagation and not solver.propagate(assumptions=[-literal]):
+                backbone.add(literal)
+                continue
+            self.nof_sat_calls += 1
+            solver.set_phases(phases)
+            if solver.solve(assumptions=[-literal]):
+                # The candidates falsified by the new model are not in the backbone
+                candidates.intersection_update(solver.get_model())
+                phases = [-candidate for candidate in candidates]
+            else:
+                backbone.add(literal)
+        return backbone
+
+
+def backbone(model: PySATModel, feature_model: Optional[FeatureModel] = None) -> frozenset[int]:
+    operation = Glucose3Backbone()
+    if feature_model is not None:
+        operation.set_feature_model(feature_model)
+    return operation.execute(model).get_result()
@@ -1,9 +1,8 @@
 from typing import Any
 
-from pysat.solvers import Glucose3
-
 from famapy.core.operations import CoreFeatures
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_backbone import Glucose3Backbone
 
 
 class Glucose3CoreFeatures(CoreFeatures):
@@ -18,16 +17,8 @@ class Glucose3CoreFeatures(CoreFeatures):
         return self.get_core_features()
 
     def execute(self, model: PySATModel) -> 'Glucose3CoreFeatures':
-        glucose = Glucose3()
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
-
-        core_features = []
-        if glucose.solve():
-            for variable in model.variables.items():
-                if not glucose.solve(assumptions=[-variable[1]]):
-                    core_features.append(variable[0])
-
+        backbone = Glucose3Backbone().execute(model)
+        core_features = [name for name, variable in model.variables.items()
+                         if variable in backbone.get_backbone()]
         self.core_features = core_features
-        glucose.delete()
         return self
@@ -1,9 +1,8 @@
 from typing import Any
 
-from pysat.solvers import Glucose3
-
 from famapy.core.operations import DeadFeatures
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_backbone import Glucose3Backbone
 
 
 class Glucose3DeadFeatures(DeadFeatures):
@@ -18,15 +17,11 @@ class Glucose3DeadFeatures(DeadFeatures):
         return self.get_dead_features()
 
     def execute(self, model: PySATModel) -> 'Glucose3DeadFeatures':
-        glucose = Glucose3()
-
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
-
-        dead_features = []
-        for variable in model.variables.items():
-            if not glucose.solve(assumptions=[variable[1]]):
-                dead_features.append(variable[0])
+        backbone = Glucose3Backbone().execute(model)
+        if backbone.is_satisfiable():
+            dead_features = [name for name, variable in model.variables.items()
+                             if -variable in backbone.get_backbone()]
+        else:
+            dead_features = list(model.variables)
         self.dead_features = dead_features
-        glucose.delete()
         return self
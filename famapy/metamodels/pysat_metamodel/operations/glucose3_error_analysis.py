@@ -0,0 +1,111 @@
+import copy
+
+from famapy.core.operations import Operation
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_backbone import Glucose3Backbone
+
+
+class ErrorAnalysisReport:
+    """Errors of a PySATModel, with the features identified by their variables."""
+
+    def __init__(self, satisfiable: bool) -> None:
+        self.satisfiable = satisfiable
+        self.dead_features: list[int] = []
+        self.core_features: list[int] = []
+        self.false_optional_features: list[int] = []
+        self.redundancies: list[str] = []
+
+
+class Glucose3ErrorAnalysis(Operation):
+    """Dead, core and false-optional features and redundant constraints in a single pass.
+
+    The features are classified from the backbones of the whole model and of the
+    relations only, that are computed once and shared with the core and dead features
+    operations. The report is cached in the model until its clauses change, so the error
+    detection, error diagnosis and false-optional features operations reuse it;
+    each operation gets its own copy of the report.
+    """
+
+    CACHE_KEY = 'error_analysis'
+
+    def __init__(self) -> None:
+        self.report = ErrorAnalysisReport(False)
+
+    def get_report(self) -> ErrorAnalysisReport:
+        return self.report
+
+    def get_result(self) -> ErrorAnalysisReport:
+        return self.get_report()
+
+    def execute(self, model: PySATModel) -> 'Glucose3ErrorAnalysis':
+        report = model.get_cached(Glucose3ErrorAnalysis.CACHE_KEY)
+        if report is None:
+            report = self._analyze(model)
+            model.set_cached(Glucose3ErrorAnalysis.CACHE_KEY, report)
+        self.report = copy.deepcopy(report)
+        return self
+
+    @staticmethod
+    def _analyze(model: PySATModel) -> ErrorAnalysisReport:
+        backbone_operation = Glucose3Backbone().execute(model)
+        report = ErrorAnalysisReport(backbone_operation.is_satisfiable())
+        if not report.satisfiable:
+            return report
+
+        backbone = backbone_operation.get_backbone()
+        relations_operation = Glucose3Backbone()
+        relations_operation.set_ctcs(False)
+        relations_backbone = relations_operation.execute(model).get_backbone()
+
+        report.dead_features = [feat for feat in model.features if -feat in backbone]
+        report.core_features = [feat for feat in model.features if feat in backbone]
+
+        with model.solver(ctcs=False) as glucose_r:
+            assumption = 1
+            for feat in report.core_features:
+                if feat not in relations_backbone:
+                    if glucose_r.solve(assumptions=[assumption, -feat]):
+                        report.false_optional_features.append(feat)
+                    assumption = feat
+
+        report.redundancies = Glucose3ErrorAnalysis._redundancies(model, relations_backbone)
+        return report
+
+    @staticmethod
+    def _redundancies(model: PySATModel, relations_backbone: frozenset[int]) -> list[str]:
+        redundancies = []
+        for feat in model.features:
+            if feat in relations_backbone:
+                for clause in model.ctc_cnf:
+                    if clause[1] == feat:
+                        if clause[0] < 0:
+                            redundancies.append(
+                                model.features.get(-clause[0]) +
+                                ' requires ' +
+                                model.features.get(feat)
+                            )
+                    if clause[0] == feat:
+                        if clause[1] < 0:
+                            redundancies.append(
+                                model.features.get(feat) +
+                                ' requires ' +
+                                model.features.get(-clause[1])
+                            )
+
+        variables = []
+        for clause in model.ctc_cnf:
+            if clause[1] in variables:
+                if clause[1] > 0:
+                    redundancies.append(
+                        model.features.get(abs(clause[0])) +
+                        ' requires ' +
+                        model.features.get(abs(clause[1]))
+                    )
+                else:
+                    redundancies.append(
+                        model.features.get(abs(clause[0])) +
+                        ' excludes ' +
+                        model.features.get(abs(clause[1]))
+                    )
+            variables.append(clause[1])
+        return redundancies
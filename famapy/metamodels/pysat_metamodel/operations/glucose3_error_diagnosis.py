@@ -1,7 +1,7 @@
-from pysat.solvers import Glucose3
-
 from famapy.core.operations import ErrorDiagnosis
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_error_analysis import \
+    Glucose3ErrorAnalysis
 
 
 class Glucose3ErrorDiagnosis(ErrorDiagnosis):
@@ -16,28 +16,10 @@ class Glucose3ErrorDiagnosis(ErrorDiagnosis):
         return self.get_diagnosis_messages()
 
     def execute(self, model: PySATModel) -> 'Glucose3ErrorDiagnosis': # noqa: MC0001
-        glucose_r = Glucose3()
-        glucose_r_ctc = Glucose3()
-        for clause in model.r_cnf:
-            glucose_r.add_clause(clause)
-            glucose_r_ctc.add_clause(clause)
-        for clause in model.ctc_cnf:
-            glucose_r_ctc.add_clause(clause)
-
-        if glucose_r_ctc.solve():
-            dead_features = []
-            for feat in model.features:
-                if not glucose_r_ctc.solve(assumptions=[feat]):
-                    dead_features.append(feat)
-
-            false_optional_features = []
-            assumption = 1
-            for feat in model.features:
-                if (not glucose_r_ctc.solve(assumptions=[-feat]) and
-                        glucose_r.solve(assumptions=[-feat])):
-                    if glucose_r.solve(assumptions=[assumption, -feat]):
-                        false_optional_features.append(feat)
-                    assumption = feat
+        report = Glucose3ErrorAnalysis().execute(model).get_report()
+        if report.satisfiable:
+            dead_features = report.dead_features
+            false_optional_features = report.false_optional_features
 
             diagnosis = []
             for dead in dead_features:
@@ -135,7 +117,4 @@ class Glucose3ErrorDiagnosis(ErrorDiagnosis):
                         ' excludes ' +
                         model.features.get(-clause[1])
                     )
-
-        glucose_r.delete()
-        glucose_r_ctc.delete()
         return self
@@ -1,9 +1,8 @@
-from typing import Any
-
-from pysat.solvers import Glucose3
+from typing import Any, Iterator, Optional
 
 from famapy.core.models import Configuration
 from famapy.core.operations import Filter
+from famapy.core.utils import iter_limited
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
 
 
@@ -23,21 +22,30 @@ class Glucose3Filter(Filter):
         self.configuration = configuration
 
     def execute(self, model: PySATModel) -> 'Glucose3Filter':
-        glucose = Glucose3()
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
+        self.filter_products.extend(self.iter_filter(model))
+        return self
+
+    def iter_filter(self,
+                    model: PySATModel,
+                    limit: Optional[int] = None,
+                    batch_size: Optional[int] = None) -> Iterator[Any]:
+        """Filtered products computed lazily, without keeping them in memory.
 
+        At most `limit` products are yielded, one by one or in lists of `batch_size` products.
+        """
+        return iter_limited(self._enumerate_products(model), limit, batch_size)
+
+    def _enumerate_products(self, model: PySATModel) -> Iterator[list[Any]]:
         assumptions = [
             model.variables.get(feat[0].name) if feat[1]
             else -model.variables.get(feat[0].name)
             for feat in self.configuration.elements.items()
         ]
 
-        for solution in glucose.enum_models(assumptions=assumptions):
-            product = list()
-            for variable in solution:
-                if variable > 0:
-                    product.append(model.features.get(variable))
-            self.filter_products.append(product)
-        glucose.delete()
-        return self
+        with model.solver() as glucose:
+            for solution in glucose.enum_models(assumptions=assumptions):
+                product = list()
+                for variable in solution:
+                    if variable > 0:
+                        product.append(model.features.get(variable))
+                yield product
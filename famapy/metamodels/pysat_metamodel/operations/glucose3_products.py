@@ -1,8 +1,7 @@
-from typing import Any
-
-from pysat.solvers import Glucose3
+from typing import Any, Iterator, Optional
 
 from famapy.core.operations import Products
+from famapy.core.utils import iter_limited
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
 
 
@@ -18,16 +17,25 @@ class Glucose3Products(Products):
         return self.get_products()
 
     def execute(self, model: PySATModel) -> 'Glucose3Products':
-        glucose = Glucose3()
-
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
-
-        for solutions in glucose.enum_models():
-            product = list()
-            for variable in solutions:
-                if variable > 0:
-                    product.append(model.features.get(variable))
-            self.products.append(product)
-        glucose.delete()
+        self.products.extend(self.iter_products(model))
         return self
+
+    def iter_products(self,
+                      model: PySATModel,
+                      limit: Optional[int] = None,
+                      batch_size: Optional[int] = None) -> Iterator[Any]:
+        """Products computed lazily, without keeping them in memory.
+
+        At most `limit` products are yielded, one by one or in lists of `batch_size` products.
+        """
+        return iter_limited(self._enumerate_products(model), limit, batch_size)
+
+    @staticmethod
+    def _enumerate_products(model: PySATModel) -> Iterator[list[Any]]:
+        with model.solver() as glucose:
+            for solutions in glucose.enum_models():
+                product = list()
+                for variable in solutions:
+                    if variable > 0:
+                        product.append(model.features.get(variable))
+                yield product
@@ -1,5 +1,3 @@
-from pysat.solvers import Glucose3
-
 from famapy.core.operations import ProductsNumber
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
 
@@ -16,11 +14,7 @@ class Glucose3ProductsNumber(ProductsNumber):
         return self.get_products_number()
 
     def execute(self, model: PySATModel) -> 'Glucose3ProductsNumber':
-        glucose = Glucose3()
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
-
-        for _ in glucose.enum_models():
-            self.products_number += 1
-        glucose.delete()
+        with model.solver() as glucose:
+            for _ in glucose.enum_models():
+                self.products_number += 1
         return self
@@ -1,5 +1,3 @@
-from pysat.solvers import Glucose3
-
 from famapy.core.operations import Valid
 
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
@@ -17,9 +15,6 @@ class Glucose3Valid(Valid):
         return self.is_valid()
 
     def execute(self, model: PySATModel) -> 'Glucose3Valid':
-        glucose = Glucose3()
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
-        self.result = glucose.solve()
-        glucose.delete()
+        with model.solver() as glucose:
+            self.result = glucose.solve()
         return self
@@ -1,5 +1,3 @@
-from pysat.solvers import Glucose3
-
 from famapy.core.operations import ValidConfiguration
 from famapy.core.models import Configuration
 
@@ -22,11 +20,6 @@ class Glucose3ValidConfiguration(ValidConfiguration):
         self.configuration = configuration
 
     def execute(self, model: PySATModel) -> 'Glucose3ValidConfiguration':
-        glucose = Glucose3()
-
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
-
         assumptions = []
         for feat in self.configuration.elements.items():
             if feat[1]:
@@ -34,6 +27,6 @@ class Glucose3ValidConfiguration(ValidConfiguration):
             elif not feat[1]:
                 assumptions.append(-model.variables[feat[0].name])
 
-        self.result = glucose.solve(assumptions=assumptions)
-        glucose.delete()
+        with model.solver() as glucose:
+            self.result = glucose.solve(assumptions=assumptions)
         return self
@@ -0,0 +1,113 @@
+from typing import Optional
+
+import numpy as np
+
+from famapy.core.models import Configuration
+from famapy.core.operations import Operation
+
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+
+
+class Glucose3ValidConfigurations(Operation):
+    """Validity of a batch of configurations.
+
+    The complete configurations (that assign all the features) are checked by evaluating all
+    the clauses of the model at once with NumPy (see `ClauseStore.first_violated`);
+    the solver is only used for the partial configurations, as in Glucose3ValidConfiguration,
+    and for the clauses with auxiliary variables (e.g., of cardinality encodings or Tseitin
+    transformations), whose values are not given by the configurations: the configurations
+    that satisfy the other clauses are checked with the solver if the model has such clauses.
+
+    The configurations are given as a list of configurations (`set_configurations`), or as a
+    boolean matrix of complete assignments (`set_assignments`), with a row per configuration and
+    a column per variable (the column i is the variable i + 1).
+    The result is a boolean array with the validity of each configuration, and
+    `get_first_violated` returns the index of the first clause (in `PySATModel.get_all_clauses`)
+    falsified by each configuration, or -1 if it is valid or the clause is unknown
+    (the configurations checked with the solver).
+    """
+
+    def __init__(self) -> None:
+        self.configurations: list[Configuration] = []
+        self.complete = False
+        self.assignments: Optional[np.ndarray] = None
+        self.result = np.zeros(0, dtype=bool)
+        self.first_violated = np.zeros(0, dtype=np.int64)
+
+    def set_configurations(self, configurations: list[Configuration], complete: bool = False) -> None:
+        """If complete is True, the features not in a configuration are deselected."""
+        self.configurations = configurations
+        self.complete = complete
+        self.assignments = None
+
+    def set_assignments(self, assignments: np.ndarray) -> None:
+        self.assignments = np.asarray(assignments, dtype=bool)
+        self.configurations = []
+
+    def is_valid(self) -> np.ndarray:
+        return self.result
+
+    def get_result(self) -> np.ndarray:
+        return self.is_valid()
+
+    def get_first_violated(self) -> np.ndarray:
+        return self.first_violated
+
+    def execute(self, model: PySATModel) -> 'Glucose3ValidConfigurations':
+        clauses = model.get_all_clauses()
+        nof_columns = max(clauses.nv, max(model.features, default=0))
+        if self.assignments is not None:
+            assignments = np.zeros((len(self.assignments), max(nof_columns, self.assignments.shape[1])), dtype=bool)
+            assignments[:, :self.assignments.shape[1]] = self.assignments
+            partial = np.zeros(len(assignments), dtype=bool)
+        else:
+            assignments, partial = self._assignments(model, nof_columns)
+
+        ignored = self._auxiliary_clauses(model)
+        self.first_violated = np.full(len(assignments), -1, dtype=np.int64)
+        self.first_violated[~partial] = clauses.first_violated(assignments[~partial], ignored)
+        self.result = self.first_violated < 0
+
+        # Configurations that need the solver
+        pending = partial.copy()
+        if ignored.any():
+            pending |= self.result
+        if pending.any():
+            features = np.array(sorted(model.features), dtype=np.int64)
+            with model.solver() as session:
+                for row in np.flatnonzero(pending):
+                    if partial[row]:
+                        configuration = self.configurations[row]
+                        assumptions = [model.variables[feature.name] if selected else -model.variables[feature.name]
+                                       for feature, selected in configuration.elements.items()]
+                    else:
+                        assumptions = np.where(assignments[row, features - 1], features, -features).tolist()
+                    self.result[row] = session.solve(assumptions=assumptions)
+        return self
+
+    def _assignments(self, model: PySATModel, nof_columns: int) -> tuple[np.ndarray, np.ndarray]:
+        """Matrix of the assignments of the configurations, and whether each one is partial."""
+        assignments = np.zeros((len(self.configurations), nof_columns), dtype=bool)
+        partial = np.zeros(len(self.configurations), dtype=bool)
+        nof_features = len(model.features)
+        for row, configuration in enumerate(self.configurations):
+            selected = [model.variables[feature.name] - 1
+                        for feature, value in configuration.elements.items() if value]
+            assignments[row, selected] = True
+            partial[row] = not self.complete and len(configuration.elements) < nof_features
+        return assignments, partial
+
+    @staticmethod
+    def _auxiliary_clauses(model: PySATModel) -> np.ndarray:
+        """Boolean mask of the clauses of the model with auxiliary variables (i.e., not features)."""
+        mask = model.get_cached('auxiliary_clauses')
+        if mask is None:
+            clauses = model.get_all_clauses()
+            is_feature = np.zeros(max(clauses.nv, max(model.features, default=0)) + 1, dtype=bool)
+            is_feature[list(model.features)] = True
+            auxiliary = ~is_feature[np.abs(clauses.literals)]
+            clause_of_literal = np.repeat(np.arange(len(clauses)), np.diff(clauses.offsets))
+            mask = np.zeros(len(clauses), dtype=bool)
+            mask[clause_of_literal[auxiliary]] = True
+            model.set_cached('auxiliary_clauses', mask)
+        return mask
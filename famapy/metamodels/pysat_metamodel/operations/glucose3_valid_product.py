@@ -1,5 +1,3 @@
-from pysat.solvers import Glucose3
-
 from famapy.core.operations import ValidProduct
 from famapy.core.models import Configuration
 
@@ -22,10 +20,6 @@ class Glucose3ValidProduct(ValidProduct):
         self.configuration = configuration
 
     def execute(self, model: PySATModel) -> 'Glucose3ValidProduct':
-        glucose = Glucose3()
-        for clause in model.get_all_clauses():  # AC es conjunto de conjuntos
-            glucose.add_clause(clause)  # añadimos la constraint
-
         assumptions = []
 
         config: list[str] = []
@@ -38,6 +32,6 @@ class Glucose3ValidProduct(ValidProduct):
             else:
                 assumptions.append(-model.variables[feat])
 
-        self.result = glucose.solve(assumptions=assumptions)
-        glucose.delete()
+        with model.solver() as glucose:
+            self.result = glucose.solve(assumptions=assumptions)
         return self
@@ -0,0 +1,70 @@
+from pysat.card import CardEnc, EncType, UnsupportedBound
+from pysat.formula import IDPool
+
+
+# Number of children of a group from which its cardinality is encoded with auxiliary variables
+DEFAULT_CARDINALITY_THRESHOLD = 8
+# The sequential counter is compact in clauses and also in BDDs (see `BDDModel.from_clauses`);
+# the totalizers and the sorting and cardinality networks lead to large intermediate BDDs.
+DEFAULT_CARDINALITY_ENCODING = EncType.seqcounter
+
+
+def _check_encoding(encoding: int) -> None:
+    if encoding == EncType.native:
+        raise ValueError('The native cardinality constraints of pysat are not clauses.')
+
+
+def at_least(literals: list[int], bound: int, vpool: IDPool, encoding: int) -> list[list[int]]:
+    """Clauses of `bound <= #literals`; [[]] if it is unsatisfiable."""
+    _check_encoding(encoding)
+    if bound <= 0:
+        return []
+    if bound > len(literals):
+        return [[]]
+    try:
+        return CardEnc.atleast(literals, bound, vpool=vpool, encoding=encoding).clauses
+    except UnsupportedBound:  # encodings of at most one (pairwise, bitwise, ladder)
+        return CardEnc.atleast(literals, bound, vpool=vpool, encoding=DEFAULT_CARDINALITY_ENCODING).clauses
+
+
+def at_most(literals: list[int], bound: int, vpool: IDPool, encoding: int) -> list[list[int]]:
+    """Clauses of `#literals <= bound`; [[]] if it is unsatisfiable."""
+    _check_encoding(encoding)
+    if bound >= len(literals):
+        return []
+    if bound < 0:
+        return [[]]
+    try:
+        return CardEnc.atmost(literals, bound, vpool=vpool, encoding=encoding).clauses
+    except UnsupportedBound:  # encodings of at most one (pairwise, bitwise, ladder)
+        return CardEnc.atmost(literals, bound, vpool=vpool, encoding=DEFAULT_CARDINALITY_ENCODING).clauses
+
+
+def group_cardinality(parent: int, children: list[int], card_min: int, card_max: int,
+                      vpool: IDPool, encoding: int) -> list[list[int]]:
+    """Clauses of `parent <-> card_min <= #children <= card_max` with a cardinality encoding of pysat.card.
+
+    It is the same formula as the enumeration of the combinations of children,
+    but its size is polynomial in the number of children.
+    The auxiliary variables are taken from `vpool`; they are not functionally defined
+    by the children, so the solutions of the formula must be projected onto the other variables.
+    """
+    # parent -> card_min <= #children <= card_max
+    clauses = [[-parent] + clause for clause in at_least(children, card_min, vpool, encoding)]
+    clauses.extend([-parent] + clause for clause in at_most(children, card_max, vpool, encoding))
+    # not parent -> #children < card_min or #children > card_max
+    fewer = at_most(children, card_min - 1, vpool, encoding)
+    more = at_least(children, card_max + 1, vpool, encoding)
+    if not fewer or not more:
+        return clauses  # one of them always holds
+    if fewer == [[]] and more == [[]]:
+        clauses.append([parent])
+    elif fewer == [[]]:
+        clauses.extend([parent] + clause for clause in more)
+    elif more == [[]]:
+        clauses.extend([parent] + clause for clause in fewer)
+    else:
+        selector = vpool.id()  # true: more than card_max, false: less than card_min
+        clauses.extend([parent, -selector] + clause for clause in more)
+        clauses.extend([parent, selector] + clause for clause in fewer)
+    return clauses
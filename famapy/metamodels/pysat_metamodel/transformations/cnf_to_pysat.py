@@ -55,7 +55,6 @@ class CNFReader(TextToModel):
         self._path = path
         self.counter = 1
         self.destination_model = PySATModel()
-        self.cnf = self.destination_model.cnf
 
     def transform(self) -> PySATModel:
         self._read_clauses()
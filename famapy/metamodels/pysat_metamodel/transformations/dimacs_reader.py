@@ -0,0 +1,125 @@
+import gzip
+from typing import BinaryIO
+
+import numpy as np
+
+from famapy.core.transformations import TextToModel
+
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+DEFAULT_CHUNK_SIZE = 1 << 20  # bytes
+
+
+def open_dimacs(path: str) -> BinaryIO:
+    """Binary file of the DIMACS formula, decompressed if it is gzipped."""
+    with open(path, 'rb') as file:
+        compressed = file.read(2) == GZIP_MAGIC
+    return gzip.open(path, 'rb') if compressed else open(path, 'rb')
+
+
+class DimacsReader(TextToModel):
+    """Read a CNF formula in DIMACS format (optionally gzipped) into a PySATModel.
+
+    The names of the variables are taken from the comments `c <id> <name>`
+    (as written by FeatureIDE, KConfigReader, or DimacsWriter).
+    If the file names some variables, the variables without name are auxiliary
+    (see `PySATModel.auxiliary_variables`); otherwise, each variable is named by its id.
+    As with the textual CNF formulas (see `CNFReader`), the clauses are added as
+    cross-tree constraints. `PysatToCNF` only converts the models without auxiliary variables
+    into a CNFModel (i.e., the files that name all their variables, or none).
+
+    The file is read in binary chunks of `chunk_size` bytes, and the literals of the
+    chunks without comments are converted at once, so the lines are not processed one by one;
+    the clauses are split with NumPy and stored directly in the flat clause store of the model.
+    """
+
+    @staticmethod
+    def get_source_extension() -> str:
+        return 'dimacs'
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self._path = path
+        self._chunk_size = chunk_size
+        self.destination_model = PySATModel()
+        self.nof_variables = 0  # from the problem line ('p cnf <variables> <clauses>')
+        self.nof_clauses = 0
+
+    def transform(self) -> PySATModel:
+        names: dict[int, str] = {}
+        chunks: list[np.ndarray] = []  # literals of each chunk, including the 0 that end the clauses
+        with open_dimacs(self._path) as file:
+            rest = b''  # incomplete last line of the previous chunk
+            finished = False
+            while not finished:
+                chunk = file.read(self._chunk_size)
+                if not chunk:
+                    finished = True
+                    data = rest
+                else:
+                    cut = chunk.rfind(b'\n') + 1
+                    if cut == 0:
+                        rest += chunk
+                        continue
+                    data, rest = rest + chunk[:cut], chunk[cut:]
+                literals, end = self._parse(data, names)
+                if literals:
+                    chunks.append(np.array(literals, dtype=np.int32))
+                if end:
+                    break
+        literals, lengths = self._split_clauses(np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32))
+
+        model = self.destination_model
+        max_var = int(np.abs(literals).max()) if len(literals) > 0 else 0
+        nof_variables = max(self.nof_variables, max_var)
+        for var in range(1, nof_variables + 1):
+            if var in names or not names:
+                name = names.get(var, str(var))
+                model.variables[name] = var
+                model.features[var] = name
+            else:
+                model.auxiliary_variables.add(var)
+        model.ctc_cnf.extend_arrays(literals, lengths)
+        model.ctc_cnf.nv = max(model.ctc_cnf.nv, nof_variables)
+        return model
+
+    def _parse(self, data: bytes, names: dict[int, str]) -> tuple[list[int], bool]:
+        """Literals of the complete lines in `data`, and whether the end of the formula ('%') is reached.
+
+        The comments with the names of the variables are stored in `names`.
+        """
+        if not any(symbol in data for symbol in (b'c', b'p', b'%')):
+            return list(map(int, data.split())), False
+        literals: list[int] = []
+        for line in data.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            first = line[:1]
+            if first == b'c':
+                tokens = line.split(maxsplit=2)
+                if len(tokens) == 3 and tokens[0] == b'c' and tokens[1].isdigit():
+                    names[int(tokens[1])] = tokens[2].decode('utf-8')
+            elif first == b'p':
+                tokens = line.split()
+                if len(tokens) != 4 or tokens[1] != b'cnf':
+                    raise ValueError(f'Invalid DIMACS problem line: {line.decode("utf-8")}')
+                self.nof_variables, self.nof_clauses = int(tokens[2]), int(tokens[3])
+            elif first == b'%':  # end of the formula in the SATLIB benchmarks
+                return literals, True
+            else:
+                literals.extend(map(int, line.split()))
+        return literals, False
+
+    @staticmethod
+    def _split_clauses(literals: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Literals without the 0 that end the clauses, and the number of literals of each clause.
+
+        The literals after the last 0 are the last clause (without the final 0).
+        """
+        ends = np.flatnonzero(literals == 0)
+        if len(literals) > 0 and literals[-1] != 0:
+            ends = np.append(ends, len(literals))
+        lengths = np.diff(ends, prepend=-1) - 1
+        return literals[literals != 0], lengths
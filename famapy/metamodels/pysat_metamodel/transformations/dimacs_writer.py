@@ -0,0 +1,46 @@
+import gzip
+from typing import Optional
+
+from famapy.core.transformations import ModelToText
+
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+
+
+CLAUSES_PER_WRITE = 10000
+COMPRESS_LEVEL = 6  # the default level of gzip (9) is several times slower for a similar size
+
+
+class DimacsWriter(ModelToText):
+    """Write the clauses of a PySATModel in DIMACS format.
+
+    The names of the features are written as comments `c <id> <name>`, so DimacsReader
+    restores them; the auxiliary variables are not named.
+    The file is gzipped if `compress` is True, or if it is None and the path ends with '.gz'.
+    This is the format for exchanging the models with auxiliary variables, which a CNFModel
+    (see `PysatToCNF`) cannot represent; the textual CNF formulas written with CNFWriter are
+    read into a PySATModel with CNFReader (see `cnf_to_pysat`).
+    """
+
+    @staticmethod
+    def get_destination_extension() -> str:
+        return 'dimacs'
+
+    def __init__(self, path: str, source_model: PySATModel, compress: Optional[bool] = None) -> None:
+        self._path = path
+        self._source_model = source_model
+        self._compress = path.endswith('.gz') if compress is None else compress
+
+    def transform(self) -> None:
+        model = self._source_model
+        clauses = model.get_all_clauses()
+        nof_variables = max(model.r_cnf.nv, model.ctc_cnf.nv, max(model.features, default=0))
+        header = [f'c {var} {model.features[var]}\n' for var in sorted(model.features)]
+        header.append(f'p cnf {nof_variables} {len(clauses)}\n')
+        with (gzip.open(self._path, 'wb', compresslevel=COMPRESS_LEVEL) if self._compress
+              else open(self._path, 'wb')) as file:
+            file.write(''.join(header).encode('utf-8'))
+            for start in range(0, len(clauses), CLAUSES_PER_WRITE):
+                lines = [' '.join(map(str, clause)) + ' 0\n' if clause else '0\n'
+                         for clause in clauses[start:start + CLAUSES_PER_WRITE]]
+                file.write(''.join(lines).encode('ascii'))
+        return None
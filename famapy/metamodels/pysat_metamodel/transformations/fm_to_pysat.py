@@ -1,4 +1,7 @@
 import itertools
+from typing import Optional
+
+from pysat.formula import IDPool
 
 from famapy.core.exceptions import ElementNotFound
 from famapy.core.models import VariabilityModel
@@ -9,9 +12,31 @@ from famapy.metamodels.fm_metamodel.models.feature_model import (  # pylint: dis
     Relation,
 )
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.transformations.cardinality_encodings import (
+    DEFAULT_CARDINALITY_ENCODING,
+    DEFAULT_CARDINALITY_THRESHOLD,
+    at_most,
+    group_cardinality
+)
 
 
 class FmToPysat(ModelToModel):
+    """Transform a feature model into the clauses of a PySATModel.
+
+    The alternative and [min..max] groups with more children than `cardinality_threshold`
+    are encoded with the `cardinality_encoding` of pysat.card (see `pysat.card.EncType`),
+    so their number of clauses is polynomial instead of quadratic or exponential.
+    A threshold of None disables the encodings.
+
+    The cross-tree constraints are encoded with the Tseitin (Plaisted-Greenbaum) transformation
+    (see `AST.get_tseitin_clauses`), or with the distribution of ORs over ANDs if `tseitin` is False.
+
+    Both encodings add auxiliary variables, which are recorded in the model
+    (see `PySATModel.auxiliary_variables`) so the solutions are projected onto the features.
+    The transformations that name every variable by its feature (e.g., PysatToCNF) need a model
+    without them: `cardinality_threshold=None` and `tseitin=False`.
+    """
+
     @staticmethod
     def get_source_extension() -> str:
         return 'fm'
@@ -20,9 +45,16 @@ class FmToPysat(ModelToModel):
     def get_destination_extension() -> str:
         return 'pysat'
 
-    def __init__(self, source_model: VariabilityModel) -> None:
+    def __init__(self, source_model: VariabilityModel,
+                 cardinality_threshold: Optional[int] = DEFAULT_CARDINALITY_THRESHOLD,
+                 cardinality_encoding: int = DEFAULT_CARDINALITY_ENCODING,
+                 tseitin: bool = True) -> None:
         self.source_model = source_model
+        self.cardinality_threshold = cardinality_threshold
+        self.cardinality_encoding = cardinality_encoding
+        self.tseitin = tseitin
         self.counter = 1
+        self.vpool = None  # auxiliary variables, after the variables of the features
         self.destination_model = PySATModel()
         self.r_cnf = self.destination_model.r_cnf
         self.ctc_cnf = self.destination_model.ctc_cnf
@@ -36,7 +68,12 @@ class FmToPysat(ModelToModel):
     def add_root(self, feature: Feature) -> None:
         self.r_cnf.append([self.destination_model.variables.get(feature.name)])
 
+    def _use_cardinality_encoding(self, relation: Relation) -> bool:
+        return self.cardinality_threshold is not None and len(relation.children) > self.cardinality_threshold
+
     def add_relation(self, relation: Relation) -> None:  # noqa: MC0001
+        if self.vpool is None:
+            self.vpool = IDPool(start_from=self.counter)
         if relation.is_mandatory():
             self.r_cnf.append([
                 -1 * self.destination_model.variables.get(relation.parent.name),
@@ -79,9 +116,13 @@ class FmToPysat(ModelToModel):
                 alt_cnf.append(self.destination_model.variables.get(child.name))
             self.r_cnf.append(alt_cnf)
 
+            # at most one child: pairwise, or with a cardinality encoding for large groups
+            pairwise = not self._use_cardinality_encoding(relation)
+            if not pairwise:
+                self.r_cnf.extend(at_most(alt_cnf[1:], 1, self.vpool, self.cardinality_encoding))
             for i in range(len(relation.children)):
                 for j in range(i + 1, len(relation.children)):
-                    if i != j:
+                    if i != j and pairwise:
                         self.r_cnf.append([
                             -1 * self.destination_model.variables.get(relation.children[i].name),
                             -1 * self.destination_model.variables.get(relation.children[j].name)
@@ -96,6 +137,14 @@ class FmToPysat(ModelToModel):
             _min = relation.card_min
             _max = relation.card_max
 
+            if self._use_cardinality_encoding(relation):
+                self.r_cnf.extend(group_cardinality(
+                    self.destination_model.variables.get(relation.parent.name),
+                    [self.destination_model.variables.get(child.name) for child in relation.children],
+                    _min, _max, self.vpool, self.cardinality_encoding
+                ))
+                return
+
             for val in range(len(relation.children) + 1):
                 if val < _min or val > _max:
                     # These sets are the combinations that shouldn't be in the res
@@ -125,41 +174,18 @@ class FmToPysat(ModelToModel):
                         self.r_cnf.append(cnf)
 
     def add_constraint(self, ctc: Constraint) -> None:
-        #We are only supporting requires or excludes
-        if ctc.ast.root.data.upper() == 'REQUIRES' or ctc.ast.root.data.upper() == 'IMPLIES':
-            dest = self.destination_model.variables.get(
-                ctc.ast.root.right.data
-            )
-            orig = self.destination_model.variables.get(
-                ctc.ast.root.left.data
-            )
-            if dest is None or orig is None:
-                print(self.source_model)
-                raise ElementNotFound
-            self.r_cnf.append([-1 * orig, dest])
-        elif ctc.ast.root.data.upper() == 'EQUIVALENCE':
-            dest = self.destination_model.variables.get(
-                ctc.ast.root.right.data
-            )
-            orig = self.destination_model.variables.get(
-                ctc.ast.root.left.data
-            )
-            if dest is None or orig is None:
-                print(self.source_model)
-                raise ElementNotFound
-            self.r_cnf.append([-1 * orig, dest])
-            self.r_cnf.append([-1 * dest, orig])
-        elif ctc.ast.root.data.upper() == 'EXCLUDES':
-            dest = self.destination_model.variables.get(
-                ctc.ast.root.right.data
-            )
-            orig = self.destination_model.variables.get(
-                ctc.ast.root.left.data
-            )
-            if dest is None or orig is None:
-                print(self.source_model)
-                raise ElementNotFound
-            self.r_cnf.append([-1 * orig, -1 * dest])
+        if self.vpool is None:
+            self.vpool = IDPool(start_from=self.counter)
+        try:
+            if self.tseitin:
+                clauses = ctc.ast.get_tseitin_clauses(self.destination_model.variables, self.vpool.id)
+            else:
+                clauses = [[-self.destination_model.variables[term[1:]] if term.startswith('-')
+                            else self.destination_model.variables[term] for term in clause]
+                           for clause in ctc.ast.get_clauses()]
+        except KeyError as error:
+            raise ElementNotFound from error
+        self.r_cnf.extend(clauses)
 
     def transform(self) -> VariabilityModel:
         for feature in self.source_model.get_features():
@@ -173,4 +199,6 @@ class FmToPysat(ModelToModel):
         for constraint in self.source_model.get_constraints():
             self.add_constraint(constraint)
 
+        if self.vpool is not None:
+            self.destination_model.auxiliary_variables.update(range(self.counter, self.vpool.top + 1))
         return self.destination_model
@@ -1,6 +1,9 @@
-from pysat.solvers import Glucose3
+from typing import Iterator, Optional
 
+from famapy.core.models import BitsetConfiguration, ElementIndex
+from famapy.core.utils import iter_limited
 from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid_configurations import Glucose3ValidConfigurations
 from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
 
 from famapy.metamodels.fm_metamodel.models.feature_model import FeatureModel, Feature
@@ -20,49 +23,59 @@ class AAFMsHelper:
             
         #self.variables = {value: key for (key, value) in self.cnf_model.features.items()}
         #print(f"Variables: {self.variables}")
-        self.solver = Glucose3()
-        self.solver.append_formula(self.cnf_model.cnf)
         #print(f"CNF: {[c for c in self.cnf_model.cnf]}")
         #print(f"CNF features: {[c for c in self.cnf_model.features.items()]}")
 
     def is_valid_configuration(self, config: FMConfiguration) -> bool:
-        variables = [value if config.is_selected(self.feature_model.get_feature_by_name(feature_name)) else -value for (value, feature_name) in self.cnf_model.features.items()]
-        return self.solver.solve(assumptions=variables)
+        selected = {feature.name for feature in config.get_selected_features()}
+        variables = [value if feature_name in selected else -value for (value, feature_name) in self.cnf_model.features.items()]
+        with self.cnf_model.solver() as solver:
+            return solver.solve(assumptions=variables)
+
+    def are_valid_configurations(self, configs: list[FMConfiguration]) -> list[bool]:
+        """Validity of each configuration (the features not selected are deselected), checked in a batch."""
+        operation = Glucose3ValidConfigurations()
+        operation.set_configurations(configs, complete=True)
+        return operation.execute(self.cnf_model).get_result().tolist()
 
     def is_valid_partial_configuration(self, config: FMConfiguration) -> bool:
         variables = [self.cnf_model.variables[feature.name] if selected else -self.cnf_model.variables[feature.name] for (feature, selected) in config.elements.items() ]
-        return self.solver.solve(assumptions=variables)
+        with self.cnf_model.solver() as solver:
+            return solver.solve(assumptions=variables)
 
     def get_configurations(self) -> list[FMConfiguration]:
-        solver = Glucose3()
-        solver.append_formula(self.cnf_model.cnf)
-        configurations = []
-        for solutions in solver.enum_models():
-            elements = dict()
-            for variable in solutions:
-                if variable > 0:  # This feature should appear in the product
-                    feature = self.feature_model.get_feature_by_name(self.cnf_model.features[variable])
-                    elements[feature] = True
-            config = FMConfiguration(elements=elements)
-            configurations.append(config)
-        solver.delete()
-        return configurations
+        return list(self.iter_configurations())
 
-    def get_products(self) -> list[FMConfiguration]:
-        solver = Glucose3()
-        solver.append_formula(self.cnf_model.cnf)
-        configurations = []
-        for solutions in solver.enum_models():
-            elements = dict()
-            for variable in solutions:
-                if variable > 0:  # This feature should appear in the product
-                    feature = self.feature_model.get_feature_by_name(self.cnf_model.features.get(variable))
-                    if not feature.is_abstract:
+    def iter_configurations(self, limit: Optional[int] = None, batch_size: Optional[int] = None) -> Iterator[FMConfiguration]:
+        """Configurations computed lazily, at most `limit`, one by one or in lists of `batch_size`."""
+        return iter_limited(self._enumerate_configurations(), limit, batch_size)
+
+    def _enumerate_configurations(self) -> Iterator[FMConfiguration]:
+        with self.cnf_model.solver() as solver:
+            for solutions in solver.enum_models():
+                elements = dict()
+                for variable in solutions:
+                    if variable > 0:  # This feature should appear in the product
+                        feature = self.feature_model.get_feature_by_name(self.cnf_model.features[variable])
                         elements[feature] = True
-            config = FMConfiguration(elements=elements)
-            configurations.append(config)
-        solver.delete()
-        return list(set(configurations))
+                yield FMConfiguration(elements=elements)
+
+    def get_products(self) -> list[FMConfiguration]:
+        # Products are the configurations without the abstract features, so they are repeated:
+        # they are deduplicated by their bitsets (see BitsetConfiguration)
+        index = ElementIndex(self.feature_model.get_features())
+        products: dict[BitsetConfiguration, FMConfiguration] = {}
+        with self.cnf_model.solver() as solver:
+            for solutions in solver.enum_models():
+                elements = dict()
+                for variable in solutions:
+                    if variable > 0:  # This feature should appear in the product
+                        feature = self.feature_model.get_feature_by_name(self.cnf_model.features.get(variable))
+                        if not feature.is_abstract:
+                            elements[feature] = True
+                products.setdefault(BitsetConfiguration.from_elements(index, elements),
+                                    FMConfiguration(elements=elements))
+        return list(products.values())
 
     def get_core_features(self) -> set[Feature]:
         if not self.feature_model.root:  # void feature model
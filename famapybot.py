@@ -60,7 +60,7 @@ def analyze_model(file_name: str) -> str:
 def get_product_distribution(file_name):
     # Convert the model to BDD
     fm = FeatureIDEParser(file_name).transform() 
-    pysat_model = FmToPysat(fm).transform()
+    pysat_model = FmToPysat(fm, cardinality_threshold=None, tseitin=False).transform()
     cnf_model = PysatToCNF(pysat_model).transform()
     bdd_model = CNFToBDD(cnf_model).transform()
 
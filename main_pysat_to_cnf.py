@@ -28,7 +28,7 @@ def main():
     # Load the feature model from the FeatureIDE format
     fm = FeatureIDEParser(PIZZA_FM).transform() 
 
-    pysat_model = FmToPysat(fm).transform()
+    pysat_model = FmToPysat(fm, cardinality_threshold=None, tseitin=False).transform()
     cnf_model = PysatToCNF(pysat_model).transform()
     bdd_model = CNFToBDD(cnf_model).transform()
 
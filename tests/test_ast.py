@@ -0,0 +1,171 @@
+import unittest
+import itertools
+import os, sys
+import random
+import tempfile
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models.ast import AST, ASTOperation, FALSE, Node, TRUE, hash_cons, make_node
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+FEATURES = ['A', 'B', 'C', 'D']
+BINARY_OPERATIONS = [ASTOperation.AND, ASTOperation.OR, ASTOperation.IMPLIES, ASTOperation.REQUIRES,
+                     ASTOperation.EXCLUDES, ASTOperation.EQUIVALENCE]
+
+FEATUREIDE_MODEL = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<featureModel>
+    <struct>
+        <and abstract="true" mandatory="true" name="A">
+            <feature name="B"/>
+            <feature name="C"/>
+            <feature name="D"/>
+        </and>
+    </struct>
+    <constraints>
+        <rule>
+            <disj><var>B</var><var>C</var><not><var>D</var></not></disj>
+        </rule>
+        <rule>
+            <eq><conj><var>B</var><var>C</var></conj><disj><var>C</var><var>D</var></disj></eq>
+        </rule>
+    </constraints>
+</featureModel>
+"""
+
+
+def random_node(rng: random.Random, depth: int) -> Node:
+    """Random formula built with (not hash-consed) binary nodes."""
+    if depth == 0 or rng.random() < 0.2:
+        return Node(rng.choice(FEATURES))
+    if rng.random() < 0.2:
+        return Node(ASTOperation.NOT, [random_node(rng, depth - 1)])
+    return Node(rng.choice(BINARY_OPERATIONS), [random_node(rng, depth - 1), random_node(rng, depth - 1)])
+
+
+def evaluate(node: Node, values: dict[str, bool]) -> bool:
+    if node.is_feature():
+        return values[node.data]
+    if node.data == ASTOperation.NOT:
+        return not evaluate(node.left, values)
+    if node.data == ASTOperation.AND:
+        return all(evaluate(child, values) for child in node.children)
+    if node.data == ASTOperation.OR:
+        return any(evaluate(child, values) for child in node.children)
+    left, right = evaluate(node.left, values), evaluate(node.right, values)
+    return {ASTOperation.IMPLIES: not left or right,
+            ASTOperation.REQUIRES: not left or right,
+            ASTOperation.EXCLUDES: not (left and right),
+            ASTOperation.EQUIVALENCE: left == right}[node.data]
+
+
+def satisfies(clauses: list[list[str]], values: dict[str, bool]) -> bool:
+    return all(any(not values[literal[1:]] if literal.startswith('-') else values[literal] for literal in clause)
+               for clause in clauses)
+
+
+class TestHashConsing(unittest.TestCase):
+
+    def test_equal_formulas_are_shared(self):
+        first = AST.create_binary_operation(ASTOperation.IMPLIES, Node('A'),
+                                            AST.create_simple_binary_operation(ASTOperation.OR, 'B', 'C').root)
+        builder = Node(ASTOperation.IMPLIES)
+        builder.left = Node('A')
+        builder.right = Node(ASTOperation.OR)
+        builder.right.left = Node('B')
+        builder.right.right = Node('C')
+        second = AST(builder)
+        self.assertIs(first.root, second.root)
+        self.assertIs(first.root.left, make_node('A'))
+        self.assertIsNot(first.root, AST.create_simple_binary_operation(ASTOperation.OR, 'C', 'B').root.left)
+
+    def test_hash_consed_nodes_cannot_be_modified(self):
+        root = AST.create_simple_binary_operation(ASTOperation.REQUIRES, 'A', 'B').root
+        with self.assertRaises(AttributeError):
+            root.left = Node('C')
+
+    def test_simplifications(self):
+        a, b, c = make_node('A'), make_node('B'), make_node('C')
+        not_a = make_node(ASTOperation.NOT, [a])
+        self.assertIs(make_node(ASTOperation.NOT, [not_a]), a)
+        nested = make_node(ASTOperation.OR, [a, make_node(ASTOperation.OR, [b, make_node(ASTOperation.OR, [c, a])])])
+        self.assertEqual(nested.children, (a, b, c))
+        self.assertIs(make_node(ASTOperation.AND, [b, a, not_a]), FALSE)
+        self.assertIs(make_node(ASTOperation.OR, [b, not_a, a]), TRUE)
+        self.assertIs(make_node(ASTOperation.AND, [b, TRUE]), b)
+        self.assertIs(make_node(ASTOperation.OR, [b, TRUE]), TRUE)
+        self.assertIs(make_node(ASTOperation.NOT, [TRUE]), FALSE)
+        self.assertIs(make_node(ASTOperation.IMPLIES, [a, FALSE]), not_a)
+        self.assertIs(make_node(ASTOperation.EXCLUDES, [a, a]), not_a)
+        self.assertIs(make_node(ASTOperation.EQUIVALENCE, [b, b]), TRUE)
+        self.assertEqual(AST(TRUE).get_clauses(), [])
+        self.assertEqual(AST(FALSE).get_clauses(), [[]])
+        self.assertEqual(AST(a).get_clauses(), [['A']])
+
+    def test_clauses_are_computed_once(self):
+        first = AST.create_simple_binary_operation(ASTOperation.EQUIVALENCE, 'A', 'B')
+        second = AST.create_simple_binary_operation(ASTOperation.EQUIVALENCE, 'A', 'B')
+        clauses = first.get_clauses()
+        self.assertEqual(sorted(map(sorted, clauses)), [['-A', 'B'], ['-B', 'A']])
+        self.assertIs(first.get_clauses(), clauses)
+        self.assertIs(second.get_clauses(), clauses)
+
+
+class TestTransformations(unittest.TestCase):
+
+    def test_random_cnf(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            builder = random_node(rng, 5)
+            ast = AST(builder)
+            clauses = ast.get_clauses()
+            with self.subTest(ast=str(ast)):
+                for values in itertools.product([False, True], repeat=len(FEATURES)):
+                    values = dict(zip(FEATURES, values))
+                    self.assertEqual(evaluate(ast.root, values), evaluate(builder, values))
+                    self.assertEqual(satisfies(clauses, values), evaluate(builder, values))
+
+    def test_deep_formula(self):
+        # Deeper than the recursion limit
+        nodes = [Node(name) for name in FEATURES]
+        root = Node(ASTOperation.NOT, [nodes[0]])
+        for i in range(5000):
+            operation = ASTOperation.AND if i % 2 == 0 else ASTOperation.OR
+            root = Node(operation, [nodes[i % len(nodes)], Node(ASTOperation.NOT, [root])])
+        ast = AST(root)
+        self.assertTrue(str(ast).startswith('OR[D][NOT[AND[C]'))
+        self.assertTrue(ast.to_cnf().root.data in (ASTOperation.AND, ASTOperation.OR))
+        self.assertIs(hash_cons(root), ast.root)
+
+
+class TestFeatureIDEConstraints(unittest.TestCase):
+
+    def setUp(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.xml', delete=False) as file:
+            file.write(FEATUREIDE_MODEL)
+        self.path = file.name
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_nary_and_equivalence_rules(self):
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                feature_model = FeatureIDEParser(self.path, streaming=streaming).transform()
+                disjunction, equivalence = (ctc.ast.root for ctc in feature_model.ctcs)
+                self.assertEqual(str(disjunction), 'OR[B][C][NOT[D][]]')
+                self.assertEqual(feature_model.ctcs[0].ast.get_clauses(), [['B', 'C', '-D']])
+                self.assertEqual(equivalence.data, ASTOperation.EQUIVALENCE)
+                # The operands of the equivalence are parsed once and shared with the other constraints
+                self.assertIs(equivalence.left.left, make_node('B'))
+                self.assertIs(equivalence.right.left, disjunction.children[1])
+                clauses = feature_model.ctcs[1].ast.get_clauses()
+                for values in itertools.product([False, True], repeat=3):
+                    values = dict(zip(['B', 'C', 'D'], values))
+                    self.assertEqual(satisfies(clauses, values),
+                                     (values['B'] and values['C']) == (values['C'] or values['D']))
+
+
+if __name__ == '__main__':
+    unittest.main()
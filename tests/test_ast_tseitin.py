@@ -0,0 +1,151 @@
+import unittest
+import itertools
+import os, sys
+import random
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from pysat.formula import IDPool
+from pysat.solvers import Glucose3
+
+from famapy.core.models.ast import AST, ASTOperation, Node
+from famapy.metamodels.fm_metamodel.models.feature_model import Constraint, Feature, FeatureModel, Relation
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.bdd_metamodel.operations import BDDProductsNumber
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.bdd_metamodel.transformations.pysat_to_bdd import PySATToBDD
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products import Glucose3Products
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products_number import Glucose3ProductsNumber
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+FEATURES = ['A', 'B', 'C', 'D']
+BINARY_OPERATIONS = [ASTOperation.AND, ASTOperation.OR, ASTOperation.IMPLIES, ASTOperation.REQUIRES,
+                     ASTOperation.EXCLUDES, ASTOperation.EQUIVALENCE]
+
+
+def random_node(rng: random.Random, depth: int) -> Node:
+    if depth == 0 or rng.random() < 0.2:
+        return Node(rng.choice(FEATURES))
+    if rng.random() < 0.2:
+        return AST.create_unary_operation(ASTOperation.NOT, random_node(rng, depth - 1)).root
+    return AST.create_binary_operation(rng.choice(BINARY_OPERATIONS), random_node(rng, depth - 1),
+                                       random_node(rng, depth - 1)).root
+
+
+def evaluate(node: Node, values: dict[str, bool]) -> bool:
+    if node.is_feature():
+        return values[node.data]
+    if node.data == ASTOperation.NOT:
+        return not evaluate(node.left, values)
+    # AND and OR are n-ary
+    if node.data == ASTOperation.AND:
+        return all(evaluate(child, values) for child in node.children)
+    if node.data == ASTOperation.OR:
+        return any(evaluate(child, values) for child in node.children)
+    left, right = evaluate(node.left, values), evaluate(node.right, values)
+    return {ASTOperation.IMPLIES: not left or right,
+            ASTOperation.REQUIRES: not left or right,
+            ASTOperation.EXCLUDES: not (left and right),
+            ASTOperation.EQUIVALENCE: left == right}[node.data]
+
+
+class TestTseitinClauses(unittest.TestCase):
+    """The Tseitin clauses are satisfiable with the same feature assignments as the constraint."""
+
+    def setUp(self):
+        self.variables = {name: i + 1 for i, name in enumerate(FEATURES)}
+
+    def models(self, clauses: list[list[int]]) -> set[tuple[bool, ...]]:
+        """Satisfying assignments of the clauses projected onto the features."""
+        nof_features = len(FEATURES)
+        models = set()
+        with Glucose3(bootstrap_with=clauses) as solver:
+            for values in itertools.product([False, True], repeat=nof_features):
+                assumptions = [var if value else -var for var, value in zip(range(1, nof_features + 1), values)]
+                if solver.solve(assumptions=assumptions):
+                    models.add(values)
+        return models
+
+    def test_random_constraints(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            ast = AST(random_node(rng, 5))
+            vpool = IDPool(start_from=len(FEATURES) + 1)
+            clauses = ast.get_tseitin_clauses(self.variables, vpool.id)
+            expected = {values for values in itertools.product([False, True], repeat=len(FEATURES))
+                        if evaluate(ast.root, dict(zip(FEATURES, values)))}
+            with self.subTest(ast=str(ast)):
+                self.assertEqual(self.models(clauses), expected)
+
+    def test_clauses_without_auxiliary_variables(self):
+        ast = AST.create_simple_binary_operation(ASTOperation.REQUIRES, 'A', 'B')
+        self.assertEqual(ast.get_tseitin_clauses(self.variables, IDPool(start_from=5).id), [[-1, 2]])
+        ast = AST.create_binary_operation(
+            ASTOperation.OR, AST.create_simple_binary_operation(ASTOperation.OR, 'A', 'B').root,
+            AST.create_simple_unary_operation(ASTOperation.NOT, 'C').root)
+        self.assertEqual(sorted(map(sorted, ast.get_tseitin_clauses(self.variables, IDPool(start_from=5).id))),
+                         [[-3, 1, 2]])
+
+    def test_unknown_feature(self):
+        ast = AST.create_simple_binary_operation(ASTOperation.REQUIRES, 'A', 'Z')
+        with self.assertRaises(KeyError):
+            ast.get_tseitin_clauses(self.variables, IDPool(start_from=5).id)
+
+    def test_deep_constraint(self):
+        # A chain of (x OR (y AND ...)) deeper than the recursion limit
+        depth = 5000
+        node = Node('A')
+        for i in range(depth):
+            inner = AST.create_binary_operation(ASTOperation.AND, Node(FEATURES[i % 2 + 1]), node).root
+            node = AST.create_binary_operation(ASTOperation.OR, Node(FEATURES[3 - i % 2]), inner).root
+        vpool = IDPool(start_from=len(FEATURES) + 1)
+        clauses = AST(node).get_tseitin_clauses(self.variables, vpool.id)
+        self.assertLess(len(clauses), 10 * depth)
+        with Glucose3(bootstrap_with=clauses) as solver:
+            self.assertTrue(solver.solve(assumptions=[1, 2, 3, 4]))
+            self.assertFalse(solver.solve(assumptions=[-1, -2, -3, -4]))
+
+
+class TestTseitinTransformations(unittest.TestCase):
+    """The transformations give the same products with both encodings of the constraints."""
+
+    def test_featureide_models(self):
+        for path in ('input_fms/FeatureIDE_models/jHipster.xml', 'input_fms/FeatureIDE_models/WeaFQAs.xml'):
+            feature_model = FeatureIDEParser(path).transform()
+            with self.subTest(path=path):
+                expected = BDDProductsNumber().execute(FmToBDD(feature_model, tseitin=False).transform()).get_result()
+                self.assertEqual(BDDProductsNumber().execute(FmToBDD(feature_model).transform()).get_result(),
+                                 expected)
+                # WeaFQAs has too many products to enumerate them with the solver
+                pysat_model = FmToPysat(feature_model).transform()
+                self.assertEqual(BDDProductsNumber().execute(PySATToBDD(pysat_model).transform()).get_result(),
+                                 expected)
+        pysat_model = FmToPysat(FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()).transform()
+        self.assertEqual(Glucose3ProductsNumber().execute(pysat_model).get_result(), 26256)
+
+    def test_complex_constraints(self):
+        root = Feature('Root')
+        children = [Feature(name, parent=root) for name in FEATURES]
+        for child in children:
+            root.add_relation(Relation(root, [child], 0, 1))
+        # A -> (B or not (C and D))
+        ast = AST.create_binary_operation(
+            ASTOperation.IMPLIES, Node('A'), AST.create_binary_operation(
+                ASTOperation.OR, Node('B'), AST.create_unary_operation(
+                    ASTOperation.NOT, AST.create_simple_binary_operation(ASTOperation.AND, 'C', 'D').root).root).root)
+        feature_model = FeatureModel(root, [Constraint('ctc', ast)])
+        expected = sorted(sorted(['Root'] + [name for name, value in zip(FEATURES, values) if value])
+                          for values in itertools.product([False, True], repeat=len(FEATURES))
+                          if evaluate(ast.root, dict(zip(FEATURES, values))))
+        for tseitin in (True, False):
+            with self.subTest(tseitin=tseitin):
+                pysat_model = FmToPysat(feature_model, tseitin=tseitin).transform()
+                products = Glucose3Products().execute(pysat_model).get_result()
+                self.assertEqual(sorted(sorted(product) for product in products), expected)
+                bdd_model = FmToBDD(feature_model, tseitin=tseitin).transform()
+                self.assertEqual(BDDProductsNumber().execute(bdd_model).get_result(), len(expected))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import os, sys
+import tempfile
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models import Configuration
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations import (
+    BDDFeatureInclusionProbability,
+    BDDProductDistribution,
+    BDDProducts,
+    BDDProductsNumber,
+    BDDSampling
+)
+from famapy.metamodels.bdd_metamodel.transformations.bdd_reader import BDDReader
+from famapy.metamodels.bdd_metamodel.transformations.bdd_writer import BDDWriter
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+
+class TestBDDBackends(unittest.TestCase):
+    """The operations give the same results with all the available BDD managers."""
+
+    def setUp(self):
+        self.feature_model = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        self.bdd_models = {backend: FmToBDD(self.feature_model, backend=backend).transform()
+                           for backend in BDDModel.available_backends()}
+        self.configuration = Configuration({'Gradle': True, 'MySQL': False})
+
+    def assert_same_results(self, operation):
+        results = {backend: operation(bdd_model) for backend, bdd_model in self.bdd_models.items()}
+        expected = results['autoref']
+        for backend, result in results.items():
+            with self.subTest(backend=backend):
+                self.assertEqual(result, expected)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            BDDModel('sylvan')
+
+    def test_nodes(self):
+        self.assert_same_results(lambda bdd_model: (bdd_model.variables, len(bdd_model.root),
+                                                    len(bdd_model.reachable_references(bdd_model.root))))
+
+    def test_traversed_functions_are_released(self):
+        def nof_live_nodes(bdd_model):
+            if bdd_model.backend == 'autoref':  # CUDD does not count the dead nodes
+                bdd_model.bdd.collect_garbage()
+            return len(bdd_model.bdd)
+
+        for backend in BDDModel.available_backends():
+            with self.subTest(backend=backend):
+                bdd_model = BDDModel(backend)
+                bdd_model.from_textual_cnf('(a | b) & (~c | d)', ['a', 'b', 'c', 'd'])
+                nof_nodes = nof_live_nodes(bdd_model)
+                u = bdd_model.bdd.add_expr('(a & c) | (b & ~d)')
+                bdd_model.to_arrays(u)
+                bdd_model.count(u)
+                del u
+                bdd_model.to_arrays()
+                self.assertEqual(nof_live_nodes(bdd_model), nof_nodes)
+
+    def test_products(self):
+        self.assert_same_results(lambda bdd_model: BDDProductsNumber().execute(bdd_model).get_result())
+        self.assert_same_results(lambda bdd_model: BDDProductsNumber(self.configuration).execute(bdd_model).get_result())
+        self.assert_same_results(lambda bdd_model: {frozenset(p.elements.items())
+                                                    for p in BDDProducts(self.configuration).execute(bdd_model).get_result()})
+
+    def test_feature_inclusion_probability_and_product_distribution(self):
+        self.assert_same_results(lambda bdd_model: BDDFeatureInclusionProbability().execute(bdd_model).get_counts())
+        self.assert_same_results(lambda bdd_model: BDDProductDistribution(self.configuration).execute(bdd_model).get_result())
+
+    def test_sampling(self):
+        def sample(bdd_model, with_replacement):
+            sampling = BDDSampling(20, with_replacement, self.configuration)
+            sampling.set_seed(5)
+            return sampling.execute(bdd_model).get_result()
+        self.assert_same_results(lambda bdd_model: sample(bdd_model, True))
+        self.assert_same_results(lambda bdd_model: sample(bdd_model, False))
+
+    def test_dump_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'model.dddmp')
+            for backend, bdd_model in self.bdd_models.items():
+                BDDWriter(path, bdd_model).transform()
+                for other in BDDModel.available_backends():
+                    with self.subTest(backend=backend, other=other):
+                        loaded = BDDReader(path, other).transform()
+                        self.assertEqual(BDDFeatureInclusionProbability().execute(loaded).get_counts(),
+                                         BDDFeatureInclusionProbability().execute(bdd_model).get_counts())
+
+
+if __name__ == '__main__':
+    unittest.main()
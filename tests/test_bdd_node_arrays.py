@@ -0,0 +1,106 @@
+import unittest
+import os, sys
+import numpy as np
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models import Configuration
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations import (
+    BDDProductDistribution,
+    BDDProducts
+)
+from famapy.metamodels.bdd_metamodel.operations.bdd_feature_inclusion_probability import feature_inclusion_counts
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+
+class TestBDDNodeArrays(unittest.TestCase):
+    """The array passes give the same results as the traversals of the operations."""
+
+    def setUp(self):
+        self.feature_model = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        self.bdd_models = [FmToBDD(self.feature_model, backend=backend).transform()
+                           for backend in BDDModel.available_backends()]
+        self.configuration = Configuration({'Gradle': True, 'MySQL': False})
+
+    def test_export(self):
+        for bdd_model in self.bdd_models:
+            with self.subTest(backend=bdd_model.backend):
+                arrays = bdd_model.to_arrays()
+                nodes = {abs(ref) for ref in bdd_model.reachable_references(bdd_model.root)}
+                self.assertEqual(len(arrays), len(nodes))
+                self.assertTrue(np.all(np.diff(arrays.level) >= 0))
+                internal = arrays.level < arrays.nof_levels
+                self.assertTrue(np.all(arrays.level[arrays.low[internal]] > arrays.level[internal]))
+                self.assertTrue(np.all(arrays.level[arrays.high[internal]] > arrays.level[internal]))
+
+    def test_count_and_feature_inclusion_counts(self):
+        for bdd_model in self.bdd_models:
+            for u in (bdd_model.root, ~bdd_model.root, bdd_model.let({'Gradle': True}, bdd_model.root)):
+                with self.subTest(backend=bdd_model.backend, u=u):
+                    arrays = bdd_model.to_arrays(u)
+                    self.assertEqual(arrays.count(), bdd_model.count(u))
+                    self.assertEqual(arrays.feature_inclusion_counts(), feature_inclusion_counts(bdd_model, u))
+
+    def test_product_distribution(self):
+        for bdd_model in self.bdd_models:
+            with self.subTest(backend=bdd_model.backend):
+                self.assertEqual(bdd_model.to_arrays().product_distribution(),
+                                 BDDProductDistribution().execute(bdd_model).get_result())
+                values = self.configuration.elements
+                arrays = bdd_model.to_arrays(bdd_model.let(values, bdd_model.root))
+                dist = arrays.product_distribution({bdd_model.bdd.level_of_var(f) for f in values})
+                # Shifted by the selected features of the configuration
+                expected = BDDProductDistribution(self.configuration).execute(bdd_model).get_result()
+                self.assertEqual(expected[1:1 + len(dist)], dist)
+
+    def test_random_walks(self):
+        bdd_model = self.bdd_models[0]
+        u = bdd_model.let(self.configuration.elements, bdd_model.root)
+        arrays = bdd_model.to_arrays(u)
+        walks = arrays.random_walks(20000, np.random.default_rng(7))
+        products = {frozenset(f for f, selected in product.elements.items() if selected)
+                    for product in BDDProducts(self.configuration).execute(bdd_model).get_result()}
+        for values in walks[:200]:
+            config = dict(zip(arrays.level_vars, values.tolist()))
+            config.update(self.configuration.elements)
+            self.assertIn(frozenset(f for f, selected in config.items() if selected), products)
+        # Uniform: the features are selected as often as in the products
+        total, selected = arrays.feature_inclusion_counts()
+        frequencies = walks.mean(axis=0)
+        for level, count in enumerate(selected):
+            if arrays.level_vars[level] not in self.configuration.elements:
+                self.assertAlmostEqual(frequencies[level], count / total, delta=0.02)
+
+    def test_random_walks_without_solutions(self):
+        for bdd_model in self.bdd_models:
+            with self.subTest(backend=bdd_model.backend):
+                arrays = bdd_model.to_arrays(bdd_model.bdd.false)
+                self.assertEqual(arrays.count(), 0)
+                with self.assertRaises(ValueError):
+                    arrays.random_walks(10, np.random.default_rng(7))
+
+    def test_deep_bdd(self):
+        # Parity of 3000 variables, built bottom-up: no recursion is needed to analyse it
+        nof_vars = 3000
+        bdd_model = BDDModel('autoref')
+        for i in range(nof_vars):
+            bdd_model.bdd.declare(f'x{i}')
+        bdd_model.variables = [f'x{i}' for i in range(nof_vars)]
+        even, odd = bdd_model.bdd.true, bdd_model.bdd.false
+        for level in reversed(range(nof_vars)):
+            even, odd = (bdd_model.find_or_add(level, even, odd),
+                         bdd_model.find_or_add(level, odd, even))
+        bdd_model.root = odd
+        arrays = bdd_model.to_arrays()
+        self.assertEqual(arrays.count(), 2 ** (nof_vars - 1))
+        total, selected = arrays.feature_inclusion_counts()
+        self.assertEqual(selected, [2 ** (nof_vars - 2)] * nof_vars)
+        walks = arrays.random_walks(100, np.random.default_rng(1))
+        self.assertTrue(np.all(walks.sum(axis=1) % 2 == 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models import Configuration
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.bdd_metamodel.operations import (
+    BDDFeatureInclusionProbability,
+    BDDFeatureInclusionProbabilityBF,
+    BDDProductDistribution,
+    BDDProductDistributionBF,
+    BDDParallelSampling,
+    BDDProducts,
+    BDDSampling
+)
+from famapy.metamodels.bdd_metamodel.operations.bdd_sampling import node_counts, unrank
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+
+class TestBDDFeatureInclusionProbability(unittest.TestCase):
+
+    def setUp(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        self.bdd_model = FmToBDD(fm).transform()
+
+    def test_same_as_brute_force(self):
+        fip = BDDFeatureInclusionProbability().execute(self.bdd_model).get_result()
+        fip_bf = BDDFeatureInclusionProbabilityBF().execute(self.bdd_model).get_result()
+        self.assertEqual(fip.keys(), fip_bf.keys())
+        for feature, probability in fip.items():
+            self.assertAlmostEqual(probability, fip_bf[feature])
+
+    def test_exact_counts(self):
+        operation = BDDFeatureInclusionProbability().execute(self.bdd_model)
+        products = BDDProducts().execute(self.bdd_model).get_result()
+        self.assertEqual(operation.get_products_number(), len(products))
+        for feature, count in operation.get_counts().items():
+            self.assertEqual(count, sum(1 for p in products if p.elements.get(feature)))
+
+    def test_partial_configuration(self):
+        selected, deselected = self.bdd_model.variables[5], self.bdd_model.variables[9]
+        configuration = Configuration({selected: True, deselected: False})
+        fip = BDDFeatureInclusionProbability(configuration).execute(self.bdd_model).get_result()
+        products = BDDProducts(configuration).execute(self.bdd_model).get_result()
+        self.assertEqual(fip[selected], 1.0)
+        self.assertEqual(fip[deselected], 0.0)
+        for feature, probability in fip.items():
+            expected = sum(1 for p in products if p.elements.get(feature)) / len(products)
+            self.assertAlmostEqual(probability, expected)
+
+
+class TestBDDProductDistribution(unittest.TestCase):
+
+    def setUp(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        self.bdd_model = FmToBDD(fm).transform()
+
+    def test_same_as_brute_force(self):
+        self.assertEqual(BDDProductDistribution().execute(self.bdd_model).get_result(),
+                         BDDProductDistributionBF().execute(self.bdd_model).get_result())
+
+    def test_partial_configuration(self):
+        selected, deselected = self.bdd_model.variables[5], self.bdd_model.variables[9]
+        configuration = Configuration({selected: True, deselected: False})
+        dist = BDDProductDistribution(configuration).execute(self.bdd_model).get_result()
+        products = BDDProducts(configuration).execute(self.bdd_model).get_result()
+        expected = [0] * (len(self.bdd_model.variables) + 1)
+        for product in products:
+            expected[sum(1 for value in product.elements.values() if value)] += 1
+        self.assertEqual(dist, expected)
+
+    def test_consistent_with_feature_inclusion_probability(self):
+        dist = BDDProductDistribution().execute(self.bdd_model).get_result()
+        fip = BDDFeatureInclusionProbability().execute(self.bdd_model)
+        self.assertEqual(sum(dist), fip.get_products_number())
+        self.assertEqual(sum(k * n for k, n in enumerate(dist)), sum(fip.get_counts().values()))
+
+
+class TestBDDSampling(unittest.TestCase):
+
+    def setUp(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        self.bdd_model = FmToBDD(fm).transform()
+
+    @staticmethod
+    def selected(configuration):
+        return frozenset(f for f, selected in configuration.elements.items() if selected)
+
+    def test_samples_are_valid_and_uniform(self):
+        products = {self.selected(p) for p in BDDProducts().execute(self.bdd_model).get_result()}
+        sampling = BDDSampling(len(products) * 200, with_replacement=True)
+        sampling.set_seed(0)
+        sample = [self.selected(c) for c in sampling.execute(self.bdd_model).get_result()]
+        self.assertTrue(all(configuration in products for configuration in sample))
+        frequencies = {configuration: sample.count(configuration) for configuration in products}
+        self.assertTrue(all(100 < frequency < 300 for frequency in frequencies.values()))
+
+    def test_reproducible(self):
+        samples = []
+        for _ in range(2):
+            sampling = BDDSampling(10, with_replacement=True)
+            sampling.set_seed(42)
+            samples.append(sampling.execute(self.bdd_model).get_result())
+        self.assertEqual(samples[0], samples[1])
+
+    def test_without_replacement_and_partial_configuration(self):
+        configuration = Configuration({'Salami': True, 'Big': False})
+        products = BDDProducts(configuration).execute(self.bdd_model).get_result()
+        sample = BDDSampling(len(products), False, configuration).execute(self.bdd_model).get_result()
+        self.assertEqual(len(set(sample)), len(products))
+        self.assertTrue(all(c.elements['Salami'] and not c.elements['Big'] for c in sample))
+        with self.assertRaises(ValueError):
+            BDDSampling(len(products) + 1, False, configuration).execute(self.bdd_model)
+
+    def test_unrank_all_solutions_in_order(self):
+        table = node_counts(self.bdd_model, self.bdd_model.root)
+        free_levels = list(range(self.bdd_model.nof_levels()))
+        nof_products = len(BDDProducts().execute(self.bdd_model).get_result())
+        solutions = [tuple(unrank(table, self.bdd_model.reference(self.bdd_model.root), rank, free_levels))
+                     for rank in range(nof_products)]
+        self.assertEqual(solutions, sorted(set(solutions)))
+        with self.assertRaises(ValueError):
+            unrank(table, self.bdd_model.reference(self.bdd_model.root), nof_products, free_levels)
+
+    def test_without_replacement_whole_population(self):
+        products = {self.selected(p) for p in BDDProducts().execute(self.bdd_model).get_result()}
+        sampling = BDDSampling(len(products), with_replacement=False)
+        sampling.set_seed(1)
+        sample = [self.selected(c) for c in sampling.execute(self.bdd_model).get_result()]
+        self.assertEqual(len(sample), len(products))
+        self.assertEqual(set(sample), products)
+
+
+class TestBDDParallelSampling(unittest.TestCase):
+
+    def setUp(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        self.bdd_model = FmToBDD(fm).transform()
+
+    def sample(self, size, with_replacement, processes, configuration=None):
+        sampling = BDDParallelSampling(size, with_replacement, configuration, processes=processes, chunk_size=7)
+        sampling.set_seed(3)
+        return sampling.execute(self.bdd_model).get_result()
+
+    def test_reproducible_regardless_of_processes(self):
+        self.assertEqual(self.sample(50, True, 1), self.sample(50, True, 2))
+        self.assertEqual(self.sample(30, False, 1), self.sample(30, False, 2))
+
+    def test_valid_configurations(self):
+        products = BDDProducts().execute(self.bdd_model).get_result()
+        selected = lambda c: frozenset(f for f, s in c.elements.items() if s)
+        products = {selected(p) for p in products}
+        self.assertTrue(all(selected(c) in products for c in self.sample(50, True, 2)))
+        sample = self.sample(len(products), False, 2)
+        self.assertEqual({selected(c) for c in sample}, products)
+
+    def test_partial_configuration(self):
+        configuration = Configuration({'Salami': True, 'Big': False})
+        sample = self.sample(20, True, 2, configuration)
+        self.assertTrue(all(c.elements['Salami'] and not c.elements['Big'] for c in sample))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import os, sys
+import tempfile
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.fm_metamodel.models import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.bdd_metamodel.models import BDDModel
+from famapy.metamodels.bdd_metamodel.operations import BDDFeatureInclusionProbability, BDDProductsNumber
+from famapy.metamodels.bdd_metamodel.transformations.bdd_reader import BDDReader
+from famapy.metamodels.bdd_metamodel.transformations.bdd_writer import BDDDumpFormat, BDDWriter
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.bdd_metamodel.transformations.pysat_to_bdd import PySATToBDD
+from famapy.metamodels.bdd_metamodel.transformations.variable_ordering import (
+    VariableOrdering,
+    dfs_order,
+    force_order,
+    total_span
+)
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+
+class TestBDDFromClauses(unittest.TestCase):
+
+    def setUp(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        self.pysat_model = FmToPysat(FeatureModel(fm.root, [])).transform()
+
+    def test_same_bdd_as_textual_formula(self):
+        features = self.pysat_model.features
+        clauses = self.pysat_model.get_all_clauses().clauses
+        formula = ' & '.join('(' + ' | '.join(('!' + features[-l]) if l < 0 else features[l] for l in c) + ')'
+                             for c in clauses)
+        textual = BDDModel()
+        textual.from_textual_cnf(formula, [features[i] for i in sorted(features)])
+
+        transformation = PySATToBDD(self.pysat_model)
+        bdd_model = transformation.transform()
+        self.assertEqual(bdd_model.variables, textual.variables)
+        self.assertEqual(bdd_model.bdd.to_expr(bdd_model.root), textual.bdd.to_expr(textual.root))
+        self.assertEqual(transformation.stats['clauses'], len(clauses))
+        self.assertEqual(transformation.stats['nodes'], len(textual.root))
+        self.assertGreaterEqual(transformation.stats['peak_nodes'], transformation.stats['nodes'])
+
+    def test_trivial_formulas(self):
+        bdd_model = BDDModel()
+        bdd_model.from_clauses([], ['A', 'B'])
+        self.assertEqual(bdd_model.root, bdd_model.bdd.true)
+        bdd_model = BDDModel()
+        bdd_model.from_clauses([[1], [-1, 2], [-2]], ['A', 'B'])
+        self.assertEqual(bdd_model.root, bdd_model.bdd.false)
+
+
+class TestVariableOrdering(unittest.TestCase):
+
+    def setUp(self):
+        self.feature_model = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+
+    def test_same_function_with_any_ordering(self):
+        expected = BDDProductsNumber().execute(FmToBDD(self.feature_model).transform()).get_result()
+        for ordering in VariableOrdering:
+            for reorder in (False, True):
+                with self.subTest(ordering=ordering, reorder=reorder):
+                    transformation = FmToBDD(self.feature_model, ordering, reorder)
+                    bdd_model = transformation.transform()
+                    self.assertEqual(BDDProductsNumber().execute(bdd_model).get_result(), expected)
+                    self.assertEqual(sorted(bdd_model.bdd.vars), sorted(bdd_model.variables))
+
+    def test_dfs_order_keeps_subtrees_together(self):
+        order = dfs_order(self.feature_model.root)
+        self.assertEqual(len(order), len(self.feature_model.get_features()))
+        position = {name: i for i, name in enumerate(order)}
+        for feature in self.feature_model.get_features():
+            if feature.get_parent() is not None:
+                self.assertLess(position[feature.get_parent().name], position[feature.name])
+
+    def test_force_does_not_increase_span(self):
+        transformation = FmToBDD(self.feature_model)
+        transformation.transform()
+        order = list(range(1, len(transformation.variables) + 1))
+        self.assertLessEqual(total_span(force_order(order, transformation.clauses), transformation.clauses),
+                             total_span(order, transformation.clauses))
+        self.assertEqual(sorted(force_order(order, transformation.clauses)), order)
+
+
+class TestBDDReader(unittest.TestCase):
+
+    def setUp(self):
+        self.feature_model = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        self.bdd_model = FmToBDD(self.feature_model, VariableOrdering.SPAN).transform()
+
+    def test_write_and_read(self):
+        expected = BDDFeatureInclusionProbability().execute(self.bdd_model).get_counts()
+        order = [self.bdd_model.bdd.var_at_level(i) for i in range(self.bdd_model.nof_levels())]
+        with tempfile.TemporaryDirectory() as directory:
+            for output_format in (BDDDumpFormat.DDDMPv2, BDDDumpFormat.DDDMPv3):
+                with self.subTest(output_format=output_format):
+                    path = os.path.join(directory, 'model.dddmp')
+                    BDDWriter(path, self.bdd_model, output_format=output_format).transform()
+                    bdd_model = BDDReader(path).transform()
+                    self.assertEqual(sorted(bdd_model.variables), sorted(self.bdd_model.variables))
+                    self.assertEqual([bdd_model.bdd.var_at_level(i) for i in range(bdd_model.nof_levels())], order)
+                    self.assertEqual(len(bdd_model.root), len(self.bdd_model.root))
+                    self.assertEqual(BDDFeatureInclusionProbability().execute(bdd_model).get_counts(), expected)
+                    if output_format == BDDDumpFormat.DDDMPv3:
+                        self.assertEqual(bdd_model.variables, self.bdd_model.variables)
+
+    def test_cache(self):
+        expected = BDDProductsNumber().execute(self.bdd_model).get_result()
+        with tempfile.TemporaryDirectory() as directory:
+            results = []
+            for _ in range(2):
+                transformation = FmToBDD(self.feature_model, VariableOrdering.SPAN, cache_dir=directory)
+                bdd_model = transformation.transform()
+                results.append(transformation.stats['cached'])
+                self.assertEqual(BDDProductsNumber().execute(bdd_model).get_result(), expected)
+            self.assertEqual(results, [False, True])
+            self.assertEqual(len(os.listdir(directory)), 1)
+            FmToBDD(self.feature_model, VariableOrdering.DFS, cache_dir=directory).transform()
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
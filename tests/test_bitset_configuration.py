@@ -0,0 +1,87 @@
+import unittest
+import os, sys
+import pickle
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models import BitsetConfiguration, Configuration, ElementIndex
+from famapy.metamodels.fm_metamodel.models import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+from famapy.metamodels.pysat_metamodel.utils.aafms_helper import AAFMsHelper
+
+
+class TestBitsetConfiguration(unittest.TestCase):
+
+    def setUp(self):
+        self.index = ElementIndex(['F1', 'F2', 'F3', 'F4'])
+        self.config1 = BitsetConfiguration.from_elements(self.index, {'F1': True, 'F2': False})
+        self.config2 = BitsetConfiguration.from_elements(self.index, {'F2': False, 'F1': True})
+        self.config3 = BitsetConfiguration.from_elements(self.index, {'F1': False, 'F2': True})
+        self.config4 = BitsetConfiguration.from_elements(self.index, {'F1': True, 'F2': False, 'F3': True})
+        self.config5 = BitsetConfiguration.from_elements(self.index, {'F1': True, 'F2': False, 'F3': False})
+
+    def test_equals_and_hash(self):
+        self.assertEqual(self.config1, self.config2)
+        self.assertEqual(hash(self.config1), hash(self.config2))
+        for other in (self.config3, self.config4, self.config5):
+            self.assertNotEqual(self.config1, other)
+            self.assertNotEqual(hash(self.config1), hash(other))
+        self.assertEqual(len({self.config1, self.config2, self.config3}), 2)
+        other_index = BitsetConfiguration.from_elements(ElementIndex(self.index.elements), {'F1': True, 'F2': False})
+        self.assertNotEqual(self.config1, other_index)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.config1.selected = 0
+        with self.assertRaises(ValueError):
+            BitsetConfiguration(self.index, 0b1, 0b1)
+
+    def test_adapters(self):
+        configuration = Configuration({'F1': True, 'F2': False, 'F4': True})
+        bitset = BitsetConfiguration.from_configuration(self.index, configuration)
+        self.assertEqual(bitset.elements, configuration.elements)
+        self.assertEqual(bitset.to_configuration(), configuration)
+        self.assertEqual(bitset.get_selected_features(), {'F1', 'F4'})
+        self.assertTrue(bitset.is_selected('F4'))
+        self.assertFalse(bitset.is_selected('F2'))
+        self.assertFalse(bitset.is_selected('F5'))
+        self.assertEqual(len(bitset), 2)
+        self.assertFalse(bitset.is_complete())
+        complete = BitsetConfiguration.from_selected(self.index, ['F1', 'F4'], complete=True)
+        self.assertTrue(complete.is_complete())
+        self.assertEqual(complete.elements, {'F1': True, 'F2': False, 'F3': False, 'F4': True})
+        self.assertEqual(pickle.loads(pickle.dumps(bitset)).elements, bitset.elements)
+
+    def test_set_algebra(self):
+        config = BitsetConfiguration.from_selected(self.index, ['F1', 'F3'], complete=True)
+        other = BitsetConfiguration.from_selected(self.index, ['F3', 'F4'], complete=True)
+        self.assertEqual((config | other).get_selected_features(), {'F1', 'F3', 'F4'})
+        self.assertEqual((config & other).get_selected_features(), {'F3'})
+        self.assertEqual((config - other).get_selected_features(), {'F1'})
+        self.assertTrue((config | other).is_complete())
+        self.assertEqual(config.hamming_distance(other), 2)
+        self.assertEqual(config.hamming_distance(config), 0)
+        with self.assertRaises(ValueError):
+            config.union(BitsetConfiguration(ElementIndex(self.index.elements), 0))
+
+
+class TestProductsDeduplication(unittest.TestCase):
+
+    def test_aafms_helper_products(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        fm = FeatureModel(fm.root, [])
+        helper = AAFMsHelper(fm, FmToPysat(fm).transform())
+        products = helper.get_products()
+        self.assertEqual(len(products), len(set(products)))
+        expected = {frozenset(feature.name for feature in configuration.get_selected_features()
+                              if not feature.is_abstract)
+                    for configuration in helper.get_configurations()}
+        self.assertEqual({frozenset(feature.name for feature in product.get_selected_features())
+                          for product in products}, expected)
+        helper.cnf_model.delete_solvers()
+
+
+if __name__ == '__main__':
+    unittest.main()
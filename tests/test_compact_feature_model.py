@@ -0,0 +1,56 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.fm_metamodel.models import CompactFeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.fm_metamodel.operations import metrics, count_configurations
+from famapy.metamodels.fm_metamodel.utils import fm_utils
+
+
+class TestCompactFeatureModel(unittest.TestCase):
+
+    def setUp(self):
+        self.input_folder = 'input_fms/FeatureIDE_models/'
+        self.models = ['pizzas', 'jHipster', 'WeaFQAs']
+
+    def test_structure(self):
+        fm = FeatureIDEParser(self.input_folder + 'pizzas.xml').transform()
+        compact = CompactFeatureModel.from_feature_model(fm)
+        self.assertEqual(compact.root.name, 'Pizza')
+        self.assertEqual(compact.nof_features(), len(fm.get_features()))
+        for feature in compact.get_features():
+            original = fm.get_feature_by_name(feature.name)
+            self.assertEqual(feature.is_abstract, original.is_abstract)
+            self.assertEqual(feature.is_leaf(), original.is_leaf())
+            self.assertEqual(feature.is_group(), original.is_group())
+            self.assertEqual(sorted(c.name for r in feature.get_relations() for c in r.children),
+                             sorted(c.name for r in original.get_relations() for c in r.children))
+            parent = feature.get_parent()
+            self.assertEqual(None if parent is None else parent.name,
+                             None if original.get_parent() is None else original.get_parent().name)
+            for child in compact.children_ids(feature.id):
+                self.assertGreater(child, feature.id)
+
+    def test_operations(self):
+        for fm_input in self.models:
+            fm = FeatureIDEParser(self.input_folder + fm_input + '.xml').transform()
+            compact = CompactFeatureModel.from_feature_model(fm)
+            with self.subTest(fm=fm_input):
+                self.assertEqual(count_configurations(compact), count_configurations(fm))
+                self.assertEqual(metrics.Metrics(compact).nof_group_features(),
+                                 metrics.Metrics(fm).nof_group_features())
+                self.assertEqual(metrics.nof_leaf_features(compact), metrics.nof_leaf_features(fm))
+                self.assertEqual(metrics.nof_abstract_features(compact),
+                                 metrics.nof_abstract_features(fm))
+                self.assertEqual(fm_utils.max_depth_tree(compact), fm_utils.max_depth_tree(fm))
+                self.assertEqual(fm_utils.average_branching_factor(compact),
+                                 fm_utils.average_branching_factor(fm))
+                self.assertEqual({f.name for f in fm_utils.core_features(compact)},
+                                 {f.name for f in fm_utils.core_features(fm)})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=3)
@@ -0,0 +1,105 @@
+import unittest
+import os, sys
+import tempfile
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models.ast import AST, ASTOperation
+from famapy.metamodels.bdd_metamodel.operations import BDDProductsNumber
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.fm_metamodel.models import Constraint, Feature, FeatureModel, Relation
+from famapy.metamodels.fm_metamodel.transformations.xml_transformation import XMLTransformation
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products_number import Glucose3ProductsNumber
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+XML_MODEL = """<feature name="R">
+    <binaryRelation name="R-A"><cardinality min="0" max="1"/><solitaryFeature name="A"/></binaryRelation>
+    <binaryRelation name="R-B"><cardinality min="0" max="1"/><solitaryFeature name="B"/></binaryRelation>
+    <binaryRelation name="R-C"><cardinality min="0" max="1"/><solitaryFeature name="C"/></binaryRelation>
+</feature>"""
+
+UVL_MODEL = """features
+    R
+        optional
+            A
+            B
+            C
+constraints
+    A => B
+    B <=> C
+"""
+
+
+def optional_features_model(ctcs: list[Constraint]) -> FeatureModel:
+    """Model R with the optional features A and B."""
+    root = Feature('R')
+    for name in ('A', 'B'):
+        root.add_relation(Relation(root, [Feature(name, parent=root)], 0, 1))
+    return FeatureModel(root, ctcs)
+
+
+class TestConstraintOperators(unittest.TestCase):
+    """The constraints whose operation is given by its name, as built by the XML and UVL parsers,
+    are transformed as the constraints with an ASTOperation."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_nof_products(self, feature_model: FeatureModel, expected: int):
+        for tseitin in (True, False):
+            with self.subTest(transformation='FmToPysat', tseitin=tseitin):
+                sat_model = FmToPysat(feature_model, tseitin=tseitin).transform()
+                self.assertEqual(Glucose3ProductsNumber().execute(sat_model).get_result(), expected)
+                sat_model.delete_solvers()
+            with self.subTest(transformation='FmToBDD', tseitin=tseitin):
+                bdd_model = FmToBDD(feature_model, tseitin=tseitin).transform()
+                self.assertEqual(BDDProductsNumber().execute(bdd_model).get_result(), expected)
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def test_operation_names(self):
+        for operation in ('requires', 'Requires', ASTOperation.REQUIRES):
+            self.assertIs(AST.create_simple_binary_operation(operation, 'A', 'B').root.data, ASTOperation.REQUIRES)
+        self.assertIs(AST.create_simple_unary_operation('not', 'A').root.data, ASTOperation.NOT)
+        with self.assertRaises(ValueError):
+            AST.create_simple_binary_operation('nand', 'A', 'B')
+
+    def test_simple_binary_operations(self):
+        for operation, expected in (('requires', 3), ('implies', 3), ('excludes', 3), ('equivalence', 2)):
+            with self.subTest(operation=operation):
+                ctc = Constraint('ctc', AST.create_simple_binary_operation(operation, 'A', 'B'))
+                self.assert_nof_products(optional_features_model([ctc]), expected)
+
+    def test_xml_model(self):
+        path = self.write('model.xml', f"""<?xml version="1.0" encoding="UTF-8"?>
+<feature-model>
+    {XML_MODEL}
+    <requires name="ctc-1" feature="A" requires="B"/>
+    <excludes name="ctc-2" feature="B" excludes="C"/>
+</feature-model>""")
+        feature_model = XMLTransformation(path).transform()
+        self.assertEqual(len(feature_model.get_constraints()), 2)
+        # {R}, {R, B}, {R, C}, {R, A, B}
+        self.assert_nof_products(feature_model, 4)
+
+    def test_uvl_model(self):
+        try:
+            from famapy.metamodels.fm_metamodel.transformations.uvl_transformation import UVLTransformation
+        except ImportError:
+            self.skipTest('The UVL parser requires antlr4 and antlr_denter.')
+        feature_model = UVLTransformation(self.write('model.uvl', UVL_MODEL)).transform()
+        self.assertEqual(len(feature_model.get_constraints()), 2)
+        # {R}, {R, B, C}, {R, A, B, C}
+        self.assert_nof_products(feature_model, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import gzip
+import os, sys
+import tempfile
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.cnf_metamodel.transformations.pysat_to_cnf import PysatToCNF
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products_number import Glucose3ProductsNumber
+from famapy.metamodels.pysat_metamodel.transformations.cnf_to_pysat import CNFReader
+from famapy.metamodels.pysat_metamodel.transformations.dimacs_reader import DimacsReader
+from famapy.metamodels.pysat_metamodel.transformations.dimacs_writer import DimacsWriter
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+
+class TestDimacs(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def assertSameModel(self, model, expected):
+        self.assertEqual(model.variables, expected.variables)
+        self.assertEqual(model.features, expected.features)
+        self.assertEqual(model.auxiliary_variables, expected.auxiliary_variables)
+        self.assertEqual(model.get_all_clauses().clauses, expected.get_all_clauses().clauses)
+
+    def test_write_and_read(self):
+        model = CNFReader('input_fms/cnf_models/pizza_cnf_short.txt').transform()
+        for name in ('pizza.dimacs', 'pizza.dimacs.gz'):
+            with self.subTest(name=name):
+                DimacsWriter(self.path(name), model).transform()
+                # Small chunks, so the lines and the clauses are split between chunks
+                for chunk_size in (3, 64, 1 << 20):
+                    read_model = DimacsReader(self.path(name), chunk_size=chunk_size).transform()
+                    self.assertSameModel(read_model, model)
+                    self.assertEqual(Glucose3ProductsNumber().execute(read_model).get_result(), 42)
+        with gzip.open(self.path('pizza.dimacs.gz'), 'rt') as file:
+            self.assertTrue(file.readline().startswith('c 1 '))
+
+    def test_auxiliary_variables(self):
+        feature_model = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        model = FmToPysat(feature_model, cardinality_threshold=0).transform()
+        self.assertTrue(model.auxiliary_variables)
+        DimacsWriter(self.path('jHipster.dimacs'), model).transform()
+        read_model = DimacsReader(self.path('jHipster.dimacs')).transform()
+        self.assertSameModel(read_model, model)
+        self.assertEqual(Glucose3ProductsNumber().execute(read_model).get_result(), 26256)
+        # The unnamed variables are auxiliary, so the model has no CNFModel
+        with self.assertRaises(ValueError):
+            PysatToCNF(read_model).transform()
+
+    def test_read_formats(self):
+        text = ('c A formula from another tool\n'
+                'p cnf 4 3\n'
+                '1 -2\n'
+                '  0 2 3\n'
+                'c comment between the clauses\n'
+                '-4 0\n'
+                '3 4\n'
+                '%\n'
+                '0\n')
+        with open(self.path('formula.cnf'), 'w', encoding='utf-8') as file:
+            file.write(text)
+        for chunk_size in (1, 5, 1 << 20):
+            reader = DimacsReader(self.path('formula.cnf'), chunk_size=chunk_size)
+            model = reader.transform()
+            self.assertEqual((reader.nof_variables, reader.nof_clauses), (4, 3))
+            # Without names, the variables are named by their ids
+            self.assertEqual(model.variables, {'1': 1, '2': 2, '3': 3, '4': 4})
+            self.assertEqual(model.auxiliary_variables, set())
+            self.assertEqual(model.ctc_cnf.clauses, [[1, -2], [2, 3, -4], [3, 4]])
+            self.assertEqual(model.ctc_cnf.nv, 4)
+        # Without names, there are no auxiliary variables
+        self.assertEqual(sorted(PysatToCNF(model).transform().get_variables()), ['1', '2', '3', '4'])
+
+    def test_invalid_problem_line(self):
+        with open(self.path('formula.cnf'), 'w', encoding='utf-8') as file:
+            file.write('p wcnf 2 1\n1 2 0\n')
+        with self.assertRaises(ValueError):
+            DimacsReader(self.path('formula.cnf')).transform()
+
+
+if __name__ == '__main__':
+    unittest.main()
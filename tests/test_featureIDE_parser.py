@@ -81,6 +81,28 @@ class TestFeatureIDEParser(unittest.TestCase):
     #             self.assertEqual(len(core_features), self.models[fm_input][3])
 
 
+class TestFeatureIDEStreamingParser(unittest.TestCase):
+
+    def setUp(self):
+        self.input_folder = 'input_fms/FeatureIDE_models/'
+        self.models = ['pizzas', 'jHipster', 'WeaFQAs']
+
+    def test_same_model_as_dom_parser(self):
+        for fm_input in self.models:
+            path = self.input_folder + fm_input + '.xml'
+            fm = FeatureIDEParser(path).transform()
+            fm_streaming = FeatureIDEParser(path, streaming=True).transform()
+            with self.subTest(fm=fm_input):
+                self.assertEqual(fm.root, fm_streaming.root)
+                self.assertEqual(fm.get_features(), fm_streaming.get_features())
+                self.assertEqual([str(r) for r in fm.get_relations()],
+                                 [str(r) for r in fm_streaming.get_relations()])
+                self.assertEqual([str(c.ast) for c in fm.get_constraints()],
+                                 [str(c.ast) for c in fm_streaming.get_constraints()])
+                self.assertEqual([f.is_abstract for f in fm.get_features()],
+                                 [f.is_abstract for f in fm_streaming.get_features()])
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=3)
 
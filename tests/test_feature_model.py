@@ -0,0 +1,98 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.fm_metamodel.models import FeatureModel, Feature, Relation
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+
+
+class TestFeatureModel(unittest.TestCase):
+
+    def setUp(self):
+        self.fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+
+    def tearDown(self):
+        pass
+
+    def test_get_feature_by_name(self):
+        for feature in self.fm.get_features():
+            self.assertIs(self.fm.get_feature_by_name(feature.name), feature)
+        with self.assertRaises(StopIteration):
+            self.fm.get_feature_by_name('Pineapple')
+
+    def test_parent_and_depth(self):
+        root = self.fm.root
+        self.assertIsNone(self.fm.get_parent(root))
+        self.assertEqual(self.fm.get_depth(root), 0)
+        salami = self.fm.get_feature_by_name('Salami')
+        self.assertEqual(self.fm.get_parent(salami).name, 'Topping')
+        self.assertEqual(self.fm.get_depth(salami), 2)
+
+    def test_invalidation_on_structural_change(self):
+        nof_features = len(self.fm.get_features())
+        nof_relations = len(self.fm.get_relations())
+        pineapple = Feature('Pineapple', [])
+        topping = self.fm.get_feature_by_name('Topping')
+        topping.get_relations()[0].add_child(pineapple)
+        self.assertEqual(len(self.fm.get_features()), nof_features + 1)
+        self.assertIs(self.fm.get_feature_by_name('Pineapple'), pineapple)
+        self.assertEqual(self.fm.get_depth(pineapple), 2)
+
+        extra = Feature('Extra', [])
+        self.fm.root.add_relation(Relation(self.fm.root, [extra], 0, 1))
+        self.assertEqual(len(self.fm.get_relations()), nof_relations + 1)
+        self.assertIs(self.fm.get_parent(extra), self.fm.root)
+
+    def test_index_of_other_trees_is_kept(self):
+        other = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        nof_features = len(other.get_features())
+        self.fm.root.add_relation(Relation(self.fm.root, [Feature('Extra', [])], 0, 1))
+        # Direct changes are only seen after invalidate(), so the index of other is not rebuilt
+        toppings = other.get_feature_by_name('Topping').get_relations()[0].children
+        nof_toppings = len(toppings)
+        toppings.clear()
+        self.assertEqual(len(other.get_features()), nof_features)
+        other.invalidate()
+        self.assertEqual(len(other.get_features()), nof_features - nof_toppings)
+        # Models with the same root share the changes of the tree
+        same_tree = FeatureModel(self.fm.root, [])
+        self.assertEqual(len(same_tree.get_features()), len(self.fm.get_features()))
+        self.fm.get_feature_by_name('Topping').get_relations()[0].add_child(Feature('Pineapple', []))
+        self.assertIs(same_tree.get_feature_by_name('Pineapple'), self.fm.get_feature_by_name('Pineapple'))
+
+    def test_index_with_subtree_models(self):
+        root, feature_a, feature_x = Feature('R', []), Feature('A', []), Feature('X', [])
+        root.add_relation(Relation(root, [feature_a], 0, 1))
+        root.add_relation(Relation(root, [Feature('B', [])], 0, 1))
+        feature_a.add_relation(Relation(feature_a, [feature_x], 0, 1))
+        full_model = FeatureModel(root, [])
+        self.assertEqual([f.name for f in full_model.get_features()], ['R', 'A', 'X', 'B'])
+        subtree_model = FeatureModel(feature_a, [])
+        self.assertEqual([f.name for f in subtree_model.get_features()], ['A', 'X'])
+        # The changes under the subtree outdate the indexes of both models
+        feature_a.add_relation(Relation(feature_a, [Feature('C', [])], 0, 1))
+        self.assertEqual([f.name for f in full_model.get_features()], ['R', 'A', 'X', 'C', 'B'])
+        self.assertEqual([f.name for f in subtree_model.get_features()], ['A', 'X', 'C'])
+        # Also through the relations whose parent is not set
+        relation = Relation(None, [], 0, 1)
+        feature_x.add_relation(relation)
+        self.assertEqual(len(full_model.get_features()), 5)
+        relation.add_child(Feature('Y', []))
+        self.assertIs(full_model.get_parent(full_model.get_feature_by_name('Y')), feature_x)
+        self.assertEqual([f.name for f in subtree_model.get_features()], ['A', 'X', 'Y', 'C'])
+
+    def test_cached_lists_are_copies(self):
+        features = self.fm.get_features()
+        features.clear()
+        self.assertEqual(len(self.fm.get_features()), 12)
+
+    def test_empty_model(self):
+        fm = FeatureModel(Feature('', []))
+        self.assertEqual(fm.get_relations(), [])
+        self.assertEqual(len(fm.get_features()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=3)
@@ -0,0 +1,73 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.fm_metamodel.models import Feature, FeatureModel, FMConfiguration, Relation
+from famapy.metamodels.fm_metamodel.transformations import FeatureIDEParser
+from famapy.metamodels.fm_metamodel.utils import FMGodelization
+from famapy.metamodels.bdd_metamodel.operations import BDDProducts
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+
+
+class TestFMGodelization(unittest.TestCase):
+
+    def setUp(self):
+        self.feature_model = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+
+    def products(self, bdd_model):
+        return {frozenset(f for f, selected in p.elements.items() if selected)
+                for p in BDDProducts().execute(bdd_model).get_result()}
+
+    def assert_bijection(self, godelization, products):
+        n = godelization.get_number_of_configurations()
+        self.assertEqual(n, len(products))
+        configurations = [godelization.degodelization(i) for i in range(n)]
+        names = {frozenset(f.name for f in c.get_selected_features()) for c in configurations}
+        self.assertEqual(names, products)
+        for i, configuration in enumerate(configurations):
+            self.assertEqual(godelization.godelization(configuration), i)
+        with self.assertRaises(ValueError):
+            godelization.degodelization(n)
+
+    def test_tree(self):
+        tree = FeatureModel(self.feature_model.root, [])
+        self.assert_bijection(FMGodelization(tree), self.products(FmToBDD(tree).transform()))
+
+    def test_bdd(self):
+        bdd_model = FmToBDD(self.feature_model).transform()
+        self.assert_bijection(FMGodelization(self.feature_model, bdd_model), self.products(bdd_model))
+
+    def test_invalid_configuration(self):
+        godelization = FMGodelization(FeatureModel(self.feature_model.root, []))
+        configuration = godelization.degodelization(0)
+        del configuration.elements[self.feature_model.root]
+        with self.assertRaises(ValueError):
+            godelization.godelization(configuration)
+
+    def test_unknown_feature(self):
+        bdd_model = FmToBDD(self.feature_model).transform()
+        for godelization in (FMGodelization(FeatureModel(self.feature_model.root, [])),
+                             FMGodelization(self.feature_model, bdd_model)):
+            configuration = godelization.degodelization(0)
+            configuration.elements[Feature('Pineapple', [])] = True
+            with self.assertRaisesRegex(ValueError, 'Pineapple'):
+                godelization.godelization(configuration)
+
+    def test_deep_tree(self):
+        # A chain of optional features deeper than the recursion limit
+        depth = 2 * sys.getrecursionlimit()
+        features = [Feature(f'F{i}', []) for i in range(depth)]
+        for parent, child in zip(features, features[1:]):
+            parent.add_relation(Relation(parent, [child], 0, 1))
+        godelization = FMGodelization(FeatureModel(features[0], []))
+        self.assertEqual(godelization.get_number_of_configurations(), depth)
+        configuration = godelization.degodelization(depth - 1)
+        self.assertEqual(len(configuration.get_selected_features()), depth)
+        self.assertEqual(godelization.godelization(configuration), depth - 1)
+        self.assertEqual(godelization.godelization(FMConfiguration({f: True for f in features[:10]})), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
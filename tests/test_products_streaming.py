@@ -0,0 +1,81 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models import Configuration
+from famapy.metamodels.bdd_metamodel.operations.bdd_products import BDDProducts
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.operations.glucose3_filter import Glucose3Filter
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products import Glucose3Products
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+from famapy.metamodels.pysat_metamodel.utils.aafms_helper import AAFMsHelper
+
+
+class TestProductsStreaming(unittest.TestCase):
+
+    # The enumeration order depends on the state of the solver, so products are compared as sets
+
+    def setUp(self):
+        # pizzas has a cross-tree constraint: CheesyCrust requires Big
+        self.fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        self.sat_model = FmToPysat(self.fm).transform()
+
+    def tearDown(self):
+        self.sat_model.delete_solvers()
+
+    def test_glucose3_products(self):
+        products = Glucose3Products().execute(self.sat_model).get_result()
+        products = {frozenset(product) for product in products}
+        self.assertEqual(len(products), 42)
+        self.assertTrue(all('Big' in product for product in products if 'CheesyCrust' in product))
+        streamed = {frozenset(p) for p in Glucose3Products().iter_products(self.sat_model)}
+        self.assertEqual(streamed, products)
+        first = list(Glucose3Products().iter_products(self.sat_model, limit=5))
+        self.assertEqual(len(first), 5)
+        self.assertTrue({frozenset(product) for product in first} <= products)
+        batches = list(Glucose3Products().iter_products(self.sat_model, batch_size=10))
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 10, 10, 2])
+        self.assertEqual({frozenset(p) for batch in batches for p in batch}, products)
+
+    def test_early_termination_releases_the_solver(self):
+        with self.sat_model.solver() as session:
+            pass
+        products = Glucose3Products().iter_products(self.sat_model)
+        next(products)
+        products.close()
+        # The session is reused, and the products blocked by the enumeration are found again
+        with self.sat_model.solver() as reused:
+            self.assertIs(reused, session)
+        products = {frozenset(p) for p in Glucose3Products().iter_products(self.sat_model)}
+        self.assertEqual(len(products), 42)
+
+    def test_glucose3_filter(self):
+        operation = Glucose3Filter()
+        operation.set_configuration(Configuration({self.fm.get_feature_by_name('Big'): True}))
+        products = list(operation.iter_filter(self.sat_model))
+        self.assertTrue(all('Big' in product for product in products))
+        batches = list(operation.iter_filter(self.sat_model, limit=2, batch_size=3))
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 2)
+        self.assertEqual(len(operation.execute(self.sat_model).get_result()), len(products))
+
+    def test_bdd_products(self):
+        bdd_model = FmToBDD(self.fm).transform()
+        operation = BDDProducts()
+        products = operation.execute(bdd_model).get_result()
+        self.assertEqual(list(operation.iter_products(bdd_model)), products)
+        self.assertEqual(list(operation.iter_products(bdd_model, limit=3)), products[:3])
+
+    def test_aafms_helper(self):
+        helper = AAFMsHelper(self.fm, self.sat_model)
+        configurations = set(helper.get_configurations())
+        first = list(helper.iter_configurations(limit=4))
+        self.assertEqual(len(first), 4)
+        self.assertTrue(set(first) <= configurations)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.fm_metamodel.models import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.operations.glucose3_backbone import Glucose3Backbone
+from famapy.metamodels.pysat_metamodel.operations.glucose3_core_features import Glucose3CoreFeatures
+from famapy.metamodels.pysat_metamodel.operations.glucose3_dead_features import Glucose3DeadFeatures
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+
+class TestGlucose3Backbone(unittest.TestCase):
+
+    def setUp(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        self.fm = FeatureModel(fm.root, [])
+        self.model = FmToPysat(self.fm).transform()
+
+    def tearDown(self):
+        self.model.delete_solvers()
+
+    def one_call_per_variable(self):
+        core_features, dead_features = [], []
+        with self.model.solver() as solver:
+            satisfiable = solver.solve()
+            for name, variable in self.model.variables.items():
+                if satisfiable and not solver.solve(assumptions=[-variable]):
+                    core_features.append(name)
+                if not solver.solve(assumptions=[variable]):
+                    dead_features.append(name)
+        return core_features, dead_features
+
+    def check_operations(self):
+        core_features, dead_features = self.one_call_per_variable()
+        self.assertEqual(Glucose3CoreFeatures().execute(self.model).get_result(), core_features)
+        self.assertEqual(Glucose3DeadFeatures().execute(self.model).get_result(), dead_features)
+
+    def test_core_and_dead_features(self):
+        self.check_operations()
+        self.assertEqual(set(Glucose3CoreFeatures().execute(self.model).get_result()),
+                         {'Pizza', 'Topping', 'Size', 'Dough'})
+
+    def test_backbone_is_updated_with_new_clauses(self):
+        self.check_operations()
+        salami = self.model.variables['Salami']
+        big = self.model.variables['Big']
+        self.model.add_clause([-salami])
+        self.model.add_clause([-self.model.variables['Normal'], big])
+        self.check_operations()
+        self.assertIn('Big', Glucose3CoreFeatures().execute(self.model).get_result())
+        self.assertIn('Salami', Glucose3DeadFeatures().execute(self.model).get_result())
+        self.model.add_clause([-big])
+        self.check_operations()
+        self.assertFalse(Glucose3Backbone().execute(self.model).is_satisfiable())
+
+    def test_hints(self):
+        operation = Glucose3Backbone()
+        operation.set_feature_model(self.fm)
+        operation.set_unit_propagation(False)
+        backbone = operation.execute(self.model).get_backbone()
+        self.model.set_cached(Glucose3Backbone.CACHE_KEY, None)
+        self.assertEqual(Glucose3Backbone().execute(self.model).get_backbone(), backbone)
+
+    def test_phases_are_reset(self):
+        # The backbone prefers the negated candidates, so the models found afterwards select
+        # many features unless the pooled session is restored to the default (negative) phases
+        def nof_selected_features(model):
+            with model.solver() as solver:
+                solver.solve()
+                return len([literal for literal in solver.get_model() if literal > 0])
+
+        fresh_model = FmToPysat(self.fm).transform()
+        Glucose3Backbone().execute(self.model)
+        self.assertEqual(nof_selected_features(self.model), nof_selected_features(fresh_model))
+        fresh_model.delete_solvers()
+
+
+if __name__ == '__main__':
+    unittest.main()
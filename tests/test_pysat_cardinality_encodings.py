@@ -0,0 +1,82 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from pysat.card import EncType
+
+from famapy.metamodels.fm_metamodel.models.feature_model import Feature, FeatureModel, Relation
+from famapy.metamodels.bdd_metamodel.operations import BDDProductsNumber
+from famapy.metamodels.bdd_metamodel.transformations.fm_to_bdd import FmToBDD
+from famapy.metamodels.bdd_metamodel.transformations.pysat_to_bdd import PySATToBDD
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products import Glucose3Products
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid import Glucose3Valid
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+
+def group_model(nof_alternatives: int, nof_children: int, card_min: int, card_max: int) -> FeatureModel:
+    """Root with a mandatory alternative group and an optional [card_min..card_max] group."""
+    root = Feature('Root')
+    alternative = Feature('Alternative', parent=root)
+    group = Feature('Group', parent=root)
+    root.add_relation(Relation(root, [alternative], 1, 1))
+    root.add_relation(Relation(root, [group], 0, 1))
+    alternative.add_relation(Relation(alternative, [Feature(f'A{i}', parent=alternative)
+                                                    for i in range(nof_alternatives)], 1, 1))
+    group.add_relation(Relation(group, [Feature(f'G{i}', parent=group)
+                                        for i in range(nof_children)], card_min, card_max))
+    return FeatureModel(root)
+
+
+class TestCardinalityEncodings(unittest.TestCase):
+    """The cardinality encodings give the same products as the pairwise and combinations encodings."""
+
+    ENCODINGS = [EncType.seqcounter, EncType.totalizer, EncType.mtotalizer,
+                 EncType.kmtotalizer, EncType.ladder, EncType.pairwise]
+    CARDINALITIES = [(2, 4), (0, 3), (3, 6), (0, 6), (5, 5)]
+
+    def products(self, feature_model, **options):
+        pysat_model = FmToPysat(feature_model, **options).transform()
+        products = sorted(sorted(product) for product in Glucose3Products().execute(pysat_model).get_result())
+        nof_bdd_products = BDDProductsNumber().execute(FmToBDD(feature_model, **options).transform()).get_result()
+        nof_pysat_bdd_products = BDDProductsNumber().execute(PySATToBDD(pysat_model).transform()).get_result()
+        return products, nof_bdd_products, nof_pysat_bdd_products
+
+    def test_same_products(self):
+        for card_min, card_max in self.CARDINALITIES:
+            feature_model = group_model(5, 6, card_min, card_max)
+            expected, nof_bdd_products, _ = self.products(feature_model, cardinality_threshold=None)
+            self.assertEqual(nof_bdd_products, len(expected))
+            for encoding in self.ENCODINGS:
+                with self.subTest(cardinality=(card_min, card_max), encoding=encoding):
+                    products, nof_bdd_products, nof_pysat_bdd_products = self.products(
+                        feature_model, cardinality_threshold=3, cardinality_encoding=encoding)
+                    self.assertEqual(products, expected)
+                    self.assertEqual(nof_bdd_products, len(expected))
+                    self.assertEqual(nof_pysat_bdd_products, len(expected))
+
+    def test_auxiliary_variables(self):
+        feature_model = group_model(5, 6, 2, 4)
+        self.assertEqual(FmToPysat(feature_model, cardinality_threshold=None).transform().auxiliary_variables, set())
+        pysat_model = FmToPysat(feature_model, cardinality_threshold=3).transform()
+        self.assertTrue(pysat_model.auxiliary_variables)
+        self.assertTrue(all(var > max(pysat_model.features) for var in pysat_model.auxiliary_variables))
+        bdd_model = FmToBDD(feature_model, cardinality_threshold=3).transform()
+        self.assertEqual(sorted(bdd_model.variables), sorted(pysat_model.variables))
+        self.assertEqual(len(bdd_model.bdd.vars), len(bdd_model.variables))
+
+    def test_large_groups(self):
+        nof_children = 300
+        feature_model = group_model(nof_children, nof_children, 2, 5)
+        pysat_model = FmToPysat(feature_model).transform()
+        # Linear in the number of children (x the bound of the counter)
+        self.assertLess(len(pysat_model.r_cnf.clauses), 40 * nof_children)
+        self.assertTrue(Glucose3Valid().execute(pysat_model).get_result())
+        bdd_model = FmToBDD(feature_model).transform()
+        # Alternatives x (group deselected, since it is selected iff 2..5 children are)
+        self.assertEqual(BDDProductsNumber().execute(bdd_model).get_result(), nof_children * 2 ** nof_children)
+
+
+if __name__ == '__main__':
+    unittest.main()
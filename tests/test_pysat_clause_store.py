@@ -0,0 +1,107 @@
+import unittest
+import os, sys
+
+import numpy as np
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.pysat_metamodel.models.clause_store import ClauseStore
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products_number import Glucose3ProductsNumber
+
+
+class TestClauseStore(unittest.TestCase):
+
+    def test_append_and_extend(self):
+        store = ClauseStore([[1, -2]])
+        store.append([3])
+        store.extend([[-1, 2, -4], []])
+        # Enough clauses to grow the buffers
+        store.extend([[var, -var - 1] for var in range(1, 3000)])
+        self.assertEqual(len(store), 3003)
+        self.assertEqual(store.clauses[:4], [[1, -2], [3], [-1, 2, -4], []])
+        self.assertEqual(store[-1], [2999, -3000])
+        self.assertEqual(store.nv, 3000)
+        self.assertEqual(store.literals.dtype, np.int32)
+        self.assertEqual(store.offsets[:5].tolist(), [0, 2, 3, 6, 6])
+
+    def test_slices_are_views(self):
+        store = ClauseStore([[1, 2], [-1], [2, 3, 4], [-4]])
+        view = store[1:3]
+        self.assertEqual(view.clauses, [[-1], [2, 3, 4]])
+        self.assertEqual(view.offsets.tolist(), [0, 1, 4])
+        self.assertTrue(np.shares_memory(view.literals, store.literals))
+        self.assertEqual(len(store[4:]), 0)
+        with self.assertRaises(ValueError):
+            view.append([1])
+
+    def test_from_arrays(self):
+        store = ClauseStore.from_arrays(np.array([1, -2, 3, -1]), np.array([2, 0, 2]))
+        self.assertEqual(store.clauses, [[1, -2], [], [3, -1]])
+        self.assertEqual(store.nv, 3)
+
+    def test_first_violated(self):
+        store = ClauseStore([[1, 2], [-1, 3], [-2, -3]])
+        assignments = np.array([[True, False, True],
+                                [True, False, False],
+                                [False, False, False],
+                                [True, True, True]])
+        self.assertEqual(store.first_violated(assignments).tolist(), [-1, 1, 0, 2])
+        ignored = np.array([True, False, False])
+        self.assertEqual(store.first_violated(assignments, ignored).tolist(), [-1, 1, -1, 2])
+        store.append([])
+        self.assertEqual(store.first_violated(assignments[:1]).tolist(), [3])
+        with self.assertRaises(ValueError):
+            store.first_violated(assignments[:, :2])
+
+    def test_first_violated_random(self):
+        rng = np.random.default_rng(0)
+        clauses = [[int(var) * rng.choice((-1, 1))
+                    for var in rng.choice(np.arange(1, 21), size=rng.integers(2, 5), replace=False)]
+                   for _ in range(12)]
+        store = ClauseStore(clauses)
+        assignments = rng.random((150, 20)) < 0.7  # several words of assignments
+        expected = [next((i for i, clause in enumerate(clauses)
+                          if not any(row[abs(literal) - 1] == (literal > 0) for literal in clause)), -1)
+                    for row in assignments]
+        self.assertEqual(store.first_violated(assignments).tolist(), expected)
+        self.assertIn(-1, expected)
+
+
+class TestPySATModelClauses(unittest.TestCase):
+
+    def setUp(self):
+        # A, optional B, optional C
+        self.model = PySATModel()
+        self.model.variables = {'A': 1, 'B': 2, 'C': 3}
+        self.model.features = {1: 'A', 2: 'B', 3: 'C'}
+        self.model.r_cnf.append([1])
+        self.model.r_cnf.append([-2, 1])
+        self.model.r_cnf.append([-3, 1])
+
+    def tearDown(self):
+        self.model.delete_solvers()
+
+    def test_combined_clauses_are_cached(self):
+        clauses = self.model.get_all_clauses()
+        self.assertIs(self.model.get_all_clauses(), clauses)
+        self.model.add_clause([-2, -3])
+        combined = self.model.get_all_clauses()
+        self.assertIsNot(combined, clauses)
+        self.assertEqual(combined.clauses, [[1], [-2, 1], [-3, 1], [-2, -3]])
+        self.assertEqual(Glucose3ProductsNumber().execute(self.model).get_result(), 3)
+
+    def test_identity_hash(self):
+        # The model is mutable, so it is hashed by identity
+        models = {self.model}
+        self.model.add_clause([-2, -3])
+        self.assertIn(self.model, models)
+        other = PySATModel()
+        other.r_cnf.extend(self.model.r_cnf)
+        other.ctc_cnf.extend(self.model.ctc_cnf)
+        self.assertNotIn(other, models)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.fm_metamodel.models import FeatureModel
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.operations.glucose3_error_analysis import Glucose3ErrorAnalysis
+from famapy.metamodels.pysat_metamodel.operations.glucose3_error_detection import Glucose3ErrorDetection
+from famapy.metamodels.pysat_metamodel.operations.glucose3_error_diagnosis import Glucose3ErrorDiagnosis
+from famapy.metamodels.pysat_metamodel.operations.glucose3_false_optional_features import \
+    Glucose3FalseOptionalFeatures
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+
+class TestGlucose3ErrorAnalysis(unittest.TestCase):
+
+    def setUp(self):
+        fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        self.fm = FeatureModel(fm.root, [])
+        self.model = FmToPysat(self.fm).transform()
+        self.var = self.model.variables
+        # Sicilian requires Salami, Neapolitan excludes Salami, Topping requires Salami
+        self.model.add_clause([-self.var['Sicilian'], self.var['Salami']])
+        self.model.add_clause([-self.var['Neapolitan'], -self.var['Salami']])
+        self.model.add_clause([-self.var['Topping'], self.var['Salami']])
+
+    def tearDown(self):
+        self.model.delete_solvers()
+
+    def test_report(self):
+        report = Glucose3ErrorAnalysis().execute(self.model).get_report()
+        self.assertTrue(report.satisfiable)
+        self.assertEqual(report.dead_features, [self.var['Neapolitan']])
+        self.assertIn(self.var['Salami'], report.core_features)
+        self.assertIn(self.var['Sicilian'], report.core_features)
+        self.assertEqual(set(report.false_optional_features),
+                         {self.var['Salami'], self.var['Sicilian']})
+        self.assertEqual(report.redundancies, ['Topping requires Salami'])
+
+    def test_operations_share_the_report(self):
+        report = Glucose3ErrorAnalysis().execute(self.model).get_report()
+        self.assertIsNotNone(self.model.get_cached(Glucose3ErrorAnalysis.CACHE_KEY))
+        # Each operation gets its own copy of the cached report
+        report.dead_features.clear()
+        self.assertEqual(Glucose3ErrorAnalysis().execute(self.model).get_report().dead_features,
+                         [self.var['Neapolitan']])
+        # The reports are cached per model, not shared by models with the same formula
+        same_formula = FmToPysat(self.fm).transform()
+        for clause in self.model.ctc_cnf.clauses:
+            same_formula.add_clause(clause)
+        self.assertIsNone(same_formula.get_cached(Glucose3ErrorAnalysis.CACHE_KEY))
+
+        self.assertEqual(set(Glucose3FalseOptionalFeatures().execute(self.model).get_result()),
+                         {'Salami', 'Sicilian'})
+        messages = Glucose3ErrorDetection().execute(self.model).get_result()
+        self.assertEqual(messages[0], "Dead features: ['Neapolitan']")
+        diagnosis = Glucose3ErrorDiagnosis().execute(self.model).get_result()
+        self.assertIn('For dead feature Neapolitan: Neapolitan excludes Salami', diagnosis)
+
+    def test_report_is_updated_with_new_clauses(self):
+        report = Glucose3ErrorAnalysis().execute(self.model).get_report()
+        self.model.add_clause([-self.var['Salami']])
+        new_report = Glucose3ErrorAnalysis().execute(self.model).get_report()
+        self.assertIsNot(new_report, report)
+        self.assertFalse(new_report.satisfiable)
+        self.assertEqual(Glucose3ErrorDetection().execute(self.model).get_result(),
+                         ['The model is void, so have not any product'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import os, sys
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.pysat_metamodel.models.pysat_model import PySATModel
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products_number import Glucose3ProductsNumber
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid import Glucose3Valid
+
+
+class TestSolverSession(unittest.TestCase):
+
+    def setUp(self):
+        # A, optional B, optional C
+        self.model = PySATModel()
+        self.model.variables = {'A': 1, 'B': 2, 'C': 3}
+        self.model.features = {1: 'A', 2: 'B', 3: 'C'}
+        self.model.r_cnf.append([1])
+        self.model.r_cnf.append([-2, 1])
+        self.model.r_cnf.append([-3, 1])
+
+    def tearDown(self):
+        self.model.delete_solvers()
+
+    def test_sessions_are_reused(self):
+        with self.model.solver() as session:
+            first = session
+        with self.model.solver() as session:
+            self.assertIs(session, first)
+            with self.model.solver() as other:  # the session is in use
+                self.assertIsNot(other, session)
+
+    def test_enumeration_does_not_change_the_formula(self):
+        self.assertEqual(Glucose3ProductsNumber().execute(self.model).get_result(), 4)
+        self.assertEqual(Glucose3ProductsNumber().execute(self.model).get_result(), 4)
+        with self.model.solver() as session:
+            self.assertTrue(session.solve())
+            models = list(session.enum_models(assumptions=[2]))
+            self.assertEqual(len(models), 2)
+            self.assertTrue(all(len(model) == 3 for model in models))
+
+    def test_clauses_added_after_loading(self):
+        self.assertEqual(Glucose3ProductsNumber().execute(self.model).get_result(), 4)
+        self.model.add_clause([-2, -3])
+        self.assertEqual(Glucose3ProductsNumber().execute(self.model).get_result(), 3)
+        self.model.add_clause([2])
+        self.model.add_clause([3])
+        self.assertFalse(Glucose3Valid().execute(self.model).get_result())
+        with self.model.solver(ctcs=False) as session:
+            self.assertTrue(session.solve(assumptions=[2, 3]))
+
+    def test_clauses_with_new_variables(self):
+        self.assertEqual(Glucose3ProductsNumber().execute(self.model).get_result(), 4)
+        # The variable 4 was used by the session to guard the enumeration
+        self.model.variables['D'] = 4
+        self.model.features[4] = 'D'
+        self.model.r_cnf.append([-4, 1])
+        self.model.r_cnf.append([4])
+        self.assertEqual(Glucose3ProductsNumber().execute(self.model).get_result(), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
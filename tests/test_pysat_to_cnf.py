@@ -0,0 +1,61 @@
+import unittest
+import os, sys
+import tempfile
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.metamodels.cnf_metamodel.models.cnf_model import CNFNotation
+from famapy.metamodels.cnf_metamodel.transformations.cnf_writer import CNFWriter
+from famapy.metamodels.cnf_metamodel.transformations.pysat_to_cnf import PysatToCNF
+from famapy.metamodels.fm_metamodel.models.feature_model import Feature, FeatureModel, Relation
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products_number import Glucose3ProductsNumber
+from famapy.metamodels.pysat_metamodel.transformations.cnf_to_pysat import CNFReader
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+
+
+def alternative_model(nof_children: int) -> FeatureModel:
+    root = Feature('Root')
+    root.add_relation(Relation(root, [Feature(f'A{i}', parent=root) for i in range(nof_children)], 1, 1))
+    return FeatureModel(root)
+
+
+class TestPysatToCNF(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def nof_products(self, pysat_model) -> int:
+        """Number of products of the CNFModel of the PySATModel, read back with CNFReader."""
+        path = os.path.join(self.directory.name, 'formula.txt')
+        writer = CNFWriter(path, PysatToCNF(pysat_model).transform())
+        writer.set_notation(CNFNotation.SHORT)
+        writer.transform()
+        return Glucose3ProductsNumber().execute(CNFReader(path).transform()).get_result()
+
+    def test_cardinality_encodings(self):
+        feature_model = alternative_model(20)
+        encoded_model = FmToPysat(feature_model).transform()
+        self.assertTrue(encoded_model.auxiliary_variables)
+        with self.assertRaisesRegex(ValueError, 'cardinality_threshold=None'):
+            PysatToCNF(encoded_model).transform()
+        self.assertEqual(self.nof_products(FmToPysat(feature_model, cardinality_threshold=None).transform()), 20)
+
+    def test_tseitin_transformation(self):
+        # jHipster has cross-tree constraints that are not clauses
+        feature_model = FeatureIDEParser('input_fms/FeatureIDE_models/jHipster.xml').transform()
+        encoded_model = FmToPysat(feature_model, cardinality_threshold=None).transform()
+        self.assertTrue(encoded_model.auxiliary_variables)
+        with self.assertRaisesRegex(ValueError, 'tseitin=False'):
+            PysatToCNF(encoded_model).transform()
+        pysat_model = FmToPysat(feature_model, cardinality_threshold=None, tseitin=False).transform()
+        self.assertEqual(pysat_model.auxiliary_variables, set())
+        self.assertEqual(self.nof_products(pysat_model), 26256)
+
+
+if __name__ == '__main__':
+    unittest.main()
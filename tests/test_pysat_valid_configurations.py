@@ -0,0 +1,94 @@
+import unittest
+import os, sys
+
+import numpy as np
+
+p = os.path.abspath('.')
+sys.path.insert(1, p)
+
+from famapy.core.models import Configuration
+from famapy.metamodels.fm_metamodel.models.fm_configuration import FMConfiguration
+from famapy.metamodels.fm_metamodel.transformations.featureide_parser import FeatureIDEParser
+from famapy.metamodels.pysat_metamodel.operations.glucose3_products import Glucose3Products
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid_configuration import Glucose3ValidConfiguration
+from famapy.metamodels.pysat_metamodel.operations.glucose3_valid_configurations import Glucose3ValidConfigurations
+from famapy.metamodels.pysat_metamodel.transformations.fm_to_pysat import FmToPysat
+from famapy.metamodels.pysat_metamodel.utils.aafms_helper import AAFMsHelper
+
+
+class TestValidConfigurations(unittest.TestCase):
+
+    def setUp(self):
+        self.fm = FeatureIDEParser('input_fms/FeatureIDE_models/pizzas.xml').transform()
+        self.rng = np.random.default_rng(0)
+
+    def sat_model(self, **options):
+        model = FmToPysat(self.fm, **options).transform()
+        self.addCleanup(model.delete_solvers)
+        return model
+
+    def configurations(self, model, assignments) -> list[Configuration]:
+        return [Configuration({self.fm.get_feature_by_name(name): bool(row[var - 1])
+                               for var, name in model.features.items()})
+                for row in assignments]
+
+    def assignments(self, model) -> np.ndarray:
+        """The products of the model and random assignments."""
+        features = sorted(model.features)
+        products = [set(product) for product in Glucose3Products().execute(model).get_result()]
+        assignments = np.zeros((len(products), max(features)), dtype=bool)
+        for row, product in enumerate(products):
+            assignments[row, [var - 1 for var in features if model.features[var] in product]] = True
+        random = self.rng.random((200, max(features))) < 0.5
+        return np.vstack([assignments, random])
+
+    def expected(self, model, configurations) -> list[bool]:
+        result = []
+        for configuration in configurations:
+            operation = Glucose3ValidConfiguration()
+            operation.set_configuration(configuration)
+            result.append(operation.execute(model).get_result())
+        return result
+
+    def test_complete_configurations(self):
+        for options in ({}, {'tseitin': False}, {'cardinality_threshold': 0}):
+            with self.subTest(options=options):
+                model = self.sat_model(**options)
+                assignments = self.assignments(model)
+                operation = Glucose3ValidConfigurations()
+                operation.set_assignments(assignments)
+                result = operation.execute(model).get_result()
+                expected = self.expected(model, self.configurations(model, assignments))
+                self.assertEqual(result.tolist(), expected)
+                self.assertTrue(any(expected) and not all(expected))
+                # The first violated clause is falsified by the configuration
+                clauses = model.get_all_clauses()
+                for row, index in enumerate(operation.get_first_violated()):
+                    if index >= 0:
+                        self.assertFalse(result[row])
+                        self.assertFalse(any(assignments[row, abs(literal) - 1] == (literal > 0)
+                                             for literal in clauses[index]))
+
+    def test_partial_configurations(self):
+        model = self.sat_model()
+        configurations = self.configurations(model, self.assignments(model)[:100])
+        # Remove some features from half of the configurations
+        for configuration in configurations[::2]:
+            for feature in list(configuration.elements)[::3]:
+                del configuration.elements[feature]
+        operation = Glucose3ValidConfigurations()
+        operation.set_configurations(configurations)
+        self.assertEqual(operation.execute(model).get_result().tolist(), self.expected(model, configurations))
+
+    def test_aafms_helper(self):
+        model = self.sat_model()
+        helper = AAFMsHelper(self.fm, model)
+        configurations = [FMConfiguration({feature: True for feature, selected in configuration.elements.items()
+                                           if selected})
+                          for configuration in self.configurations(model, self.assignments(model))]
+        self.assertEqual(helper.are_valid_configurations(configurations),
+                         [helper.is_valid_configuration(configuration) for configuration in configurations])
+
+
+if __name__ == '__main__':
+    unittest.main()